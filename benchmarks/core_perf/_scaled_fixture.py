@@ -0,0 +1,49 @@
+"""Scale ``tests/fixtures/ebird_integration_fixture.csv`` up for core benchmarks (not a test fixture).
+
+Each copy gets unique ``Submission ID`` values and its dates shifted by whole weeks, so checklist
+counts and date spans grow with the scale factor while locations / species stay realistic repeats.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+FIXTURE_CSV = ROOT / "tests" / "fixtures" / "ebird_integration_fixture.csv"
+
+
+def scaled_raw_frame(target_rows: int) -> pd.DataFrame:
+    """Return a raw (unparsed) export frame with at least *target_rows* rows."""
+    base = pd.read_csv(FIXTURE_CSV, encoding="utf-8")
+    copies = max(1, -(-int(target_rows) // len(base)))
+    base_dates = pd.to_datetime(base["Date"], errors="coerce")
+    parts = []
+    for i in range(copies):
+        part = base.copy()
+        part["Submission ID"] = part["Submission ID"].astype(str) + f"_{i}"
+        part["Date"] = (base_dates + pd.Timedelta(weeks=i)).dt.strftime("%Y-%m-%d")
+        parts.append(part)
+    return pd.concat(parts, ignore_index=True)
+
+
+def write_scaled_csv(target_rows: int, path: str | Path) -> Path:
+    """Write :func:`scaled_raw_frame` to *path* and return it."""
+    out = Path(path)
+    scaled_raw_frame(target_rows).to_csv(out, index=False)
+    return out
+
+
+def load_scaled_dataset(target_rows: int) -> pd.DataFrame:
+    """:func:`scaled_raw_frame` round-tripped through a CSV and ``load_dataset`` (realistic dtypes)."""
+    import tempfile
+
+    from explorer.core.data_loader import load_dataset
+
+    with tempfile.TemporaryDirectory() as tmp:
+        return load_dataset(str(write_scaled_csv(target_rows, Path(tmp) / "MyEBirdData.csv")))
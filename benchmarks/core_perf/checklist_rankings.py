@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Time the checklist-level rankings (``time`` / ``dist`` / ``species`` / ``individuals``).
+
+Compares the previous per-checklist ``groupby().apply`` (one ``countable_base_series`` /
+``count_series`` call per checklist) with :func:`explorer.core.stats.checklist_facts` plus the four
+``rankings_by_value`` calls. Both must return identical rows; the script asserts that before timing.
+
+Example::
+
+    python benchmarks/core_perf/checklist_rankings.py --rows 50000 200000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+
+from _scaled_fixture import load_scaled_dataset
+from explorer.core.derived_columns import count_series, countable_base_series
+from explorer.core.stats import checklist_facts, rankings_by_value
+
+DUR_COL = "Duration (Min)"
+DIST_COL = "Distance Traveled (km)"
+_FMT = {
+    "_dur": lambda x: f"{int(round(x))} min",
+    "_dist": lambda x: f"{x:,.2f} km",
+    "_nsp": lambda x: f"{int(x):,}",
+    "_nind": lambda x: f"{int(x):,}",
+}
+
+
+def _rank(frame: pd.DataFrame, col: str, limit: int):
+    return rankings_by_value(frame, col, "Date", "Location", "Location ID", "Submission ID", _FMT[col], limit)
+
+
+def legacy_checklist_rankings(df: pd.DataFrame, cl: pd.DataFrame, limit: int) -> dict:
+    """Pre-vectorisation reference (the former body of ``compute_rankings``)."""
+    cl_with_dur = cl.dropna(subset=[DUR_COL]).copy()
+    cl_with_dur["_dur"] = pd.to_numeric(cl_with_dur[DUR_COL], errors="coerce").fillna(0)
+    cl_with_dist = cl.dropna(subset=[DIST_COL]).copy()
+    cl_with_dist["_dist"] = pd.to_numeric(cl_with_dist[DIST_COL], errors="coerce").fillna(0)
+    species_per_cl = df.groupby("Submission ID", group_keys=False).apply(
+        lambda g: countable_base_series(g).dropna().nunique(),
+        include_groups=False,
+    ).reset_index(name="_nsp")
+    ind_per_cl = df.groupby("Submission ID", group_keys=False).apply(
+        lambda g: count_series(g).sum(),
+        include_groups=False,
+    ).reset_index(name="_nind")
+    return {
+        "time": _rank(cl_with_dur, "_dur", limit),
+        "dist": _rank(cl_with_dist, "_dist", limit),
+        "species": _rank(cl.merge(species_per_cl, on="Submission ID", how="inner"), "_nsp", limit),
+        "individuals": _rank(cl.merge(ind_per_cl, on="Submission ID", how="inner"), "_nind", limit),
+    }
+
+
+def current_checklist_rankings(df: pd.DataFrame, cl: pd.DataFrame, limit: int) -> dict:
+    facts = checklist_facts(df, cl, DUR_COL, DIST_COL)
+    return {key: _rank(facts, col, limit) for key, col in
+            (("time", "_dur"), ("dist", "_dist"), ("species", "_nsp"), ("individuals", "_nind"))}
+
+
+def _best_of(fn, df, cl, limit, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(df, cl, limit)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, nargs="+", default=[50_000, 200_000, 1_000_000])
+    ap.add_argument("--limit", type=int, default=200)
+    ap.add_argument("--repeat", type=int, default=1, help="best-of N timings (default 1)")
+    args = ap.parse_args()
+
+    print(f"{'rows':>10}{'checklists':>12}{'legacy s':>12}{'current s':>12}{'speedup':>10}")
+    for n in args.rows:
+        df = load_scaled_dataset(n)
+        cl = df.drop_duplicates(subset=["Submission ID"]).copy()
+        assert legacy_checklist_rankings(df, cl, args.limit) == current_checklist_rankings(df, cl, args.limit)
+        legacy = _best_of(legacy_checklist_rankings, df, cl, args.limit, args.repeat)
+        current = _best_of(current_checklist_rankings, df, cl, args.limit, args.repeat)
+        print(f"{len(df):>10}{len(cl):>12}{legacy:>12.2f}{current:>12.2f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
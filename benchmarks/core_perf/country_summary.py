@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Time ``country_summary_stats`` as the number of countries grows.
+
+Checklists of a scaled fixture are spread round-robin over ``--countries`` synthetic country keys
+(``_country_key``). Compares the previous per-country loop (boolean masks over ``cl`` / observations
+on every country, plus a per-year ``nunique`` for cumulative days) with the grouped
+``(country, year)`` pipeline in :func:`explorer.core.stats.country_summary_stats`. Both must return
+identical blocks; the script asserts that before timing.
+
+Example::
+
+    python benchmarks/core_perf/country_summary.py --rows 200000 --countries 1 10 40 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+
+from _scaled_fixture import load_scaled_dataset
+from explorer.core.derived_columns import count_series, countable_base_series, country_key_series, year_series
+from explorer.core.stats import country_summary_stats
+
+
+def legacy_country_summary_stats(df: pd.DataFrame, cl: pd.DataFrame) -> list:
+    """Per-country loop reference (the former body of ``country_summary_stats``)."""
+    cl = cl.dropna(subset=["Date"])
+    if cl.empty or df.empty:
+        return []
+
+    cl = cl.copy()
+    cl["_country_key"] = country_key_series(cl)
+    cl["_year"] = year_series(cl)
+
+    df_m = df.copy()
+    df_m["_base"] = countable_base_series(df_m)
+    df_m["_count"] = count_series(df_m)
+    key_map = cl.set_index("Submission ID")["_country_key"]
+    df_m["_country_key"] = df_m["Submission ID"].map(key_map).fillna("_UNKNOWN")
+    df_m["_year"] = year_series(df_m)
+
+    country_keys = sorted(cl["_country_key"].dropna().unique(), key=lambda k: str(k))
+    blocks = []  # order finalized alphabetically by display name in checklist_stats_display
+
+    obs = df_m.dropna(subset=["_base"])
+    if not obs.empty:
+        idx_world = obs.groupby("_base")["Date"].idxmin()
+        first_world = obs.loc[idx_world].copy()
+        first_world["_yr"] = first_world["Date"].dt.year
+    else:
+        first_world = pd.DataFrame()
+
+    for ck in country_keys:
+        cl_c = cl[cl["_country_key"] == ck]
+        years_sorted = sorted(cl_c["_year"].dropna().astype(int).unique())
+        if not years_sorted:
+            continue
+
+        if not first_world.empty:
+            fw = first_world[(first_world["_country_key"] == ck)]
+            lifers_world = fw.groupby("_yr").size()
+        else:
+            lifers_world = pd.Series(dtype=int)
+
+        obs_c = obs[obs["_country_key"] == ck]
+        if not obs_c.empty:
+            idx_c = obs_c.groupby(["_base", "_country_key"])["Date"].idxmin()
+            first_c = obs_c.loc[idx_c].copy()
+            first_c["_yr"] = first_c["Date"].dt.year
+            lifers_country = first_c.groupby("_yr").size()
+        else:
+            lifers_country = pd.Series(dtype=int)
+
+        rows = []
+        multi_year = len(years_sorted) > 1
+
+        obs_ck = obs[(obs["_country_key"] == ck)]
+
+        vals_w_i = [int(lifers_world.get(y, 0)) for y in years_sorted]
+        vals_w = [f"{v:,}" for v in vals_w_i]
+        if multi_year:
+            vals_w.append(f"{sum(vals_w_i):,}")
+        rows.append(("Lifers (world)", vals_w))
+
+        vals_c_i = [int(lifers_country.get(y, 0)) for y in years_sorted]
+        vals_c = [f"{v:,}" for v in vals_c_i]
+        if multi_year:
+            vals_c.append(f"{sum(vals_c_i):,}")
+        rows.append(("Lifers (country)", vals_c))
+
+        by_yr_sp = obs_ck.groupby("_year")["_base"].nunique()
+        vals_sp = [int(by_yr_sp.get(y, 0)) for y in years_sorted]
+        vals_sp_fmt = [f"{v:,}" for v in vals_sp]
+        if multi_year:
+            total_sp = int(obs_ck["_base"].nunique()) if not obs_ck.empty else 0
+            vals_sp_fmt.append(f"{total_sp:,}")
+        rows.append(("Total species", vals_sp_fmt))
+
+        by_yr_ind = df_m[df_m["_country_key"] == ck].groupby("_year")["_count"].sum()
+        vals_ind_i = [int(by_yr_ind.get(y, 0)) for y in years_sorted]
+        vals_ind = [f"{v:,}" for v in vals_ind_i]
+        if multi_year:
+            vals_ind.append(f"{sum(vals_ind_i):,}")
+        rows.append(("Total individuals", vals_ind))
+
+        by_yr_cl = cl_c.groupby("_year").size()
+        vals_cl_i = [int(by_yr_cl.get(y, 0)) for y in years_sorted]
+        vals_cl = [f"{v:,}" for v in vals_cl_i]
+        if multi_year:
+            vals_cl.append(f"{sum(vals_cl_i):,}")
+        rows.append(("Total checklists", vals_cl))
+
+        by_yr_dates = cl_c.groupby("_year")["Date"].apply(lambda s: s.dt.normalize().nunique())
+        vals_days_i = [int(by_yr_dates.get(y, 0)) for y in years_sorted]
+        vals_days = [f"{v:,}" for v in vals_days_i]
+        if multi_year:
+            vals_days.append(f"{sum(vals_days_i):,}")
+        rows.append(("Days with a checklist", vals_days))
+
+        dates_c = cl_c["Date"].dt.normalize()
+        cum = []
+        for y in years_sorted:
+            mask = cl_c["Date"].dt.year <= y
+            cum.append(int(dates_c[mask].nunique()))
+        vals_cum = [f"{v:,}" for v in cum]
+        if multi_year:
+            vals_cum.append(f"{cum[-1]:,}" if cum else "0")
+        rows.append(("Cumulative days eBird on", vals_cum))
+
+        blocks.append((ck, years_sorted, rows))
+
+    return blocks
+
+
+def with_countries(df: pd.DataFrame, n_countries: int) -> pd.DataFrame:
+    """Copy of *df* with checklists assigned round-robin to *n_countries* country keys."""
+    codes, _ = pd.factorize(df["Submission ID"])
+    out = df.copy()
+    out["_country_key"] = pd.Series([f"C{i:03d}" for i in range(n_countries)]).to_numpy()[codes % n_countries]
+    return out
+
+
+def _best_of(fn, df, cl, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(df, cl)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--countries", type=int, nargs="+", default=[1, 10, 40, 100])
+    ap.add_argument("--repeat", type=int, default=1, help="best-of N timings (default 1)")
+    args = ap.parse_args()
+
+    base = load_scaled_dataset(args.rows)
+    print(f"{'rows':>10}{'countries':>11}{'legacy s':>12}{'current s':>12}{'speedup':>10}")
+    for n in args.countries:
+        df = with_countries(base, n)
+        cl = df.drop_duplicates(subset=["Submission ID"]).copy()
+        assert legacy_country_summary_stats(df, cl) == country_summary_stats(df, cl)
+        legacy = _best_of(legacy_country_summary_stats, df, cl, args.repeat)
+        current = _best_of(country_summary_stats, df, cl, args.repeat)
+        print(f"{len(df):>10}{n:>11}{legacy:>12.2f}{current:>12.2f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
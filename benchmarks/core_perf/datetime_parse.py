@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Time ``add_datetime_column`` against the previous per-row ``format="mixed"`` parse.
+
+Synthetic Date/Time columns: dates over ~20 years, 12-hour eBird times, ~10% ``"00:00"`` (no time).
+Both implementations must produce identical frames; the script asserts that before timing.
+
+Example::
+
+    python benchmarks/core_perf/datetime_parse.py --rows 100000 1000000 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import _scaled_fixture  # noqa: F401  (puts the repo root on sys.path)
+
+from explorer.core.data_loader import add_datetime_column
+
+
+def legacy_add_datetime_column(df):
+    """Pre-vectorisation reference: one ``format="mixed"`` parse per combined string."""
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+    df["Time"] = df["Time"].fillna("00:00")
+    time_str = df["Time"].astype(str).str.strip().replace("00:00", "23:59").replace("", "23:59")
+    date_str = df["Date"].dt.strftime("%Y-%m-%d").fillna("")
+    df["datetime"] = pd.to_datetime(date_str + " " + time_str, format="mixed", errors="coerce")
+    df.loc[date_str == "", "datetime"] = pd.NaT
+    return df
+
+
+def synthetic_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    days = pd.Timestamp("2005-01-01") + pd.to_timedelta(rng.integers(0, 365 * 20, n), unit="D")
+    hours = rng.integers(1, 13, n)
+    minutes = rng.integers(0, 60, n)
+    meridiem = np.where(rng.random(n) < 0.5, "AM", "PM")
+    times = pd.Series(
+        [f"{h:02d}:{m:02d} {p}" for h, m, p in zip(hours, minutes, meridiem)], dtype="str"
+    )
+    times[rng.random(n) < 0.1] = "00:00"
+    return pd.DataFrame({"Date": days.strftime("%Y-%m-%d"), "Time": times})
+
+
+def _best_of(fn, df: pd.DataFrame, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        work = df.copy()
+        t0 = time.perf_counter()
+        fn(work)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    ap.add_argument("--repeat", type=int, default=1, help="best-of N timings (default 1)")
+    args = ap.parse_args()
+
+    print(f"{'rows':>10}{'legacy s':>12}{'current s':>12}{'speedup':>10}")
+    for n in args.rows:
+        df = synthetic_frame(n)
+        pd.testing.assert_frame_equal(
+            legacy_add_datetime_column(df.copy()), add_datetime_column(df.copy())
+        )
+        legacy = _best_of(legacy_add_datetime_column, df, args.repeat)
+        current = _best_of(add_datetime_column, df, args.repeat)
+        print(f"{n:>10}{legacy:>12.2f}{current:>12.2f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Time lifer-site aggregation as the life list grows.
+
+Observations of a scaled fixture are renamed round-robin onto ``--species`` synthetic species (every
+fourth one recorded as a three-part subspecies) spread over many locations, then
+:func:`explorer.core.lifer_last_seen_prep.prepare_lifer_last_seen` builds the lookup (untimed).
+Compares the previous per-key boolean scan of the lookup frame in ``aggregate_lifer_sites`` /
+``count_subspecies_lifer_taxa`` with the current single ``drop_duplicates`` pass. Both must return
+identical results; the script asserts that before timing.
+
+Example::
+
+    python benchmarks/core_perf/lifer_sites.py --rows 200000 --species 250 1000 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+from _scaled_fixture import load_scaled_dataset
+from explorer.core.derived_columns import DERIVED_COLUMNS
+from explorer.core.lifer_last_seen_prep import (
+    aggregate_lifer_sites,
+    count_subspecies_lifer_taxa,
+    prepare_lifer_last_seen,
+)
+from explorer.core.species_logic import base_species_for_lifer
+
+
+def legacy_aggregate_lifer_sites(lifer_lookup_df, true_lifer_locations, true_lifer_locations_taxon):
+    """Per-key boolean scan reference (the former body of ``aggregate_lifer_sites``)."""
+    by_loc = defaultdict(list)
+    entry_by_loc_sci = defaultdict(dict)
+    global_sci = set()
+
+    def _add(lid, sci, common, *, is_base, is_taxon):
+        if lid is None or pd.isna(lid) or not sci:
+            return
+        existing = entry_by_loc_sci[lid].get(sci)
+        if existing is None:
+            entry = {
+                "scientific_name": sci,
+                "common_name": common,
+                "is_base_lifer": bool(is_base),
+                "is_taxon_lifer": bool(is_taxon),
+            }
+            entry_by_loc_sci[lid][sci] = entry
+            by_loc[lid].append(entry)
+        else:
+            existing["is_base_lifer"] = existing["is_base_lifer"] or bool(is_base)
+            existing["is_taxon_lifer"] = existing["is_taxon_lifer"] or bool(is_taxon)
+        global_sci.add(sci)
+
+    for _base, lid in true_lifer_locations.items():
+        subset = lifer_lookup_df[lifer_lookup_df["_base"] == _base]
+        if subset.empty:
+            continue
+        r = subset.iloc[0]
+        com = "" if pd.isna(r.get("Common Name")) else str(r["Common Name"])
+        _add(lid, str(r["Scientific Name"]), com, is_base=True, is_taxon=False)
+
+    for _taxon, lid in true_lifer_locations_taxon.items():
+        subset = lifer_lookup_df[lifer_lookup_df["_taxon"] == _taxon]
+        if subset.empty:
+            continue
+        r = subset.iloc[0]
+        sci = str(r["Scientific Name"])
+        if len(sci.strip().split()) < 3:
+            continue
+        com = "" if pd.isna(r.get("Common Name")) else str(r["Common Name"])
+        _add(lid, sci, com, is_base=False, is_taxon=True)
+
+    sorted_by_loc = {
+        k: sorted(
+            v,
+            key=lambda e: (((e["common_name"] or e["scientific_name"]).lower()), e["scientific_name"].lower()),
+        )
+        for k, v in by_loc.items()
+    }
+    return sorted_by_loc, len(global_sci)
+
+
+def legacy_count_subspecies_lifer_taxa(lifer_lookup_df, true_lifer_locations_taxon):
+    """Per-taxon boolean scan reference (the former body of ``count_subspecies_lifer_taxa``)."""
+    n = 0
+    for taxon in true_lifer_locations_taxon:
+        subset = lifer_lookup_df[lifer_lookup_df["_taxon"] == taxon]
+        if subset.empty:
+            continue
+        if len(str(subset.iloc[0]["Scientific Name"]).strip().split()) >= 3:
+            n += 1
+    return n
+
+
+def with_species(df: pd.DataFrame, n_species: int) -> pd.DataFrame:
+    """Copy of *df* with rows renamed round-robin onto *n_species* synthetic species and locations."""
+    out = df.drop(columns=[c for c in DERIVED_COLUMNS if c in df.columns])
+    j = pd.Series(range(len(out)), index=out.index) % n_species
+    sci = "Avis species" + j.astype(str)
+    sci = sci.where(j % 4 != 0, sci + " minor")
+    out["Scientific Name"] = sci
+    out["Common Name"] = "Bird " + j.astype(str)
+    out["Location ID"] = "L" + (pd.Series(range(len(out)), index=out.index) % 997).astype(str)
+    return out
+
+
+def _run_legacy(prep):
+    return (
+        legacy_aggregate_lifer_sites(prep.lifer_lookup_df, prep.true_lifer_locations, prep.true_lifer_locations_taxon),
+        legacy_count_subspecies_lifer_taxa(prep.lifer_lookup_df, prep.true_lifer_locations_taxon),
+    )
+
+
+def _run_current(prep):
+    return (
+        aggregate_lifer_sites(prep.lifer_lookup_df, prep.true_lifer_locations, prep.true_lifer_locations_taxon),
+        count_subspecies_lifer_taxa(prep.lifer_lookup_df, prep.true_lifer_locations_taxon),
+    )
+
+
+def _best_of(fn, prep, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(prep)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=200_000)
+    ap.add_argument("--species", type=int, nargs="+", default=[250, 1000, 4000])
+    ap.add_argument("--repeat", type=int, default=1, help="best-of N timings (default 1)")
+    args = ap.parse_args()
+
+    base = load_scaled_dataset(args.rows)
+    print(f"{'rows':>10}{'species':>9}{'taxa':>7}{'legacy s':>12}{'current s':>12}{'speedup':>10}")
+    for n in args.species:
+        prep = prepare_lifer_last_seen(with_species(base, n), base_species_fn=base_species_for_lifer)
+        assert _run_legacy(prep) == _run_current(prep)
+        legacy = _best_of(_run_legacy, prep, args.repeat)
+        current = _best_of(_run_current, prep, args.repeat)
+        n_taxa = len(prep.true_lifer_locations_taxon)
+        print(f"{len(prep.lifer_lookup_df):>10}{n:>9}{n_taxa:>7}{legacy:>12.2f}{current:>12.3f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
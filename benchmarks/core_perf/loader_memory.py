@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Compare memory / load time of the default vs typed ``load_dataset`` on a scaled fixture.
+
+Example::
+
+    python benchmarks/core_perf/loader_memory.py --rows 400000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from _scaled_fixture import write_scaled_csv  # also puts the repo root on sys.path
+
+from explorer.core.data_loader import load_dataset
+
+
+def _mib(n_bytes: int) -> float:
+    return n_bytes / (1024 * 1024)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=200_000, help="approximate row count (default 200000)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = write_scaled_csv(args.rows, Path(tmp) / "MyEBirdData.csv")
+        print(f"rows≈{args.rows}  csv={_mib(csv_path.stat().st_size):.1f} MiB")
+        print(f"{'mode':<10}{'load s':>10}{'frame MiB':>12}")
+        for label, kwargs in (("default", {}), ("typed", {"typed": True})):
+            t0 = time.perf_counter()
+            df = load_dataset(str(csv_path), **kwargs)
+            elapsed = time.perf_counter() - t0
+            mem = int(df.memory_usage(deep=True).sum())
+            print(f"{label:<10}{elapsed:>10.2f}{_mib(mem):>12.1f}")
+            if label == "typed":
+                per_col = df.memory_usage(deep=True).sort_values(ascending=False).head(8)
+                print("\ntyped: largest columns (MiB)")
+                for col, n in per_col.items():
+                    print(f"  {col:<28}{_mib(int(n)):>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
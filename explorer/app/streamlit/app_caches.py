@@ -2,56 +2,130 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Callable
 from typing import Any
 
 import pandas as pd
 import streamlit as st
 
-from explorer.core.checklist_stats_compute import ChecklistStatsPayload, compute_checklist_stats_payload
+from explorer.core.checklist_stats_compute import (
+    STATS_SECTION_MODES,
+    LazyChecklistStatsPayload,
+    lazy_checklist_stats_payload,
+)
+from explorer.core.result_cache import ResultCache, frame_result_fingerprint
+from explorer.core.working_set import WorkingSetEngine
+from explorer.app.streamlit.app_constants import RESULT_CACHE_DIR
+from explorer.app.streamlit.map_working import working_set_engine_for
 from explorer.app.streamlit.streamlit_ui_constants import CHECKLIST_STATS_TOP_N_TABLE_LIMIT
 
+# ``serial`` (default), ``threads`` or ``processes``: how the independent checklist-stats sections
+# of the full-export payload run (see ``LazyChecklistStatsPayload.prefetch``). Results are
+# identical; only wall time differs.
+STATS_SECTIONS_ENV_KEY = "EXPLORER_STATS_SECTIONS"
+# Size cap (MiB) of the on-disk result cache under ``.explorer_cache/results``. Opt-in: unset or
+# ``0`` keeps it off, since entries derived from an export (uploads included) outlive the session.
+RESULT_CACHE_MB_ENV_KEY = "EXPLORER_RESULT_CACHE_MB"
 
-@st.cache_data(show_spinner=False)
+
+def _app_setting(key: str) -> str:
+    """Stripped value of *key* from Streamlit secrets, else the environment (``""`` when unset)."""
+    raw = ""
+    try:
+        if key in st.secrets:
+            raw = str(st.secrets[key]).strip()
+    except Exception:
+        raw = ""
+    if not raw:
+        raw = str(os.environ.get(key, "")).strip()
+    return raw
+
+
+def checklist_stats_sections_mode() -> str:
+    """Section execution mode from ``EXPLORER_STATS_SECTIONS`` (environment or Streamlit secrets)."""
+    raw = _app_setting(STATS_SECTIONS_ENV_KEY).lower()
+    return raw if raw in STATS_SECTION_MODES else "serial"
+
+
+def result_cache_max_bytes() -> int:
+    """Result cache size cap from ``EXPLORER_RESULT_CACHE_MB`` (default 0 = off; invalid → off)."""
+    raw = _app_setting(RESULT_CACHE_MB_ENV_KEY)
+    if not raw:
+        return 0
+    try:
+        return max(int(float(raw) * 1024 * 1024), 0)
+    except ValueError:
+        return 0
+
+
+@st.cache_resource(show_spinner=False)
+def app_result_cache() -> ResultCache:
+    """Process-wide on-disk result cache (see :mod:`explorer.core.result_cache`)."""
+    return ResultCache(RESULT_CACHE_DIR, max_bytes=result_cache_max_bytes())
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
 def cached_checklist_stats_payload(
     df: pd.DataFrame,
     taxonomy_locale: str,
-) -> ChecklistStatsPayload | None:
-    """Structured checklist stats for the Checklist Statistics tab (refs #68)."""
-    return compute_checklist_stats_payload(
+) -> LazyChecklistStatsPayload | None:
+    """Structured checklist stats for the Checklist Statistics tab (refs #68).
+
+    Lazy payload: each field group (summary, streak, rankings, yearly, countries …) is computed when
+    a tab first reads it. ``cache_resource`` (not ``cache_data``) so those memoised groups are shared
+    across reruns instead of being pickled; consumers treat the payload as read-only. Groups are also
+    persisted in :func:`app_result_cache`, so a restarted app reads them back from disk. Until every
+    group is computed a payload keeps its frames alive, so only two are kept.
+    """
+    return lazy_checklist_stats_payload(
         df,
         CHECKLIST_STATS_TOP_N_TABLE_LIMIT,
         taxonomy_locale=taxonomy_locale,
+        result_cache=app_result_cache(),
     )
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_resource(show_spinner=False, max_entries=4)
 def cached_full_export_checklist_stats_payload(
     df: pd.DataFrame,
     top_n_limit: int,
     high_count_sort: str,
     high_count_tie_break: str,
     taxonomy_locale: str,
-) -> ChecklistStatsPayload | None:
+) -> LazyChecklistStatsPayload | None:
     """Full-export stats payload shared by Maintenance + Rankings (one compute per cache key).
 
     *top_n_limit* and high-count options match **Settings → Tables & lists** and Rankings.
+    Lazy like :func:`cached_checklist_stats_payload`; with ``EXPLORER_STATS_SECTIONS`` set to
+    ``threads`` / ``processes`` the section groups missing from the result cache are prefetched
+    concurrently up front.
     """
-    return compute_checklist_stats_payload(
+    payload = lazy_checklist_stats_payload(
         df,
         top_n_limit,
         high_count_sort=high_count_sort,
         high_count_tie_break=high_count_tie_break,
         taxonomy_locale=taxonomy_locale,
+        result_cache=app_result_cache(),
     )
+    mode = checklist_stats_sections_mode()
+    if payload is not None and mode != "serial":
+        payload.prefetch(mode)
+    return payload
 
 
 @st.cache_data(show_spinner=False)
 def cached_sex_notation_by_year(df: pd.DataFrame) -> dict:
-    """Sex-notation maintenance scan on full export (refs #79)."""
+    """Sex-notation maintenance scan on full export (refs #79); persisted in :func:`app_result_cache`."""
     from explorer.core.stats import get_sex_notation_by_year
 
-    return get_sex_notation_by_year(df)
+    cache = app_result_cache()
+    if not cache.enabled:
+        return get_sex_notation_by_year(df)
+    return cache.get_or_compute(
+        "sex-notation", (frame_result_fingerprint(df),), lambda: get_sex_notation_by_year(df)
+    )
 
 
 def full_location_data_for_maintenance(df: pd.DataFrame) -> pd.DataFrame:
@@ -67,6 +141,9 @@ def cached_family_map_bundle(df_full: pd.DataFrame, taxonomy_locale: str) -> dic
     """Taxonomy merge + countable work frame for the **Families** map tab (refs #138).
 
     On fetch/parse failure returns empty structures so the UI can show a warning without crashing.
+    The taxonomy part (family lookup, merged taxonomy, common names) is persisted in
+    :func:`app_result_cache` per locale, so a warm restart skips the taxonomy fetch and the merge;
+    the sightings-level ``work`` frame is always re-derived and never written to disk.
     """
     from explorer.core.family_map_compute import (
         base_species_to_common_from_taxonomy,
@@ -81,27 +158,34 @@ def cached_family_map_bundle(df_full: pd.DataFrame, taxonomy_locale: str) -> dic
     )
 
     loc = (taxonomy_locale or "").strip()
-    try:
-        base_to_family = build_base_species_to_family_map(loc)
-        tax = load_taxonomy_species_rows(loc)
-        groups = load_taxonomy_groups(loc)
-        tax_merged = merge_taxonomy_detail_for_family_map(tax, groups)
-    except Exception:
-        return {
-            "work": pd.DataFrame(),
-            "tax_merged": pd.DataFrame(),
-            "base_to_common": {},
-            "families": (),
+    cache = app_result_cache()
+    taxonomy = cache.get("family-map-taxonomy", (loc,))
+    if taxonomy is None:
+        try:
+            base_to_family = build_base_species_to_family_map(loc)
+            tax = load_taxonomy_species_rows(loc)
+            groups = load_taxonomy_groups(loc)
+            tax_merged = merge_taxonomy_detail_for_family_map(tax, groups)
+        except Exception:
+            return {
+                "work": pd.DataFrame(),
+                "tax_merged": pd.DataFrame(),
+                "base_to_common": {},
+                "families": (),
+            }
+        taxonomy = {
+            "base_to_family": base_to_family,
+            "tax_merged": tax_merged,
+            "base_to_common": base_species_to_common_from_taxonomy(tax_merged),
         }
+        cache.put("family-map-taxonomy", (loc,), taxonomy)
 
-    work = prepare_family_map_work_frame(df_full, base_to_family)
-    base_to_common = base_species_to_common_from_taxonomy(tax_merged)
-    families = families_recorded_alphabetically(work)
+    work = prepare_family_map_work_frame(df_full, taxonomy["base_to_family"])
     return {
         "work": work,
-        "tax_merged": tax_merged,
-        "base_to_common": base_to_common,
-        "families": families,
+        "tax_merged": taxonomy["tax_merged"],
+        "base_to_common": taxonomy["base_to_common"],
+        "families": families_recorded_alphabetically(work),
     }
 
 
@@ -116,6 +200,17 @@ def cached_species_url_fn(locale_key: str) -> Callable[[str], str | None]:
     return lambda _: None
 
 
+@st.cache_resource(show_spinner=False, max_entries=2)
+def cached_working_set_engine(dataset_fingerprint: str, _df_full: pd.DataFrame) -> WorkingSetEngine:
+    """One date-sorted working-set engine per loaded export (keyed by content fingerprint).
+
+    ``cache_resource`` (not ``cache_data``): the engine is shared, not copied, so its sort order and
+    memoised working sets survive reruns. *_df_full* is not hashed.
+    """
+    _ = dataset_fingerprint
+    return working_set_engine_for(_df_full)
+
+
 def static_map_cache_key(
     work_df: pd.DataFrame,
     map_view_mode: str,
@@ -30,6 +30,10 @@ STREAMLIT_APP_DIR = Path(__file__).resolve().parent
 REPO_ROOT = str(STREAMLIT_APP_DIR.parent.parent.parent)
 
 DEFAULT_EBIRD_FILENAME = os.environ.get("STREAMLIT_EBIRD_DATA_FILE", DEFAULT_EBIRD_DATA_FILENAME)
+# Parquet sidecar of the parsed export (see explorer.core.dataset_cache); gitignored.
+DATASET_CACHE_DIR = os.path.join(REPO_ROOT, ".explorer_cache")
+# Opt-in pickled stats / family-map taxonomy / coverage results that survive restarts (see explorer.core.result_cache).
+RESULT_CACHE_DIR = os.path.join(DATASET_CACHE_DIR, "results")
 
 MAP_VIEW_LABEL_TO_MODE = {
     "All locations": "all",
@@ -102,7 +106,6 @@ DEFAULT_TAXONOMY_LOCALE = TAXONOMY_LOCALE_DEFAULT
 EBIRD_DATA_SIG_KEY = "ebird_data_sig"
 EXPLORER_MAP_HTML_BYTES_KEY = "_explorer_map_html_bytes"
 POPUP_HTML_CACHE_KEY = "popup_html_cache"
-FILTERED_BY_LOC_CACHE_KEY = "filtered_by_loc_cache"
 
 # Landing page container/widget keys.
 EBIRD_LANDING_MAIN_CONTAINER_KEY = "ebird_landing_main"
@@ -11,24 +11,29 @@ import pandas as pd
 import streamlit as st
 
 from explorer.core.data_loader import load_dataset
+from explorer.core.dataset_cache import DATASET_FINGERPRINT_ATTR, load_dataset_with_cache
 from explorer.core.explorer_paths import build_explorer_candidate_dirs, resolve_ebird_data_file
 
-from explorer.app.streamlit.app_constants import DEFAULT_EBIRD_FILENAME, REPO_ROOT
+from explorer.app.streamlit.app_constants import DATASET_CACHE_DIR, DEFAULT_EBIRD_FILENAME, REPO_ROOT
 from explorer.app.streamlit.perf_instrumentation import perf_span
 
 
 @st.cache_data(show_spinner=False)
 def _cached_load_dataset_from_disk(path: str, file_sig: tuple[int, int]) -> pd.DataFrame:
-    """Disk dataset cache keyed by path + (mtime_ns, size) for fast warm reruns."""
+    """Disk dataset cache keyed by path + (mtime_ns, size) for fast warm reruns.
+
+    Cold starts read the Parquet sidecar (content-hash keyed) before falling back to the CSV.
+    """
     _ = file_sig
-    return load_dataset(path)
+    return load_dataset_with_cache(path, DATASET_CACHE_DIR, loader=load_dataset)
 
 
 @st.cache_data(show_spinner=False)
 def _cached_load_dataset_from_bytes(raw: bytes, content_sha256: str) -> pd.DataFrame:
     """Upload/session-bytes dataset cache keyed by content hash."""
-    _ = content_sha256
-    return load_dataset(io.BytesIO(raw))
+    df = load_dataset(io.BytesIO(raw))
+    df.attrs[DATASET_FINGERPRINT_ATTR] = content_sha256
+    return df
 
 
 def load_dataframe(
@@ -12,7 +12,6 @@ from explorer.app.streamlit.app_constants import (
     EBIRD_DATA_SIG_KEY,
     EXPLORER_MAP_HTML_BYTES_KEY,
     REPO_ROOT,
-    FILTERED_BY_LOC_CACHE_KEY,
     FOLIUM_MAP_MOUNT_NONCE_KEY,
     FOLIUM_STATIC_MAP_CACHE_KEY,
     MAP_VIEW_LABEL_TO_MODE,
@@ -46,6 +45,7 @@ from explorer.app.streamlit.app_constants import (
     SETTINGS_CONFIG_SOURCE_KEY,
     DEFAULT_TAXONOMY_LOCALE,
 )
+from explorer.app.streamlit.app_caches import cached_working_set_engine
 from explorer.app.streamlit.app_go_to_gps_ui import render_go_to_gps_sidebar_expander
 from explorer.app.streamlit.app_map_ui import (
     ensure_streamlit_map_basemap_height_keys,
@@ -74,6 +74,7 @@ from explorer.app.streamlit.map_working import (
     date_inception_to_today_default,
     streamlit_working_set_and_status,
 )
+from explorer.core.dataset_cache import dataset_frame_fingerprint
 from explorer.core.explorer_paths import settings_yaml_path_for_source
 from explorer.app.streamlit.perf_instrumentation import render_explorer_perf_sidebar_panel
 from explorer.app.streamlit.streamlit_ui_constants import (
@@ -123,6 +124,9 @@ class MapWorkingContext:
     family_name: str
     family_highlight_base: str
     family_colour_scheme: int
+    # Engine totals cube + applied range for date-filtered map banners (None when all-time).
+    daily_totals: Any = None
+    date_range: Any = None
 
 
 def render_map_sidebar_and_working_set(df_full: Any) -> MapWorkingContext:
@@ -231,15 +235,14 @@ def render_map_sidebar_and_working_set(df_full: Any) -> MapWorkingContext:
     # Working set is still date-filtered for checklist stats and other tabs.
     # Family map ignores date filtering (v1), but we preserve the date filter controls and state.
     _ws_mode = "all" if is_family_view else map_view_mode
+    ws_engine = cached_working_set_engine(dataset_frame_fingerprint(df_full), df_full)
     ws, date_filter_banner = streamlit_working_set_and_status(
         df_full,
         map_view_mode=_ws_mode,
         date_filter_on=date_filter_on_effective,
         date_range=date_range_sel,
-        map_caches=(
-            st.session_state.get(POPUP_HTML_CACHE_KEY),
-            st.session_state.get(FILTERED_BY_LOC_CACHE_KEY),
-        ),
+        map_caches=(st.session_state.get(POPUP_HTML_CACHE_KEY),),
+        engine=ws_engine,
     )
     if ws is None:
         st.error("Invalid date range. Using all-time data for this run.")
@@ -248,10 +251,8 @@ def render_map_sidebar_and_working_set(df_full: Any) -> MapWorkingContext:
             map_view_mode=map_view_mode,
             date_filter_on=False,
             date_range=None,
-            map_caches=(
-                st.session_state.get(POPUP_HTML_CACHE_KEY),
-                st.session_state.get(FILTERED_BY_LOC_CACHE_KEY),
-            ),
+            map_caches=(st.session_state.get(POPUP_HTML_CACHE_KEY),),
+            engine=ws_engine,
         )
     work_df = ws.df
 
@@ -471,4 +472,6 @@ def render_map_sidebar_and_working_set(df_full: Any) -> MapWorkingContext:
         family_name=str(family_name or ""),
         family_highlight_base=str(family_highlight_base or ""),
         family_colour_scheme=int(family_colour_scheme),
+        daily_totals=ws_engine.daily_totals if ws.date_range is not None else None,
+        date_range=ws.date_range,
     )
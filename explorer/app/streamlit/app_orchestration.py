@@ -24,7 +24,6 @@ tab row (refs #70, #130).
 
 from __future__ import annotations
 
-from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -36,7 +35,6 @@ from explorer.app.streamlit.app_caches import cached_species_url_fn
 from explorer.app.streamlit.app_constants import (
     DEFAULT_TAXONOMY_LOCALE,
     EXPLORER_MAIN_SCRIPT_RUN_ID_KEY,
-    FILTERED_BY_LOC_CACHE_KEY,
     POPUP_HTML_CACHE_KEY,
     REPO_ROOT,
     SETTINGS_BASELINE_KEY,
@@ -132,8 +130,6 @@ def bootstrap_session_after_csv_load(df_full: Any, *, source_label: str | None)
 
     if POPUP_HTML_CACHE_KEY not in st.session_state:
         st.session_state[POPUP_HTML_CACHE_KEY] = {}
-    if FILTERED_BY_LOC_CACHE_KEY not in st.session_state:
-        st.session_state[FILTERED_BY_LOC_CACHE_KEY] = OrderedDict()
 
 
 def build_taxonomy_popup_assets() -> TaxonomyPopupAssets:
@@ -223,6 +219,8 @@ def render_dashboard_shell(
         mark_lifer=tax.mark_lifer,
         mark_last_seen=tax.mark_last_seen,
         species_url_fn=tax.species_url_fn,
+        daily_totals=mw.daily_totals,
+        date_range=mw.date_range,
     )
 
     run_non_map_data_tab_fragments(
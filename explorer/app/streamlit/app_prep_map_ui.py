@@ -14,6 +14,7 @@ cannot strip layers from the session cache (same mutation hazard as HTML export)
 from __future__ import annotations
 
 import copy
+import functools
 from collections import OrderedDict
 from typing import Any, Callable
 
@@ -31,7 +32,6 @@ from explorer.app.streamlit.app_constants import (
     EBIRD_DATA_SIG_KEY,
     EXPLORER_MAP_HTML_BYTES_KEY,
     EXPORT_MAP_HTML_BTN_KEY,
-    FILTERED_BY_LOC_CACHE_KEY,
     FOLIUM_MAP_MOUNT_NONCE_KEY,
     FOLIUM_STATIC_MAP_CACHE_KEY,
     POPUP_HTML_CACHE_KEY,
@@ -173,6 +173,8 @@ def render_prep_spinner_and_map_tab(
     mark_lifer: bool,
     mark_last_seen: bool,
     species_url_fn: Callable[..., str],
+    daily_totals: Any = None,
+    date_range: Any = None,
 ) -> None:
     """Run map prep first (spinner), then heavy tab caches + session sync (second spinner)."""
     with st.sidebar:
@@ -185,7 +187,6 @@ def render_prep_spinner_and_map_tab(
                 if st.session_state.get(EBIRD_DATA_SIG_KEY) != sig:
                     st.session_state[EBIRD_DATA_SIG_KEY] = sig
                     st.session_state[POPUP_HTML_CACHE_KEY] = {}
-                    st.session_state[FILTERED_BY_LOC_CACHE_KEY] = OrderedDict()
                     st.session_state.pop(FOLIUM_STATIC_MAP_CACHE_KEY, None)
 
             map_warning_text: str | None = None
@@ -194,7 +195,9 @@ def render_prep_spinner_and_map_tab(
             capture_all_locations_view = False
             try:
                 with perf_span("prep.map_context_prepare"):
-                    ctx = prepare_all_locations_map_context(work_df, full_df=df_full)
+                    ctx = prepare_all_locations_map_context(
+                        work_df, full_df=df_full, daily_totals=daily_totals, date_range=date_range
+                    )
             except ValueError as e:
                 map_warning_text = str(e)
                 st.session_state.pop(EXPLORER_MAP_HTML_BYTES_KEY, None)
@@ -406,7 +409,6 @@ def render_prep_spinner_and_map_tab(
                         "base_species_fn": base_species_for_lifer,
                         "taxonomy_locale": tax_locale_effective,
                         "popup_html_cache": st.session_state.get(POPUP_HTML_CACHE_KEY),
-                        "filtered_by_loc_cache": st.session_state.get(FILTERED_BY_LOC_CACHE_KEY),
                         "map_view_mode": map_view_mode,
                         "hide_non_matching_locations": hide_nm,
                         "show_subspecies_lifers": bool(
@@ -563,6 +565,8 @@ def render_prep_spinner_and_map_tab(
             with perf_span("prep.cache_checklist_stats"):
                 checklist_payload = cached_checklist_stats_payload(work_df, tax_locale_effective)
             with perf_span("prep.cache_maint_rankings_sex_notation"):
+                # Full-export rankings and maintenance scans are synced as builders and run by their
+                # tab fragments, so map prep (and the Map tab) does not wait on them.
                 top_n = int(st.session_state.get(STREAMLIT_RANKINGS_TOP_N_KEY))
                 hc_sort = str(st.session_state.get(STREAMLIT_HIGH_COUNT_SORT_KEY))
                 hc_tb = str(st.session_state.get(STREAMLIT_HIGH_COUNT_TIE_BREAK_KEY))
@@ -570,27 +574,27 @@ def render_prep_spinner_and_map_tab(
                     maint_full_payload = cached_full_export_checklist_stats_payload(
                         df_full, top_n, hc_sort, hc_tb, tax_locale_effective
                     )
-                    rankings_bundle = build_rankings_tab_bundle(
+                    rankings_bundle = functools.partial(
+                        build_rankings_tab_bundle,
                         df_full,
                         country_sort=st.session_state.get(STREAMLIT_COUNTRY_TAB_SORT_KEY),
                         taxonomy_locale=tax_locale_effective,
                         high_count_sort=hc_sort,
                         high_count_tie_break=hc_tb,
                     )
+                    sex_notation_by_year = functools.partial(cached_sex_notation_by_year, df_full)
                 else:
                     maint_full_payload = None
                     rankings_bundle = {}
-                sex_notation_by_year: dict = (
-                    {} if df_full.empty else cached_sex_notation_by_year(df_full)
-                )
+                    sex_notation_by_year = {}
 
             with perf_span("prep.tab_session_sync"):
                 sync_checklist_stats_tab_session_inputs(checklist_payload)
                 sync_rankings_tab_session_inputs(rankings_bundle)
                 loc_maint = full_location_data_for_maintenance(df_full)
-                incomplete_maint: dict = {}
+                incomplete_maint = {}
                 if maint_full_payload is not None:
-                    incomplete_maint = maint_full_payload.incomplete_by_year or {}
+                    incomplete_maint = functools.partial(getattr, maint_full_payload, "incomplete_by_year")
                 sync_maintenance_tab_session_inputs(
                     loc_maint,
                     close_location_meters=int(st.session_state.get(STREAMLIT_CLOSE_LOCATION_METERS_KEY)),
@@ -7,7 +7,7 @@ Uses the same scoped CSS as Checklist Statistics / Country (``CHECKLIST_STATS_*`
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import streamlit as st
@@ -34,6 +34,10 @@ from explorer.app.streamlit.streamlit_theme import inject_streamlit_checklist_cs
 _WRAPPER_OPEN = '<div class="streamlit-checklist-html-ab">'
 _WRAPPER_CLOSE = "</div>"
 
+# Per-year maintenance rows, or a zero-argument builder evaluated on first render of the tab.
+YearRows = Dict[Any, List[Tuple[Any, ...]]]
+YearRowsOrBuilder = Union[YearRows, Callable[[], YearRows]]
+
 
 def _md(html: str) -> None:
     st.markdown(html, unsafe_allow_html=True)
@@ -43,10 +47,13 @@ def sync_maintenance_tab_session_inputs(
     loc_df: pd.DataFrame,
     *,
     close_location_meters: int,
-    incomplete_by_year: Dict[Any, List[Tuple[Any, ...]]],
-    sex_notation_by_year: Dict[Any, List[Tuple[Any, ...]]],
+    incomplete_by_year: YearRowsOrBuilder,
+    sex_notation_by_year: YearRowsOrBuilder,
 ) -> None:
-    """Store maintenance inputs for :func:`run_maintenance_streamlit_tab_fragment` (full script runs)."""
+    """Store maintenance inputs for :func:`run_maintenance_streamlit_tab_fragment` (full script runs).
+
+    The per-year lists may be zero-argument builders (full-export scans), run on first render.
+    """
     st.session_state[MAINTENANCE_TAB_SYNC_KEY] = {
         "loc_df": loc_df,
         "close_location_meters": close_location_meters,
@@ -67,12 +74,20 @@ def run_maintenance_streamlit_tab_fragment() -> None:
         render_maintenance_streamlit_tab(
             data["loc_df"],
             close_location_meters=int(data["close_location_meters"]),
-            incomplete_by_year=data["incomplete_by_year"],
-            sex_notation_by_year=data["sex_notation_by_year"],
+            incomplete_by_year=_resolved_year_rows(data, "incomplete_by_year"),
+            sex_notation_by_year=_resolved_year_rows(data, "sex_notation_by_year"),
             species_url_fn=species_url_fn,
         )
 
 
+def _resolved_year_rows(data: Dict[str, Any], key: str) -> YearRows:
+    rows = data[key]
+    if callable(rows):
+        # Kept in the synced dict so fragment reruns do not rebuild it.
+        rows = data[key] = rows() or {}
+    return rows
+
+
 def render_maintenance_streamlit_tab(
     loc_df: pd.DataFrame,
     *,
@@ -12,9 +12,9 @@ from typing import Any, MutableMapping, Optional, Set, Tuple
 
 import pandas as pd
 
-from explorer.core.working_set import WorkingSet, rebuild_working_set_from_date_filter
+from explorer.core.working_set import WorkingSet, WorkingSetEngine, rebuild_working_set_from_date_filter
 
-MapCaches = Tuple[dict, MutableMapping[Any, Any]]
+MapCaches = Tuple[MutableMapping[Any, Any], ...]
 
 
 def location_ids_with_checklists(df: pd.DataFrame) -> Set[Any]:
@@ -45,6 +45,11 @@ def date_inception_to_today_default(df: pd.DataFrame) -> Tuple[date, date]:
     return d_lo, today
 
 
+def working_set_engine_for(df_full: pd.DataFrame) -> WorkingSetEngine:
+    """Build the :class:`~explorer.core.working_set.WorkingSetEngine` for the loaded export."""
+    return WorkingSetEngine(df_full, location_ids_with_checklists(df_full))
+
+
 def streamlit_working_set_and_status(
     df_full: pd.DataFrame,
     *,
@@ -52,6 +57,7 @@ def streamlit_working_set_and_status(
     date_filter_on: bool,
     date_range: Optional[Tuple[date, date]],
     map_caches: Optional[MapCaches],
+    engine: Optional[WorkingSetEngine] = None,
 ) -> Tuple[Optional[WorkingSet], str]:
     """
     Return ``(working_set, date_filter_status)`` for map banners.
@@ -61,8 +67,11 @@ def streamlit_working_set_and_status(
     Lifer mode forces all-time data and returns status ``\"Lifer view uses all-time data\"``.
 
     *date_filter_on* — when ``True`` (and *map_view_mode* is ``all``), apply *date_range*; when ``False``, no filter.
+
+    *engine* — optional :class:`~explorer.core.working_set.WorkingSetEngine` built for *df_full*
+    (see :func:`working_set_engine_for`); reused across reruns so date changes are slices, not rescans.
     """
-    lids = location_ids_with_checklists(df_full)
+    lids = location_ids_with_checklists(df_full) if engine is None else None
     mode = (map_view_mode or "all").strip().lower()
 
     if mode == "lifers":
@@ -73,6 +82,7 @@ def streamlit_working_set_and_status(
             filter_start_date="",
             filter_end_date="",
             map_caches=map_caches,
+            engine=engine,
         )
         return ws, "Lifer view uses all-time data"
 
@@ -86,6 +96,7 @@ def streamlit_working_set_and_status(
             filter_start_date="",
             filter_end_date="",
             map_caches=map_caches,
+            engine=engine,
         )
         return ws, "Date filter: Off"
 
@@ -97,6 +108,7 @@ def streamlit_working_set_and_status(
             filter_start_date="",
             filter_end_date="",
             map_caches=map_caches,
+            engine=engine,
         )
         return ws, "Date filter: Off"
 
@@ -113,6 +125,7 @@ def streamlit_working_set_and_status(
         filter_start_date=start_s,
         filter_end_date=end_s,
         map_caches=map_caches,
+        engine=engine,
     )
     if ws is None:
         return None, "Date filter: invalid range"
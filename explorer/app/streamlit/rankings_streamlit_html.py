@@ -23,7 +23,7 @@ A hint points to the **Country** tab for the in-country, working-set–scoped va
 from __future__ import annotations
 
 import html
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
 import streamlit as st
@@ -37,11 +37,11 @@ from explorer.core.species_family import (
     load_taxonomy_groups,
     load_taxonomy_species_rows,
 )
-from explorer.core.species_logic import countable_species_vectorized
-from explorer.core.stats import safe_count
+from explorer.core.derived_columns import count_series, countable_base_series
+from explorer.core.result_cache import frame_result_fingerprint
 from explorer.core.taxonomy import get_species_and_lifelist_urls, load_taxonomy
 
-from explorer.app.streamlit.app_caches import cached_full_export_checklist_stats_payload
+from explorer.app.streamlit.app_caches import app_result_cache, cached_full_export_checklist_stats_payload
 from explorer.app.streamlit.app_constants import RANKINGS_TAB_BUNDLE_KEY
 from explorer.app.streamlit.perf_instrumentation import perf_fragment
 from explorer.app.streamlit.defaults import RANKINGS_BUNDLE_SCROLL_HINT_DEFAULT, RANKINGS_TABLE_LAYOUT_MAX_WIDTH_PX
@@ -211,11 +211,24 @@ def _cached_rankings_stats_bundle(
     )
 
 
-def sync_rankings_tab_session_inputs(bundle: dict[str, Any]) -> None:
-    """Store formatted Rankings bundle for :func:`run_rankings_streamlit_tab_fragment` (full script runs)."""
+def sync_rankings_tab_session_inputs(bundle: dict[str, Any] | Callable[[], dict[str, Any]]) -> None:
+    """Store the Rankings bundle for :func:`run_rankings_streamlit_tab_fragment` (full script runs).
+
+    Pass a zero-argument builder (e.g. a ``functools.partial`` of :func:`build_rankings_tab_bundle`)
+    to defer the full-export rankings until the tab is first rendered.
+    """
     st.session_state[RANKINGS_TAB_BUNDLE_KEY] = bundle
 
 
+def _session_rankings_bundle() -> dict[str, Any]:
+    bundle = st.session_state.get(RANKINGS_TAB_BUNDLE_KEY) or {}
+    if callable(bundle):
+        bundle = bundle()
+        # Fragment reruns reuse the built bundle until the next full run syncs a new builder.
+        st.session_state[RANKINGS_TAB_BUNDLE_KEY] = bundle
+    return bundle
+
+
 @st.cache_data(show_spinner=False)
 def _load_taxonomy_species_rows(locale: str) -> pd.DataFrame:
     """Streamlit-cached wrapper; delegates to :func:`explorer.core.species_family.load_taxonomy_species_rows`."""
@@ -230,6 +243,23 @@ def _load_taxonomy_groups(locale: str) -> list[dict[str, Any]]:
 
 @st.cache_data(show_spinner=False)
 def _build_group_coverage_tables(df_full: pd.DataFrame, taxonomy_locale: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Species-group coverage tables, persisted in :func:`~explorer.app.streamlit.app_caches.app_result_cache`.
+
+    A warm restart reads them back without fetching the taxonomy; empty tables (taxonomy fetch
+    failed) are not stored.
+    """
+    cache = app_result_cache()
+    cache_key = (frame_result_fingerprint(df_full), taxonomy_locale) if cache.enabled else ()
+    stored = cache.get("group-coverage", cache_key)
+    if stored is not None:
+        return stored
+    summary, merged = _compute_group_coverage_tables(df_full, taxonomy_locale)
+    if not summary.empty:
+        cache.put("group-coverage", cache_key, (summary, merged))
+    return summary, merged
+
+
+def _compute_group_coverage_tables(df_full: pd.DataFrame, taxonomy_locale: str) -> tuple[pd.DataFrame, pd.DataFrame]:
     """Build summary/detail DataFrames for species-group coverage (eBird taxonomy + sppgroup)."""
     tax = _load_taxonomy_species_rows(taxonomy_locale)
     groups = _load_taxonomy_groups(taxonomy_locale)
@@ -242,10 +272,10 @@ def _build_group_coverage_tables(df_full: pd.DataFrame, taxonomy_locale: str) ->
     )
 
     work = df_full.copy()
-    work["_base"] = countable_species_vectorized(work)
+    work["_base"] = countable_base_series(work)
     work = work.dropna(subset=["_base"]).copy()
     work["_base"] = work["_base"].astype(str).str.strip()
-    work["_count"] = work["Count"].apply(safe_count)
+    work["_count"] = count_series(work)
     # Checklist-level facts per base species (dedupe within checklist, but keep dates + IDs
     # so first/last seen can link to the relevant checklist).
     cl_facts = (
@@ -503,7 +533,7 @@ def render_rankings_streamlit_tab_from_bundle(bundle: dict[str, Any]) -> None:
 def run_rankings_streamlit_tab_fragment() -> None:
     """Partial reruns when Rankings expanders/widgets change (same pattern as Country / Yearly)."""
     with perf_fragment("ranking_lists"):
-        bundle = st.session_state.get(RANKINGS_TAB_BUNDLE_KEY) or {}
+        bundle = _session_rankings_bundle()
         if not bundle.get("rankings_sections_top_n") and not bundle.get("rankings_sections_other"):
             st.info("Load checklist data to use Ranking & Lists.")
             return
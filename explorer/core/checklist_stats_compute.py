@@ -6,18 +6,22 @@ Computes numeric summaries and ranking inputs only; presentation layers build HT
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from explorer.core.species_logic import countable_species_vectorized
+from explorer.core.derived_columns import count_series, countable_base_series
+from explorer.core.result_cache import ResultCache, frame_result_fingerprint
 from explorer.core.stats import (
     compute_rankings,
     country_summary_stats,
     longest_streak,
-    rankings_not_seen_recently_in_country,
-    safe_count,
+    rankings_not_seen_recently_by_country,
     yearly_summary_stats,
 )
 
@@ -60,6 +64,87 @@ def protocol_display_name(protocol: Any) -> str:
     return PROTOCOL_MAP.get(p.lower(), p)
 
 
+# How :func:`compute_checklist_stats_payload` runs its independent sections (rankings, yearly
+# summary, country summary, per-country "not seen recently"): one after another, on a thread pool,
+# or on a process pool. Unknown values fall back to ``"serial"``.
+STATS_SECTION_MODES = ("serial", "threads", "processes")
+
+# Read-only section inputs inside process-pool workers; set once per worker by the pool initializer,
+# so the frames are handed over once per worker rather than once per section.
+_SECTION_INPUTS: Dict[str, Any] = {}
+
+
+def _init_section_worker(inputs: Dict[str, Any]) -> None:
+    global _SECTION_INPUTS
+    _SECTION_INPUTS = inputs
+
+
+def _section_rankings(inp: Dict[str, Any]) -> Dict[str, List[Any]]:
+    return compute_rankings(
+        inp["df"],
+        inp["cl"],
+        inp["top_n_limit"],
+        inp["dur_col"],
+        inp["dist_col"],
+        high_count_tie_break=inp["high_count_tie_break"],
+        high_count_sort=inp["high_count_sort"],
+    )
+
+
+def _section_yearly(inp: Dict[str, Any]):
+    return yearly_summary_stats(
+        inp["df"], inp["cl"], inp["dur_col"], inp["dist_col"], taxonomy_locale=inp["taxonomy_locale"]
+    )
+
+
+def _section_countries(inp: Dict[str, Any]):
+    return country_summary_stats(inp["df"], inp["cl"])
+
+
+def _section_not_seen_recently(
+    inp: Dict[str, Any], country_keys: Optional[List[str]] = None
+) -> Dict[str, List[Any]]:
+    # ``None``: every dated checklist country. Concurrent runs start before the country sections are
+    # known and narrow the result afterwards; serial runs pass the section keys.
+    return rankings_not_seen_recently_by_country(inp["df"], inp["cl"], country_keys)
+
+
+_SECTIONS = {
+    "rankings": _section_rankings,
+    "yearly": _section_yearly,
+    "countries": _section_countries,
+    "not_seen_recently": _section_not_seen_recently,
+}
+
+
+def _run_section(name: str, inputs: Optional[Dict[str, Any]] = None) -> Any:
+    return _SECTIONS[name](_SECTION_INPUTS if inputs is None else inputs)
+
+
+def _run_sections(inputs: Dict[str, Any], mode: str, max_workers: Optional[int]) -> Dict[str, Any]:
+    """Run every entry of ``_SECTIONS`` on *inputs*; results keyed by section name."""
+    if mode not in ("threads", "processes"):
+        results = {name: _run_section(name, inputs) for name in _SECTIONS if name != "not_seen_recently"}
+        results["not_seen_recently"] = _section_not_seen_recently(
+            inputs, _section_country_keys(results["countries"])
+        )
+        return results
+    workers = max_workers or min(len(_SECTIONS), os.cpu_count() or 1)
+    if mode == "threads":
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {name: pool.submit(_run_section, name, inputs) for name in _SECTIONS}
+            return {name: f.result() for name, f in futures.items()}
+    # Spawned workers: forking the multithreaded Streamlit server process can deadlock.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_section_worker,
+        initargs=(inputs,),
+    ) as pool:
+        futures = {name: pool.submit(_run_section, name) for name in _SECTIONS}
+        return {name: f.result() for name, f in futures.items()}
+
+
 @dataclass(frozen=True)
 class ChecklistStatsPayload:
     """All values needed to render checklist stats, yearly summary, country sections, and rankings."""
@@ -101,29 +186,34 @@ class ChecklistStatsPayload:
     country_not_seen_recently: Dict[str, List[Any]] = field(default_factory=dict)
 
 
-def compute_checklist_stats_payload(
+def _payload_inputs(
     df: pd.DataFrame,
     top_n_limit: int,
     *,
-    high_count_sort: str = "total_count",
-    high_count_tie_break: str = "last",
-    taxonomy_locale: str | None = None,
-) -> Optional[ChecklistStatsPayload]:
-    """Build structured checklist statistics from a sighting-level DataFrame.
+    high_count_sort: str,
+    high_count_tie_break: str,
+    taxonomy_locale: str | None,
+) -> Dict[str, Any]:
+    """Shared read-only inputs for the payload field groups and sections."""
+    return {
+        "df": df,
+        "cl": df.drop_duplicates(subset=["Submission ID"]).copy(),
+        "top_n_limit": top_n_limit,
+        "dur_col": "Duration (Min)" if "Duration (Min)" in df.columns else None,
+        "dist_col": "Distance Traveled (km)" if "Distance Traveled (km)" in df.columns else None,
+        "high_count_tie_break": high_count_tie_break,
+        "high_count_sort": high_count_sort,
+        "taxonomy_locale": taxonomy_locale,
+    }
 
-    Returns ``None`` when *df* is empty. *top_n_limit* caps ranking list lengths
-    (same as **Top N table limit**).
-    """
-    if df.empty:
-        return None
 
-    cl = df.drop_duplicates(subset=["Submission ID"]).copy()
-    dur_col = "Duration (Min)" if "Duration (Min)" in df.columns else None
-    dist_col = "Distance Traveled (km)" if "Distance Traveled (km)" in df.columns else None
+def _summary_fields(inp: Dict[str, Any]) -> Dict[str, Any]:
+    """Headline totals, protocol rows, effort and shared-birding fields."""
+    df, cl, dur_col, dist_col = inp["df"], inp["cl"], inp["dur_col"], inp["dist_col"]
 
     n_checklists = cl["Submission ID"].nunique()
-    n_species = int(countable_species_vectorized(df).dropna().nunique())
-    n_individuals = int(df["Count"].apply(safe_count).sum())
+    n_species = int(countable_base_series(df).dropna().nunique())
+    n_individuals = int(count_series(df).sum())
 
     n_completed = "—"
     n_incomplete = "—"
@@ -200,72 +290,281 @@ def compute_checklist_stats_payload(
     godwit_km = 13_560
     times_godwit = total_km / godwit_km
 
-    (
-        streak,
-        streak_start_date,
-        streak_start_loc,
-        streak_start_sid,
-        streak_start_lid,
-        streak_end_date,
-        streak_end_loc,
-        streak_end_sid,
-        streak_end_lid,
-    ) = longest_streak(unique_dates, cl)
-
-    rankings = compute_rankings(
+    return {
+        "n_checklists": n_checklists,
+        "n_species": n_species,
+        "n_individuals": n_individuals,
+        "n_completed_display": n_completed,
+        "protocol_rows": protocol_rows,
+        "total_minutes": total_minutes,
+        "total_hours": total_hours,
+        "total_days_dec": total_days_dec,
+        "total_months": total_months,
+        "total_years": total_years,
+        "n_days_with_checklist": n_days_with_checklist,
+        "n_shared": n_shared,
+        "shared_minutes": shared_minutes,
+        "shared_hours": shared_hours,
+        "n_days_birding_with_others": n_days_birding_with_others,
+        "total_km": total_km,
+        "parkruns": parkruns,
+        "marathons": marathons,
+        "times_equator": times_equator,
+        "times_godwit": times_godwit,
+    }
+
+
+_STREAK_FIELDS = (
+    "streak",
+    "streak_start_date",
+    "streak_start_loc",
+    "streak_start_sid",
+    "streak_start_lid",
+    "streak_end_date",
+    "streak_end_loc",
+    "streak_end_sid",
+    "streak_end_lid",
+)
+
+
+def _streak_fields(inp: Dict[str, Any]) -> Dict[str, Any]:
+    """Longest run of consecutive checklist days and its first / last checklist."""
+    cl = inp["cl"]
+    unique_dates = cl.dropna(subset=["Date"])["Date"].dt.normalize().unique()
+    return dict(zip(_STREAK_FIELDS, longest_streak(unique_dates, cl)))
+
+
+def _yearly_fields(years_list_rows_incomplete) -> Dict[str, Any]:
+    years_list, yearly_rows, incomplete_by_year = years_list_rows_incomplete
+    return {"years_list": years_list, "yearly_rows": yearly_rows, "incomplete_by_year": incomplete_by_year}
+
+
+def _section_country_keys(country_sections) -> List[str]:
+    """Keys of the country sections that have a table (the ones shown with "not seen recently")."""
+    return [ck for ck, ys, rs in country_sections if ys and rs and ck != "_UNKNOWN"]
+
+
+def _country_not_seen_recently(country_sections, by_country: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    """Per-country "not seen recently" rows for the country sections that have a table."""
+    return {ck: by_country.get(ck, []) for ck in _section_country_keys(country_sections)}
+
+
+def compute_checklist_stats_payload(
+    df: pd.DataFrame,
+    top_n_limit: int,
+    *,
+    high_count_sort: str = "total_count",
+    high_count_tie_break: str = "last",
+    taxonomy_locale: str | None = None,
+    sections_mode: str = "serial",
+    max_workers: int | None = None,
+) -> Optional[ChecklistStatsPayload]:
+    """Build structured checklist statistics from a sighting-level DataFrame.
+
+    Returns ``None`` when *df* is empty. *top_n_limit* caps ranking list lengths
+    (same as **Top N table limit**).
+
+    *sections_mode* (see :data:`STATS_SECTION_MODES`) runs the rankings, yearly summary, country
+    summary and per-country "not seen recently" sections serially (default), on threads or on
+    worker processes (*max_workers*, default one per section up to the CPU count). They only read
+    *df* / the checklist frame, so every mode returns the same payload.
+
+    See :func:`lazy_checklist_stats_payload` for a payload that computes each field group on first use.
+    """
+    payload = lazy_checklist_stats_payload(
         df,
-        cl,
         top_n_limit,
-        dur_col,
-        dist_col,
-        high_count_tie_break=high_count_tie_break,
         high_count_sort=high_count_sort,
+        high_count_tie_break=high_count_tie_break,
+        taxonomy_locale=taxonomy_locale,
     )
-    years_list, yearly_rows, incomplete_by_year = yearly_summary_stats(
-        df, cl, dur_col, dist_col, taxonomy_locale=taxonomy_locale
+    if payload is None:
+        return None
+    payload.prefetch(sections_mode, max_workers)
+    return payload.materialize()
+
+
+class LazyChecklistStatsPayload:
+    """:class:`ChecklistStatsPayload` attribute surface, each field group computed on first access.
+
+    Groups: headline summary, streak, rankings, yearly summary (years / rows / incomplete lists),
+    country sections and per-country "not seen recently". Reading any field of a group computes the
+    whole group once and memoises it; other groups stay untouched, so a consumer that only renders
+    the Yearly Summary never pays for rankings. Safe to share between threads (one lock per payload).
+    Holds *df* (which must not be mutated afterwards) and its checklist frame until every group is
+    computed, then drops both.
+
+    With a *result_cache*, each group is read from / written to disk under *cache_key* (plus today's
+    date for the groups whose "not seen recently" cutoff depends on it), so a restarted process
+    reuses groups computed before.
+    """
+
+    def __init__(
+        self,
+        inputs: Dict[str, Any],
+        result_cache: Optional[ResultCache] = None,
+        cache_key: Tuple[Any, ...] = (),
+    ) -> None:
+        self._inputs = inputs
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._result_cache = result_cache
+        self._cache_key = tuple(cache_key)
+        self._today = pd.Timestamp.now(tz=None).date().isoformat()
+
+    def _group_rankings(self) -> Dict[str, Any]:
+        return {"rankings": _section_rankings(self._inputs)}
+
+    def _group_yearly(self) -> Dict[str, Any]:
+        return _yearly_fields(_section_yearly(self._inputs))
+
+    def _group_countries(self) -> Dict[str, Any]:
+        return {"country_sections": _section_countries(self._inputs)}
+
+    def _group_not_seen_recently(self) -> Dict[str, Any]:
+        sections = self.country_sections
+        by_country = _section_not_seen_recently(self._inputs, _section_country_keys(sections))
+        return {"country_not_seen_recently": _country_not_seen_recently(sections, by_country)}
+
+    def _group_cache_key(self, group: str) -> Tuple[Any, ...]:
+        if group in _GROUPS_USING_TODAY:
+            return self._cache_key + (self._today,)
+        return self._cache_key
+
+    def _load_group(self, group: str) -> Dict[str, Any]:
+        compute = _LAZY_GROUPS[group]
+        if self._result_cache is None:
+            return compute(self)
+        return self._result_cache.get_or_compute(
+            f"stats-{group}", self._group_cache_key(group), lambda: compute(self)
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        group = _LAZY_FIELD_GROUPS.get(name)
+        if group is None:
+            raise AttributeError(name)
+        values = self.__dict__["_values"]
+        if name not in values:
+            with self._lock:
+                if name not in values:
+                    values.update(self._load_group(group))
+                    self._release_inputs_when_complete()
+        return values[name]
+
+    def _release_inputs_when_complete(self) -> None:
+        # Nothing left to compute: let go of the frames (cached payloads outlive reruns).
+        if all(names[0] in self._values for names in _LAZY_GROUP_FIELDS.values()):
+            self._inputs = {}
+
+    def prefetch(self, sections_mode: str = "serial", max_workers: int | None = None) -> None:
+        """Compute the rankings, yearly, country and "not seen recently" groups now.
+
+        Runs them as sections (see :data:`STATS_SECTION_MODES`); groups already computed (or found
+        in the result cache) keep their values. Summary and streak fields stay lazy.
+        """
+        cache = self._result_cache
+        with self._lock:
+            missing = [g for g in _SECTION_GROUPS if _LAZY_GROUP_FIELDS[g][0] not in self._values]
+            if cache is not None:
+                for group in list(missing):
+                    stored = cache.get(f"stats-{group}", self._group_cache_key(group))
+                    if stored is not None:
+                        self._values.update(stored)
+                        missing.remove(group)
+            self._release_inputs_when_complete()
+            inputs = self._inputs
+        if not missing:
+            return
+        mode = str(sections_mode).strip().lower()
+        sections = _run_sections(inputs, mode if mode in STATS_SECTION_MODES else "serial", max_workers)
+        computed = {
+            "rankings": {"rankings": sections["rankings"]},
+            "yearly": _yearly_fields(sections["yearly"]),
+            "countries": {"country_sections": sections["countries"]},
+            "not_seen_recently": {
+                "country_not_seen_recently": _country_not_seen_recently(
+                    sections["countries"], sections["not_seen_recently"]
+                ),
+            },
+        }
+        with self._lock:
+            for group in missing:
+                for name, value in computed[group].items():
+                    self._values.setdefault(name, value)
+                if cache is not None:
+                    cache.put(f"stats-{group}", self._group_cache_key(group), computed[group])
+            self._release_inputs_when_complete()
+
+    def computed_fields(self) -> Tuple[str, ...]:
+        """Names of the fields computed so far (for tests / instrumentation)."""
+        return tuple(self._values)
+
+    def materialize(self) -> ChecklistStatsPayload:
+        """Compute every remaining group and return the equivalent :class:`ChecklistStatsPayload`."""
+        return ChecklistStatsPayload(**{f.name: getattr(self, f.name) for f in fields(ChecklistStatsPayload)})
+
+
+_LAZY_GROUP_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "summary": (
+        "n_checklists", "n_species", "n_individuals", "n_completed_display", "protocol_rows",
+        "total_minutes", "total_hours", "total_days_dec", "total_months", "total_years",
+        "n_days_with_checklist", "n_shared", "shared_minutes", "shared_hours",
+        "n_days_birding_with_others", "total_km", "parkruns", "marathons", "times_equator",
+        "times_godwit",
+    ),
+    "streak": _STREAK_FIELDS,
+    "rankings": ("rankings",),
+    "yearly": ("years_list", "yearly_rows", "incomplete_by_year"),
+    "countries": ("country_sections",),
+    "not_seen_recently": ("country_not_seen_recently",),
+}
+_LAZY_GROUPS: Dict[str, Any] = {
+    "summary": lambda p: _summary_fields(p._inputs),
+    "streak": lambda p: _streak_fields(p._inputs),
+    "rankings": LazyChecklistStatsPayload._group_rankings,
+    "yearly": LazyChecklistStatsPayload._group_yearly,
+    "countries": LazyChecklistStatsPayload._group_countries,
+    "not_seen_recently": LazyChecklistStatsPayload._group_not_seen_recently,
+}
+_LAZY_FIELD_GROUPS: Dict[str, str] = {
+    name: group for group, names in _LAZY_GROUP_FIELDS.items() for name in names
+}
+# Groups filled by ``prefetch`` (the sections), and those whose rows depend on today's date.
+_SECTION_GROUPS = ("rankings", "yearly", "countries", "not_seen_recently")
+_GROUPS_USING_TODAY = frozenset({"rankings", "not_seen_recently"})
+
+
+def lazy_checklist_stats_payload(
+    df: pd.DataFrame,
+    top_n_limit: int,
+    *,
+    high_count_sort: str = "total_count",
+    high_count_tie_break: str = "last",
+    taxonomy_locale: str | None = None,
+    result_cache: ResultCache | None = None,
+) -> Optional[LazyChecklistStatsPayload]:
+    """Like :func:`compute_checklist_stats_payload`, but nothing is computed until a field is read.
+
+    Returns ``None`` when *df* is empty; field values equal the eager payload's. Field groups are
+    persisted in *result_cache* (when given and enabled), keyed by the frame's
+    :func:`~explorer.core.result_cache.frame_result_fingerprint` and every argument above.
+    """
+    if df.empty:
+        return None
+    inputs = _payload_inputs(
+        df,
+        top_n_limit,
+        high_count_sort=high_count_sort,
+        high_count_tie_break=high_count_tie_break,
+        taxonomy_locale=taxonomy_locale,
     )
-    country_sections = country_summary_stats(df, cl)
-
-    country_not_seen_recently: Dict[str, List[Any]] = {}
-    for ck, ys, rs in country_sections:
-        if not ys or not rs or ck == "_UNKNOWN":
-            continue
-        country_not_seen_recently[ck] = rankings_not_seen_recently_in_country(df, cl, ck)
-
-    return ChecklistStatsPayload(
-        n_checklists=n_checklists,
-        n_species=n_species,
-        n_individuals=n_individuals,
-        n_completed_display=n_completed,
-        protocol_rows=protocol_rows,
-        total_minutes=total_minutes,
-        total_hours=total_hours,
-        total_days_dec=total_days_dec,
-        total_months=total_months,
-        total_years=total_years,
-        n_days_with_checklist=n_days_with_checklist,
-        n_shared=n_shared,
-        shared_minutes=shared_minutes,
-        shared_hours=shared_hours,
-        n_days_birding_with_others=n_days_birding_with_others,
-        total_km=total_km,
-        parkruns=parkruns,
-        marathons=marathons,
-        times_equator=times_equator,
-        times_godwit=times_godwit,
-        streak=streak,
-        streak_start_date=streak_start_date,
-        streak_start_loc=streak_start_loc,
-        streak_start_sid=streak_start_sid,
-        streak_start_lid=streak_start_lid,
-        streak_end_date=streak_end_date,
-        streak_end_loc=streak_end_loc,
-        streak_end_sid=streak_end_sid,
-        streak_end_lid=streak_end_lid,
-        rankings=rankings,
-        years_list=years_list,
-        yearly_rows=yearly_rows,
-        incomplete_by_year=incomplete_by_year,
-        country_sections=country_sections,
-        country_not_seen_recently=country_not_seen_recently,
+    if result_cache is None or not result_cache.enabled:
+        return LazyChecklistStatsPayload(inputs)
+    cache_key = (
+        frame_result_fingerprint(df),
+        int(top_n_limit),
+        str(high_count_sort),
+        str(high_count_tie_break),
+        (taxonomy_locale or "").strip(),
     )
+    return LazyChecklistStatsPayload(inputs, result_cache, cache_key)
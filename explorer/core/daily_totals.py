@@ -0,0 +1,104 @@
+"""
+Per-day aggregate cube for instant date-range totals.
+
+Date-filtered banners need three numbers for the active range: distinct checklists, distinct
+countable species and total individuals. Recomputing them from rows costs a full ``nunique`` /
+``sum`` over the working frame on every date change. :class:`DailyTotals` is built once per dataset
+and answers any ``[start, end]`` range (same inclusive ``Date`` comparison as the working-set mask)
+from prefix sums and sorted first-seen days:
+
+- individuals — cumulative ``count_series`` per day (two lookups);
+- checklists — distinct ``(day, Submission ID)`` pairs; a checklist has a single date in eBird
+  exports, so this is also a prefix difference;
+- species — first-seen day per countable base species for ranges starting at the first day
+  (one ``searchsorted``), otherwise a ``bincount`` over the range's distinct species-day pairs
+  (far fewer than rows).
+
+Rows without a ``Date`` never fall inside a range; :meth:`DailyTotals.totals` without bounds
+returns whole-frame totals (including them), like an unfiltered working set.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from explorer.core.derived_columns import count_series, countable_base_series
+
+
+class RangeTotals(NamedTuple):
+    """Banner totals for a date range."""
+
+    checklists: int
+    species: int
+    individuals: int
+
+
+class _DistinctPerDay:
+    """Distinct non-missing *values* over day-index ranges."""
+
+    def __init__(self, values: pd.Series, day_code: np.ndarray, n_days: int) -> None:
+        codes, uniques = pd.factorize(values)
+        keep = codes >= 0
+        self._n_keys = n_keys = max(len(uniques), 1)
+        pairs = np.unique(day_code[keep].astype(np.int64) * n_keys + codes[keep])
+        pair_day = pairs // n_keys
+        self._pair_key = pairs % n_keys
+        self._day_offsets = np.searchsorted(pair_day, np.arange(n_days + 1), side="left")
+        # Pairs are day-ordered, so each key's first pair is its first-seen day.
+        _, first_ix = np.unique(self._pair_key, return_index=True)
+        self._first_days = np.sort(pair_day[first_ix])
+        self._one_day_per_key = len(pairs) == len(first_ix)
+
+    def count(self, lo: int, hi: int) -> int:
+        """Distinct keys seen on day indices ``[lo, hi)``."""
+        if lo >= hi:
+            return 0
+        if self._one_day_per_key:
+            return int(self._day_offsets[hi] - self._day_offsets[lo])
+        if lo == 0:
+            return int(np.searchsorted(self._first_days, hi, side="left"))
+        keys = self._pair_key[self._day_offsets[lo]:self._day_offsets[hi]]
+        return int(np.count_nonzero(np.bincount(keys, minlength=self._n_keys)))
+
+
+class DailyTotals:
+    """Checklists / species / individuals for any inclusive ``Date`` range of *df*."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        counts = count_series(df).to_numpy(dtype=np.int64)
+        base = countable_base_series(df)
+        self._all = RangeTotals(
+            checklists=int(df["Submission ID"].nunique()),
+            species=int(base.dropna().nunique()),
+            individuals=int(counts.sum()),
+        )
+        dates = df["Date"].to_numpy()
+        dated = ~np.isnat(dates)
+        self._days, day_code = np.unique(dates[dated], return_inverse=True)
+        n_days = len(self._days)
+        per_day = np.zeros(n_days, dtype=np.int64)
+        np.add.at(per_day, day_code, counts[dated])
+        self._cum_individuals = np.concatenate(([0], np.cumsum(per_day)))
+        self._checklists = _DistinctPerDay(df["Submission ID"][dated], day_code, n_days)
+        self._species = _DistinctPerDay(base[dated], day_code, n_days)
+
+    def totals(self, start: Optional[Any] = None, end: Optional[Any] = None) -> RangeTotals:
+        """Totals for rows with ``start <= Date <= end`` (either bound may be ``None``)."""
+        if start is None and end is None:
+            return self._all
+        lo = 0 if start is None else int(np.searchsorted(self._days, _as_datetime64(start), side="left"))
+        hi = len(self._days) if end is None else int(np.searchsorted(self._days, _as_datetime64(end), side="right"))
+        if lo >= hi:
+            return RangeTotals(0, 0, 0)
+        return RangeTotals(
+            checklists=self._checklists.count(lo, hi),
+            species=self._species.count(lo, hi),
+            individuals=int(self._cum_individuals[hi] - self._cum_individuals[lo]),
+        )
+
+
+def _as_datetime64(value: Any) -> np.datetime64:
+    return pd.Timestamp(value).to_datetime64()
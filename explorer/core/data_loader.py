@@ -6,11 +6,18 @@ Single entry point: load_dataset(path_or_file)
   dataset is non-empty, creates canonical datetime column, returns DataFrame.
 - Normalizes ``Protocol`` values to short labels (e.g. ``eBird - Traveling Count`` → ``Traveling``)
   when that column is present (see :func:`explorer.core.checklist_stats_compute.protocol_display_name`).
+- Optional **typed** mode (``typed=True``): repeated identifiers / names become ``category`` columns
+  and effort columns are forced numeric, which cuts memory and speeds up ``groupby`` / ``isin`` on
+  large exports. ``usecols`` prunes unused export columns (required columns are always kept).
+  See ``benchmarks/core_perf/loader_memory.py`` for a memory comparison.
+- Appends the canonical underscore columns (``_count``, ``_base``, ``_taxon``, ``_country_key``,
+  ``_year``, ``_date``) once; see :mod:`explorer.core.derived_columns`.
 """
 
 import pandas as pd
 
 from explorer.core.checklist_stats_compute import protocol_display_name
+from explorer.core.derived_columns import add_derived_columns
 
 
 # Columns required for the explorer to work; missing any of these raises a clear ValueError at load time.
@@ -27,6 +34,56 @@ REQUIRED_COLUMNS = [
     "Count",
 ]
 
+# Typed mode: low-cardinality repeated strings → ``category``.
+TYPED_CATEGORY_COLUMNS = (
+    "Location ID",
+    "Location",
+    "Common Name",
+    "Scientific Name",
+    "Submission ID",
+    "State/Province",
+    "County",
+    "Protocol",
+)
+
+# Typed mode: numeric effort / position columns (non-numeric cells → NaN).
+# ``Count`` stays text: eBird exports ``"X"`` for present-but-uncounted, which callers render as-is
+# (numeric use goes through :func:`explorer.core.stats.safe_count`).
+TYPED_NUMERIC_COLUMNS = (
+    "Latitude",
+    "Longitude",
+    "Duration (Min)",
+    "Distance Traveled (km)",
+    "Number of Observers",
+)
+
+
+# The two eBird time styles: 12-hour ``"09:37 PM"`` and 24-hour ``"23:59"`` (optional ``:SS``).
+_TIME_OF_DAY_RE = r"^(\d{1,2}):(\d{2})(?::(\d{2}))?(?:\s*([AaPp][Mm]))?$"
+
+
+def _time_of_day_seconds(times):
+    """
+    Seconds since midnight for unique time strings in either eBird style; NaN where unmatched.
+
+    Hours / minutes are validated per style (12h: 1–12, 24h: 0–23) so out-of-range values are left
+    to the ``format="mixed"`` fallback rather than silently wrapped.
+    """
+    parts = times.str.extract(_TIME_OF_DAY_RE)
+    hour = pd.to_numeric(parts[0], errors="coerce")
+    minute = pd.to_numeric(parts[1], errors="coerce")
+    second = pd.to_numeric(parts[2], errors="coerce").fillna(0)
+    meridiem = parts[3].str.upper()
+    is_12h = meridiem.notna()
+    valid = (
+        hour.notna()
+        & (minute <= 59)
+        & (second <= 59)
+        & ((is_12h & hour.between(1, 12)) | (~is_12h & (hour <= 23)))
+    )
+    hour_24 = hour.where(~is_12h, hour % 12 + 12 * (meridiem == "PM"))
+    return (hour_24 * 3600 + minute * 60 + second).where(valid)
+
 
 def add_datetime_column(df):
     """
@@ -39,27 +96,38 @@ def add_datetime_column(df):
       times are mapped to ``"23:59"`` so those rows sort to the **end** of
       their day.  eBird exports ``"00:00"`` when no observation time was
       recorded; real midnight checklists do not occur.
-    - Adds column ``"datetime"`` (``datetime64[ns]``).
+    - Adds column ``"datetime"`` (same unit as ``Date``, e.g. ``datetime64[us]``).
+
+    Times are parsed once per **unique** string (a day has at most 1440 minutes per style) and
+    added to the date as integer seconds. Strings matching neither eBird style fall back to the
+    per-row ``format="mixed"`` parse, so odd values behave exactly as before.
     """
     df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
     df["Time"] = df["Time"].fillna("00:00")
     # Build a 24-hour time string for the canonical column.
     # "00:00" means "no time recorded" in eBird exports → treat as 23:59.
     time_str = df["Time"].astype(str).str.strip().replace("00:00", "23:59").replace("", "23:59")
-    date_str = df["Date"].dt.strftime("%Y-%m-%d").fillna("")
-    # format="mixed" lets pandas parse each entry independently — critical
-    # because eBird exports use 12h AM/PM ("09:37 PM") while the 23:59
-    # replacement is 24h; a single inferred format would silently NaT one style.
-    df["datetime"] = pd.to_datetime(
-        date_str + " " + time_str, format="mixed", errors="coerce",
-    )
-    # Missing date must yield NaT (pandas 3+ can parse time-only as year 1 otherwise)
-    missing_date = date_str == ""
-    df.loc[missing_date, "datetime"] = pd.NaT
+    codes, uniques = pd.factorize(time_str)
+    unique_seconds = _time_of_day_seconds(pd.Series(uniques, dtype="str")).to_numpy()
+    seconds = unique_seconds[codes]
+    day = df["Date"].dt.normalize()
+    out = day + pd.to_timedelta(seconds, unit="s")
+    out = out.astype(day.dtype)
+
+    unmatched = pd.isna(seconds) & day.notna().to_numpy()
+    if unmatched.any():
+        # format="mixed" lets pandas parse each entry independently — kept for anything outside
+        # the two known styles so malformed times still become NaT instead of raising.
+        date_str = df["Date"][unmatched].dt.strftime("%Y-%m-%d")
+        out[unmatched] = pd.to_datetime(
+            date_str + " " + time_str[unmatched], format="mixed", errors="coerce",
+        ).astype(day.dtype)
+    # Missing date yields NaT via day + offset (pandas 3+ would parse time-only as year 1).
+    df["datetime"] = out
     return df
 
 
-def load_dataset(path_or_file):
+def load_dataset(path_or_file, *, typed=False, usecols=None):
     """
     Load the eBird dataset from CSV and return a DataFrame ready for use.
 
@@ -67,9 +135,19 @@ def load_dataset(path_or_file):
     - Validates that all required columns (see REQUIRED_COLUMNS) exist; raises ValueError with a clear message if any are missing.
     - Raises ValueError if the dataset has no data rows (empty file or headers-only).
     - Creates the canonical datetime column (Date + Time → datetime).
+    - Adds derived underscore columns (:func:`explorer.core.derived_columns.add_derived_columns`).
     - Returns the DataFrame; does not change column names, sorting, or downstream behaviour.
+    - ``typed=True`` applies :data:`TYPED_CATEGORY_COLUMNS` / :data:`TYPED_NUMERIC_COLUMNS` dtypes.
+    - ``usecols`` (iterable of names) keeps only those columns plus REQUIRED_COLUMNS; names not in
+      the file are ignored.
     """
-    df = pd.read_csv(path_or_file, encoding="utf-8")
+    read_kwargs = {"encoding": "utf-8"}
+    if usecols is not None:
+        keep = set(usecols) | set(REQUIRED_COLUMNS)
+        read_kwargs["usecols"] = lambda c: c in keep
+    if typed:
+        read_kwargs["dtype"] = {c: "category" for c in TYPED_CATEGORY_COLUMNS if c != "Protocol"}
+    df = pd.read_csv(path_or_file, **read_kwargs)
     missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
     if missing:
         raise ValueError(f"Dataset missing required columns: {missing}")
@@ -78,6 +156,20 @@ def load_dataset(path_or_file):
     df = add_datetime_column(df)
     if "Protocol" in df.columns:
         df = _normalize_protocol_column(df)
+    df = add_derived_columns(df)
+    if typed:
+        df = _apply_typed_dtypes(df)
+    return df
+
+
+def _apply_typed_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast typed-mode columns in place (``Protocol`` is categorised after normalisation)."""
+    for col in TYPED_NUMERIC_COLUMNS:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in TYPED_CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
     return df
 
 
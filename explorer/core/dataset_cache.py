@@ -0,0 +1,151 @@
+"""
+On-disk columnar cache of the parsed eBird export.
+
+Cold starts re-parse the whole ``MyEBirdData.csv`` (including the ``format="mixed"`` datetime parse
+in :func:`explorer.core.data_loader.add_datetime_column`). After the first successful load we write
+the **parsed** frame to a Parquet sidecar keyed by:
+
+- a SHA-256 **content fingerprint** of the CSV bytes (not mtime — OneDrive/Dropbox touch mtimes), and
+- :data:`DATASET_CACHE_SCHEMA_VERSION` — bump whenever :func:`~explorer.core.data_loader.load_dataset`
+  changes the columns or dtypes it returns, so stale sidecars are ignored.
+
+Later loads memory-map the sidecar and skip CSV parsing, datetime parsing and protocol normalisation.
+
+Loaded frames carry their content fingerprint in ``df.attrs[DATASET_FINGERPRINT_ATTR]`` so per-dataset
+resources (e.g. :class:`explorer.core.working_set.WorkingSetEngine`) can be keyed without rehashing.
+
+The cache is **best-effort**: a missing ``pyarrow``, a read-only folder or a corrupt file silently falls
+back to the CSV loader. Only the newest sidecar per cache folder is kept.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import os
+import tempfile
+from typing import Callable
+
+import pandas as pd
+
+from explorer.core.data_loader import load_dataset
+
+# Bump when load_dataset output (columns, dtypes, derived values) changes.
+DATASET_CACHE_SCHEMA_VERSION = 2
+
+# ``DataFrame.attrs`` key holding the export's content fingerprint (see dataset_frame_fingerprint).
+DATASET_FINGERPRINT_ATTR = "explorer_dataset_fingerprint"
+
+_CACHE_FILE_PREFIX = "dataset-"
+_CACHE_FILE_SUFFIX = ".parquet"
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def dataset_file_fingerprint(path: str) -> str:
+    """Return the SHA-256 hex digest of the file at *path* (streamed in 1 MiB chunks)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def dataset_frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Content fingerprint of a loaded export frame.
+
+    Uses the fingerprint stamped at load time when present; otherwise hashes the frame contents
+    (slower; hand-built frames and tests).
+    """
+    stamped = df.attrs.get(DATASET_FINGERPRINT_ATTR)
+    if stamped:
+        return str(stamped)
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    h = hashlib.sha256(row_hashes.tobytes())
+    h.update(",".join(map(str, df.columns)).encode("utf-8"))
+    return "frame-" + h.hexdigest()
+
+
+def dataset_cache_path(cache_dir: str, fingerprint: str) -> str:
+    """Sidecar path for *fingerprint* under *cache_dir* (schema version is part of the name)."""
+    name = f"{_CACHE_FILE_PREFIX}v{DATASET_CACHE_SCHEMA_VERSION}-{fingerprint}{_CACHE_FILE_SUFFIX}"
+    return os.path.join(cache_dir, name)
+
+
+def read_cached_dataset(cache_dir: str, fingerprint: str) -> pd.DataFrame | None:
+    """Return the cached frame for *fingerprint*, or ``None`` on miss / unreadable cache."""
+    path = dataset_cache_path(cache_dir, fingerprint)
+    if not os.path.isfile(path):
+        return None
+    try:
+        return pd.read_parquet(path, memory_map=True)
+    except Exception:
+        return None
+
+
+def write_cached_dataset(df: pd.DataFrame, cache_dir: str, fingerprint: str) -> bool:
+    """
+    Write *df* as the sidecar for *fingerprint*; return ``True`` on success.
+
+    Writes to a temp file and ``os.replace``-s it into place so readers never see a partial file.
+    Older sidecars in *cache_dir* are removed after a successful write.
+    """
+    try:
+        import pyarrow  # noqa: F401  (optional: Parquet engine)
+    except ImportError:
+        return False
+    path = dataset_cache_path(cache_dir, fingerprint)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        tmp_path = None
+    except Exception:
+        return False
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    _prune_stale_sidecars(cache_dir, keep=path)
+    return True
+
+
+def _prune_stale_sidecars(cache_dir: str, *, keep: str) -> None:
+    pattern = os.path.join(cache_dir, f"{_CACHE_FILE_PREFIX}*{_CACHE_FILE_SUFFIX}")
+    for old in glob.glob(pattern):
+        if os.path.abspath(old) == os.path.abspath(keep):
+            continue
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+
+def load_dataset_with_cache(
+    path: str,
+    cache_dir: str,
+    *,
+    loader: Callable[[str], pd.DataFrame] = load_dataset,
+) -> pd.DataFrame:
+    """
+    Load the export at *path*, preferring the Parquet sidecar in *cache_dir*.
+
+    On a miss the CSV is loaded with *loader* (validation errors propagate unchanged) and the result
+    is written back for the next cold start. The returned frame is stamped with its content
+    fingerprint (:data:`DATASET_FINGERPRINT_ATTR`).
+    """
+    try:
+        fingerprint = dataset_file_fingerprint(path)
+    except OSError:
+        return loader(path)
+    df = read_cached_dataset(cache_dir, fingerprint)
+    if df is None:
+        df = loader(path)
+        write_cached_dataset(df, cache_dir, fingerprint)
+    df.attrs[DATASET_FINGERPRINT_ATTR] = fingerprint
+    return df
@@ -0,0 +1,111 @@
+"""
+Canonical derived columns, computed once at load time.
+
+:func:`add_derived_columns` (called by :func:`explorer.core.data_loader.load_dataset`) appends internal
+underscore columns that many tabs used to recompute from the raw export on every rerun:
+
+- ``_count`` — ``int64`` individuals per row (:func:`explorer.core.stats.safe_count` semantics; ``X`` → 0).
+- ``_base`` — countable base species (genus + species, lowercased), missing for spuhs / slashes /
+  hybrids / domestics (same as :func:`explorer.core.species_logic.countable_species_vectorized`).
+- ``_taxon`` — full scientific name stripped + lowercased (subspecies-level lifer key).
+- ``_country_key`` — per-row :func:`explorer.core.stats.checklist_country_keys` value.
+- ``_year`` — ``Date.dt.year``.
+- ``_date`` — ``Date`` normalised to midnight (calendar day).
+
+Consumers call the ``*_series`` accessors below: they return the stored column when present and
+otherwise compute the same values, so hand-built test frames (and uploads from older caches) keep
+working. Because the columns derive only from export columns, row filters / copies of the loaded
+frame stay consistent with them; do not edit ``Count`` / names / dates in place after load.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from explorer.core.species_logic import countable_species_vectorized
+
+DERIVED_COLUMNS = ("_count", "_base", "_taxon", "_country_key", "_year", "_date")
+
+# int() accepts surrounding whitespace, a sign and digit-group underscores ("1_000").
+_INT_LITERAL_RE = r"^\s*[+-]?\d+(?:_\d+)*\s*$"
+
+
+def safe_count_vectorized(values: pd.Series) -> pd.Series:
+    """Vectorised :func:`explorer.core.stats.safe_count` over a ``Count`` column (``int64``)."""
+    if pd.api.types.is_numeric_dtype(values):
+        # astype truncates toward zero, like int().
+        return values.fillna(0).astype("int64")
+    if values.dtype == object:
+        # Mixed Python objects (hand-built frames): keep exact per-value semantics.
+        from explorer.core.stats import safe_count  # local: stats imports this module
+
+        return values.map(safe_count).astype("int64")
+    s = values.astype("str")
+    is_int = s.str.match(_INT_LITERAL_RE, na=False)
+    out = pd.Series(0, index=values.index, dtype="int64")
+    if is_int.any():
+        out[is_int] = s[is_int].str.replace("_", "", regex=False).str.strip().astype("int64")
+    return out
+
+
+def count_series(df: pd.DataFrame) -> pd.Series:
+    """Per-row individuals (``_count`` when present)."""
+    if "_count" in df.columns:
+        return df["_count"]
+    return safe_count_vectorized(df["Count"])
+
+
+def countable_base_series(df: pd.DataFrame) -> pd.Series:
+    """Countable base species per row (``_base`` when present)."""
+    if "_base" in df.columns:
+        return df["_base"]
+    return countable_species_vectorized(df)
+
+
+def taxon_series(df: pd.DataFrame) -> pd.Series:
+    """Lowercased full scientific name per row (``_taxon`` when present)."""
+    if "_taxon" in df.columns:
+        return df["_taxon"]
+    return df["Scientific Name"].str.strip().str.lower()
+
+
+def year_series(df: pd.DataFrame) -> pd.Series:
+    """Calendar year of ``Date`` per row (``_year`` when present)."""
+    if "_year" in df.columns:
+        return df["_year"]
+    return df["Date"].dt.year
+
+
+def date_series(df: pd.DataFrame) -> pd.Series:
+    """``Date`` normalised to midnight per row (``_date`` when present)."""
+    if "_date" in df.columns:
+        return df["_date"]
+    return df["Date"].dt.normalize()
+
+
+def country_key_series(df: pd.DataFrame) -> pd.Series:
+    """Per-row country grouping key (``_country_key`` when present).
+
+    Computed once per distinct ``Country`` / ``State/Province`` value and broadcast back.
+    """
+    if "_country_key" in df.columns:
+        return df["_country_key"]
+    from explorer.core.stats import checklist_country_keys  # local: stats imports this module
+
+    src = "Country" if "Country" in df.columns else "State/Province" if "State/Province" in df.columns else None
+    if src is None or df.empty:
+        return checklist_country_keys(df)
+    codes, uniques = pd.factorize(df[src], use_na_sentinel=False)
+    keys = checklist_country_keys(pd.DataFrame({src: pd.Series(uniques, dtype=object)}))
+    return pd.Series(keys.to_numpy()[codes], index=df.index)
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Return *df* with :data:`DERIVED_COLUMNS` added (computed from export columns; in place)."""
+    df["_count"] = safe_count_vectorized(df["Count"])
+    df["_base"] = countable_species_vectorized(df)
+    df["_taxon"] = df["Scientific Name"].str.strip().str.lower()
+    df["_country_key"] = country_key_series(df)
+    df["_year"] = df["Date"].dt.year
+    df["_date"] = df["Date"].dt.normalize()
+    return df
@@ -20,8 +20,8 @@ from typing import Iterable
 
 import pandas as pd
 
-from explorer.core.species_logic import countable_species_vectorized, filter_species
-from explorer.core.stats import safe_count
+from explorer.core.derived_columns import count_series, countable_base_series
+from explorer.core.species_logic import filter_species
 
 UNMAPPED_FAMILY_LABEL = "Unmapped"
 
@@ -91,7 +91,7 @@ def prepare_family_map_work_frame(
     if df.empty:
         return pd.DataFrame()
     work = df.copy()
-    work["_base"] = countable_species_vectorized(work)
+    work["_base"] = countable_base_series(work)
     work = work[work["_base"].notna()].copy()
     work["_base"] = work["_base"].astype(str).str.strip()
     fam_series = work["_base"].map(lambda b: base_to_family.get(b))
@@ -153,7 +153,7 @@ def selected_species_checklist_individual_counts(
     if sub.empty:
         return None
     n_ck = int(sub["Submission ID"].nunique())
-    n_ind = int(sub["Count"].apply(safe_count).sum())
+    n_ind = int(count_series(sub).sum())
     return (n_ck, n_ind)
 
 
@@ -0,0 +1,122 @@
+"""
+"As of date" index over first-seen days for life, year and country lists.
+
+"What was my life list on D?" needs the first day each countable base species was recorded — globally,
+per country or within a calendar year — and then only the species whose first day is on or before D.
+:class:`LifeListIndex` is built once per dataset from the load-time derived columns (``_base``,
+``_date``, ``_country_key``; see :mod:`explorer.core.derived_columns`) and keeps, per list, the
+distinct species ordered by first-seen day. Any as-of query is then one ``searchsorted`` (count) or a
+slice of that order (species), never a rescan of the export.
+
+Lists follow the checklist-statistics rules: countable base species only, rows without a ``Date``
+ignored, country = the checklist's country key (``_UNKNOWN`` when the region is missing).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from explorer.core.derived_columns import countable_base_series, country_key_series, date_series
+
+
+class _FirstSeenDays:
+    """Distinct species ordered by first-seen day (ties by name)."""
+
+    def __init__(self, first_days: pd.Series) -> None:
+        ordered = (
+            first_days.rename("_day")
+            .rename_axis("_base")
+            .reset_index()
+            .sort_values(["_day", "_base"], kind="stable")
+        )
+        self._days = ordered["_day"].to_numpy(dtype="datetime64[ns]")
+        self._names: List[str] = ordered["_base"].astype(str).tolist()
+        self._first_day = dict(zip(self._names, self._days))
+
+    def count(self, as_of: Optional[np.datetime64]) -> int:
+        if as_of is None:
+            return len(self._names)
+        return int(np.searchsorted(self._days, as_of, side="right"))
+
+    def species(self, as_of: Optional[np.datetime64]) -> List[str]:
+        return self._names[: self.count(as_of)]
+
+    def first_seen(self, base_species: str) -> Optional[pd.Timestamp]:
+        day = self._first_day.get(base_species)
+        return None if day is None else pd.Timestamp(day)
+
+
+_EMPTY = _FirstSeenDays(pd.Series(dtype="datetime64[ns]"))
+
+
+class LifeListIndex:
+    """Life / year / country lists of *df* as of any day, from first-seen days per base species."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        base = countable_base_series(df)
+        days = date_series(df)
+        keep = (base.notna() & days.notna()).to_numpy()
+        facts = pd.DataFrame(
+            {
+                "_base": base.to_numpy(dtype=object)[keep],
+                "_day": days.to_numpy()[keep],
+                "_country_key": country_key_series(df).to_numpy(dtype=object)[keep],
+            }
+        )
+        facts["_year"] = facts["_day"].dt.year
+        self._life = _FirstSeenDays(facts.groupby("_base")["_day"].min())
+        self._by_country = _split_first_days(facts.groupby(["_country_key", "_base"])["_day"].min())
+        self._by_year = _split_first_days(facts.groupby(["_year", "_base"])["_day"].min())
+
+    @property
+    def countries(self) -> Tuple[str, ...]:
+        """Country keys with at least one countable dated observation (sorted)."""
+        return tuple(sorted(self._by_country, key=str))
+
+    @property
+    def years(self) -> Tuple[int, ...]:
+        """Calendar years with at least one countable dated observation (ascending)."""
+        return tuple(sorted(int(y) for y in self._by_year))
+
+    def _list(self, country: Optional[str], year: Optional[int]) -> _FirstSeenDays:
+        if country is not None and year is not None:
+            raise ValueError("Pass country or year, not both.")
+        if country is not None:
+            return self._by_country.get(country, _EMPTY)
+        if year is not None:
+            return self._by_year.get(int(year), _EMPTY)
+        return self._life
+
+    def count(self, as_of: Optional[Any] = None, *, country: Optional[str] = None, year: Optional[int] = None) -> int:
+        """Size of the life list (or *country* / *year* list) on day *as_of* (inclusive; ``None`` = all)."""
+        return self._list(country, year).count(_as_day(as_of))
+
+    def species(
+        self, as_of: Optional[Any] = None, *, country: Optional[str] = None, year: Optional[int] = None
+    ) -> List[str]:
+        """Base species on that list on day *as_of*, in the order they were first seen."""
+        return self._list(country, year).species(_as_day(as_of))
+
+    def first_seen(
+        self, base_species: str, *, country: Optional[str] = None, year: Optional[int] = None
+    ) -> Optional[pd.Timestamp]:
+        """First day *base_species* was recorded (globally, in *country* or in *year*); ``None`` if never."""
+        return self._list(country, year).first_seen(base_species)
+
+
+def _split_first_days(first_days: pd.Series) -> Dict[Any, _FirstSeenDays]:
+    """``(group, base) → day`` series to one :class:`_FirstSeenDays` per group."""
+    return {
+        key: _FirstSeenDays(part.droplevel(0))
+        for key, part in first_days.groupby(level=0, sort=False)
+    }
+
+
+def _as_day(value: Optional[Any]) -> Optional[np.datetime64]:
+    """Midnight of *value* as ``datetime64[ns]`` (a list "as of" a day includes the whole day)."""
+    if value is None:
+        return None
+    return pd.Timestamp(value).normalize().to_datetime64().astype("datetime64[ns]")
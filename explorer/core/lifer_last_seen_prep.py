@@ -4,8 +4,13 @@ Lifer and last-seen lookup preparation from the full (unfiltered) dataset.
 Feeds map pin highlighting and species-banner “first/last seen” dates. Pure data prep — no widgets
 or HTML — so the same logic works in Streamlit and tests.
 
-The sorted lookup frame uses internal columns ``_base`` and ``_taxon``; see the comment on the
-``.assign`` in :func:`prepare_lifer_last_seen`.
+The lookup frame uses internal columns ``_base`` and ``_taxon``; see the comment on the ``.assign``
+in :func:`prepare_lifer_last_seen`. It holds only the first and last rows per base species and per
+taxon (chronological), not a sorted copy of the export: every consumer reads the first / last row
+of a ``_base`` / ``_taxon`` (optionally at one location), which that subset answers identically.
+
+:func:`lifer_last_seen_prep_for` memoises the prep per dataset fingerprint, so map rebuilds after a
+date-filter change reuse it.
 """
 
 from __future__ import annotations
@@ -14,17 +19,20 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Tuple, TypedDict
 
+import numpy as np
 import pandas as pd
 
+from explorer.core.derived_columns import taxon_series
+from explorer.core.result_cache import FrameMemo
 from explorer.core.species_logic import (
     base_species_for_lifer as _default_base_species_for_lifer,
-    countable_species_vectorized,
+    species_classification_frame,
 )
 
 
 @dataclass(frozen=True)
 class LiferLastSeenPrep:
-    """Chronologically sorted rows with taxon/base columns and location lookups."""
+    """First / last rows per base species and taxon (chronological) and their location lookups."""
 
     lifer_lookup_df: pd.DataFrame
     true_lifer_locations: Dict[str, object]
@@ -46,38 +54,78 @@ def prepare_lifer_last_seen(
 
     Subspecies roll up to base species (genus + species) for nominate-style lifers; full
     scientific string (lowercased) is used as taxon key for subspecies-level selection.
+
+    First / last rows come from ``idxmin`` / ``idxmax`` on ``datetime`` per key (no sort of the
+    export). Rows sharing the earliest (latest) time resolve to the first (last) in export order,
+    as with a stable chronological sort. *base_species_fn* runs once per distinct scientific name.
     """
     fn = base_species_fn or _default_base_species_for_lifer
-    lifer_lookup_df = (
-        full_df.sort_values("datetime")
-        .dropna(subset=["Scientific Name", "Location ID", "datetime"])
-        .assign(
-            # Internal columns (not export): _base = genus+species lifer key; _taxon = full sci string lowercased (subspecies lifers).
-            _base=lambda x: x["Scientific Name"].apply(fn),
-            _taxon=lambda x: x["Scientific Name"].str.strip().str.lower(),
-        )
+    rows = full_df.dropna(subset=["Scientific Name", "Location ID", "datetime"])
+    # One classification per distinct (scientific, common) pair, broadcast to rows.
+    cls = species_classification_frame(rows)
+    if fn is _default_base_species_for_lifer:
+        base = cls["base"]
+    else:
+        codes, uniques = pd.factorize(rows["Scientific Name"])
+        base = pd.Series(np.asarray([fn(u) for u in uniques], dtype=object)[codes], index=rows.index)
+    rows = rows.assign(
+        # Internal columns (not export): _base = genus+species lifer key; _taxon = full sci string lowercased (subspecies lifers).
+        _base=base,
+        _taxon=taxon_series,
     )
-    lifer_lookup_df = lifer_lookup_df[lifer_lookup_df["_base"].notna()]
     # Lifer pins should match the app's "countable species" rules:
     # exclude spuhs/hybrids/domestics and species-level slashes.
     # Keep subspecies (including slash later in the scientific name) intact.
-    if "Common Name" not in lifer_lookup_df.columns:
-        lifer_lookup_df = lifer_lookup_df.assign(**{"Common Name": pd.NA})
-    countable_mask = countable_species_vectorized(lifer_lookup_df).notna()
-    lifer_lookup_df = lifer_lookup_df[countable_mask]
-    true_lifer_locations = lifer_lookup_df.groupby("_base").first()["Location ID"].to_dict()
-    true_last_seen_locations = lifer_lookup_df.groupby("_base").last()["Location ID"].to_dict()
-    true_lifer_locations_taxon = lifer_lookup_df.groupby("_taxon").first()["Location ID"].to_dict()
-    true_last_seen_locations_taxon = lifer_lookup_df.groupby("_taxon").last()["Location ID"].to_dict()
+    if "Common Name" not in rows.columns:
+        rows = rows.assign(**{"Common Name": pd.NA})
+    rows = rows[base.notna() & cls["countable"]]
+
+    dt = pd.Series(rows["datetime"].to_numpy(), index=np.arange(len(rows)))
+    first_base, last_base = _first_last_positions(dt, rows["_base"])
+    first_taxon, last_taxon = _first_last_positions(dt, rows["_taxon"])
+    keep = np.unique(np.concatenate([
+        s.to_numpy(dtype=np.int64) for s in (first_base, last_base, first_taxon, last_taxon)
+    ]))
+    lifer_lookup_df = rows.iloc[keep].sort_values("datetime", kind="stable")
+    location_ids = rows["Location ID"].to_numpy(dtype=object)
     return LiferLastSeenPrep(
         lifer_lookup_df=lifer_lookup_df,
-        true_lifer_locations=true_lifer_locations,
-        true_last_seen_locations=true_last_seen_locations,
-        true_lifer_locations_taxon=true_lifer_locations_taxon,
-        true_last_seen_locations_taxon=true_last_seen_locations_taxon,
+        true_lifer_locations=_locations_at(first_base, location_ids),
+        true_last_seen_locations=_locations_at(last_base, location_ids),
+        true_lifer_locations_taxon=_locations_at(first_taxon, location_ids),
+        true_last_seen_locations_taxon=_locations_at(last_taxon, location_ids),
     )
 
 
+def _first_last_positions(dt: pd.Series, keys: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Positions of the earliest and latest row per key (sorted keys; ties → first / last row)."""
+    k = keys.to_numpy(dtype=object)
+    first = dt.groupby(k, sort=True).idxmin()
+    # idxmax keeps the first of tied maxima, so scan backwards to get the last one.
+    last = dt.iloc[::-1].groupby(k[::-1], sort=True).idxmax()
+    return first, last
+
+
+def _locations_at(positions: pd.Series, location_ids: np.ndarray) -> Dict[str, object]:
+    return dict(zip(positions.index.tolist(), location_ids[positions.to_numpy(dtype=np.int64)].tolist()))
+
+
+_PREP_MEMO: FrameMemo[LiferLastSeenPrep] = FrameMemo(prepare_lifer_last_seen)
+
+
+def lifer_last_seen_prep_for(
+    full_df: pd.DataFrame,
+    base_species_fn: Callable[[object], object] | None = None,
+) -> LiferLastSeenPrep:
+    """:func:`prepare_lifer_last_seen`, memoised per dataset fingerprint and *base_species_fn*.
+
+    Keyed by :func:`~explorer.core.result_cache.frame_result_fingerprint` (export stamp + row index
+    labels for loaded exports), so a fresh copy of the same rows hits; see
+    :class:`~explorer.core.result_cache.FrameMemo`. Treat the result as read-only.
+    """
+    return _PREP_MEMO.get(full_df, base_species_fn)
+
+
 class LiferSiteEntry(TypedDict):
     """One species line in a lifer-location popup (base and/or subspecies lifer semantics).
 
@@ -138,26 +186,24 @@ def aggregate_lifer_sites(
             existing["is_taxon_lifer"] = existing["is_taxon_lifer"] or bool(is_taxon)
         global_sci.add(sci)
 
+    base_names = _first_row_names(lifer_lookup_df, "_base")
     for _base, lid in true_lifer_locations.items():
-        subset = lifer_lookup_df[lifer_lookup_df["_base"] == _base]
-        if subset.empty:
+        names = base_names.get(_base)
+        if names is None:
             continue
-        r = subset.iloc[0]
-        sci = str(r["Scientific Name"])
-        com = "" if pd.isna(r.get("Common Name")) else str(r["Common Name"])
+        sci, com = names
         _add(lid, sci, com, is_base=True, is_taxon=False)
 
+    taxon_names = _first_row_names(lifer_lookup_df, "_taxon")
     for _taxon, lid in true_lifer_locations_taxon.items():
-        subset = lifer_lookup_df[lifer_lookup_df["_taxon"] == _taxon]
-        if subset.empty:
+        names = taxon_names.get(_taxon)
+        if names is None:
             continue
-        r = subset.iloc[0]
-        sci = str(r["Scientific Name"])
+        sci, com = names
         # Only treat taxon-level lifers as "subspecies lifers" when the scientific name has 3+ parts.
         # A 2-part name duplicates the base-species lifer and must not create a spurious extra pin.
         if len(sci.strip().split()) < 3:
             continue
-        com = "" if pd.isna(r.get("Common Name")) else str(r["Common Name"])
         _add(lid, sci, com, is_base=False, is_taxon=True)
 
     sorted_by_loc = {
@@ -181,12 +227,26 @@ def count_subspecies_lifer_taxa(
 
     Matches the rule in :func:`aggregate_lifer_sites` — from underlying prep data only, not map markers.
     """
+    taxon_names = _first_row_names(lifer_lookup_df, "_taxon")
     n = 0
     for taxon in true_lifer_locations_taxon:
-        subset = lifer_lookup_df[lifer_lookup_df["_taxon"] == taxon]
-        if subset.empty:
-            continue
-        sci = str(subset.iloc[0]["Scientific Name"])
-        if len(sci.strip().split()) >= 3:
+        names = taxon_names.get(taxon)
+        if names is not None and len(names[0].strip().split()) >= 3:
             n += 1
     return n
+
+
+def _first_row_names(lifer_lookup_df: pd.DataFrame, key: str) -> Dict[Any, Tuple[str, str]]:
+    """``key value -> (scientific name, common name)`` of its first row in *lifer_lookup_df*.
+
+    One ``drop_duplicates`` over the (chronologically sorted) lookup frame instead of a boolean
+    scan per key; a missing common name becomes ``""``.
+    """
+    keyed = lifer_lookup_df[lifer_lookup_df[key].notna()]
+    first = keyed.drop_duplicates(subset=[key], keep="first")
+    sci = [str(v) for v in first["Scientific Name"].tolist()]
+    if "Common Name" in first.columns:
+        common = ["" if pd.isna(v) else str(v) for v in first["Common Name"].tolist()]
+    else:
+        common = [""] * len(first)
+    return dict(zip(first[key].tolist(), zip(sci, common)))
@@ -0,0 +1,44 @@
+"""
+Lazy per-location record groups for map popups.
+
+Map prep used to build ``{lid: grp for lid, grp in df.groupby("Location ID")}`` on every working-set
+rebuild, allocating one sub-DataFrame per location even though only the popups actually opened (or
+not yet in the popup HTML cache) ever read them. :class:`LocationRecords` keeps one row-position
+array per location (``groupby(...).indices``) and slices the frame on lookup.
+
+It is a read-only :class:`~collections.abc.Mapping`, so ``.get(lid, pd.DataFrame())``, ``in``,
+``keys()`` and iteration behave like the former dict. Lookups return the same rows, index and order
+as the matching ``groupby`` group. The source frame must not be mutated afterwards.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+class LocationRecords(Mapping[Hashable, pd.DataFrame]):
+    """Read-only ``Location ID → rows`` view over *df*, built from group row positions."""
+
+    def __init__(self, df: pd.DataFrame, key: str = "Location ID") -> None:
+        self._df = df
+        # Sorted keys (like iterating ``groupby``); missing keys are dropped the same way.
+        self._positions: dict[Hashable, np.ndarray] = df.groupby(key, sort=True).indices if len(df) else {}
+
+    def __getitem__(self, lid: Hashable) -> pd.DataFrame:
+        return self._df.iloc[self._positions[lid]]
+
+    def __contains__(self, lid: object) -> bool:
+        return lid in self._positions
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def positions(self, lid: Hashable) -> np.ndarray:
+        """Row positions of *lid* in the source frame (ascending)."""
+        return self._positions[lid]
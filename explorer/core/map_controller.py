@@ -17,8 +17,7 @@ This module keeps the public entry point and normalises *map_view_mode*.
 
 from __future__ import annotations
 
-from collections import OrderedDict
-from typing import Any, Dict, Hashable, MutableMapping, Optional, Tuple
+from typing import Any, Dict, Hashable, Mapping, MutableMapping, Optional, Tuple
 
 import pandas as pd
 
@@ -42,9 +41,9 @@ def build_species_overlay_map(
     *,
     df: pd.DataFrame,
     location_data: pd.DataFrame,
-    records_by_loc: Dict[Hashable, pd.DataFrame],
+    records_by_loc: Mapping[Hashable, pd.DataFrame],
     effective_location_data: pd.DataFrame,
-    effective_records_by_loc: Dict[Hashable, pd.DataFrame],
+    effective_records_by_loc: Mapping[Hashable, pd.DataFrame],
     effective_totals: Tuple[int, int, int, int],
     effective_use_full: bool,
     lifer_lookup_df: pd.DataFrame,
@@ -65,8 +64,6 @@ def build_species_overlay_map(
     species_url_fn: SpeciesUrlFn = None,
     base_species_fn: BaseSpeciesFn = base_species_for_lifer,
     popup_html_cache: MutableMapping[Tuple[Any, ...], str],
-    filtered_by_loc_cache: OrderedDict,
-    filtered_by_loc_cache_max: int = 60,
     map_view_mode: str = "all",
     full_location_data: Optional[pd.DataFrame] = None,
     taxonomy_locale: str = "",
@@ -86,8 +83,9 @@ def build_species_overlay_map(
     ``"lifers"``, *selected_species* is ignored; *full_location_data* must be the
     full-export location table (same scope as lifer prep).
 
-    *popup_html_cache* and *filtered_by_loc_cache* are mutated by this function
-    (session caches; same contract as the UI). Popup cache keys include
+    *popup_html_cache* is mutated by this function (session cache; same contract as the UI).
+    Species locations and sightings come from the per-dataset
+    :mod:`explorer.core.species_location_index`, so nothing else is cached per species. Popup cache keys include
     *taxonomy_locale* so eBird species links refresh when the locale changes (Streamlit Settings).
 
     *date_filter_status*: optional extra muted line on map banners (e.g. date range). The Streamlit
@@ -165,8 +163,6 @@ def build_species_overlay_map(
         species_url_fn=species_url_fn,
         base_species_fn=base_species_fn,
         popup_html_cache=popup_html_cache,
-        filtered_by_loc_cache=filtered_by_loc_cache,
-        filtered_by_loc_cache_max=filtered_by_loc_cache_max,
         tax_loc_key=tax_loc_key,
         map_height_px=map_height_px,
         visit_marker_scheme=visit_marker_scheme,
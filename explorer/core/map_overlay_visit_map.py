@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import json
-from collections import OrderedDict
-from typing import Any, Dict, Hashable, Literal, MutableMapping, Optional, Tuple, cast
+from typing import Any, Dict, Hashable, Literal, Mapping, MutableMapping, Optional, Tuple
 
 import folium
 import pandas as pd
@@ -73,8 +72,8 @@ from explorer.presentation.map_renderer import (
     resolve_lifer_last_seen,
 )
 from explorer.presentation.map_ui_constants import MAP_POPUP_MAX_WIDTH_PX
-from explorer.core.species_logic import filter_species
-from explorer.core.stats import safe_count
+from explorer.core.species_facts import first_last_seen_for, species_facts_for
+from explorer.core.species_location_index import species_location_index_for
 
 
 def _epsilon_bounds_around_point(lat: float, lon: float, delta: float = 0.02) -> list[list[float]]:
@@ -304,9 +303,9 @@ def build_visit_overlay_map(
     *,
     df: pd.DataFrame,
     location_data: pd.DataFrame,
-    records_by_loc: Dict[Hashable, pd.DataFrame],
+    records_by_loc: Mapping[Hashable, pd.DataFrame],
     effective_location_data: pd.DataFrame,
-    effective_records_by_loc: Dict[Hashable, pd.DataFrame],
+    effective_records_by_loc: Mapping[Hashable, pd.DataFrame],
     effective_totals: Tuple[int, int, int, int],
     effective_use_full: bool,
     lifer_lookup_df: pd.DataFrame,
@@ -327,8 +326,6 @@ def build_visit_overlay_map(
     species_url_fn: SpeciesUrlFn,
     base_species_fn: BaseSpeciesFn,
     popup_html_cache: MutableMapping[Tuple[Any, ...], str],
-    filtered_by_loc_cache: OrderedDict,
-    filtered_by_loc_cache_max: int,
     tax_loc_key: str,
     map_height_px: int,
     visit_marker_scheme: MapMarkerColourScheme,
@@ -342,8 +339,9 @@ def build_visit_overlay_map(
 ) -> MapOverlayResult:
     """Build all-locations or species-filtered overlay (not lifer-locations mode)."""
     if selected_species:
-        filtered = filter_species(df, selected_species)
-        if filtered.empty:
+        species_locs = species_location_index_for(df).select(selected_species)
+        facts = species_facts_for(df).banner(selected_species)
+        if species_locs.empty or facts is None:
             return MapOverlayResult(
                 None,
                 warning=(
@@ -351,12 +349,12 @@ def build_visit_overlay_map(
                     "check date range or filters."
                 ),
             )
-        seen_location_ids = set(filtered["Location ID"])
+        seen_location_ids = species_locs.location_ids
         species_locations = location_data[location_data["Location ID"].isin(seen_location_ids)]
         map_center = [species_locations["Latitude"].mean(), species_locations["Longitude"].mean()]
     else:
-        seen_location_ids = set()
-        filtered = pd.DataFrame()
+        seen_location_ids = frozenset()
+        facts = None
         map_center = [
             effective_location_data["Latitude"].mean(),
             effective_location_data["Longitude"].mean(),
@@ -550,58 +548,39 @@ def build_visit_overlay_map(
                 species_map.fit_bounds(all_loc_pairs, padding=(pad, pad), max_zoom=max_z)
 
     else:
-        if selected_species not in filtered_by_loc_cache:
-            if len(filtered_by_loc_cache) >= filtered_by_loc_cache_max:
-                filtered_by_loc_cache.popitem(last=False)
-            filtered_by_loc_cache[selected_species] = {
-                lid: grp for lid, grp in filtered.groupby("Location ID")
-            }
-        else:
-            filtered_by_loc_cache.move_to_end(selected_species)
-        filtered_by_loc = cast(Dict[Hashable, pd.DataFrame], filtered_by_loc_cache[selected_species])
-
-        n_checklists = filtered["Submission ID"].nunique()
-        n_individuals = int(filtered["Count"].apply(safe_count).sum())
-        high_count = int(filtered["Count"].apply(safe_count).max())
+        n_checklists = facts.n_checklists
+        n_individuals = facts.n_individuals
+        high_count = facts.high_count
 
         def _banner_date(d):
             return d.strftime("%d-%b-%Y") if pd.notna(d) else "?"
 
+        def _checklist_url(sid) -> str | None:
+            if pd.notna(sid) and str(sid).strip():
+                return f"https://ebird.org/checklist/{str(sid).strip()}"
+            return None
+
         first_seen_date = ""
         last_seen_date = ""
-        high_count_date = ""
         first_seen_url: str | None = None
         last_seen_url: str | None = None
-        high_count_url: str | None = None
         sci_parts_banner = (selected_species or "").strip().split()
         is_subspecies_banner = len(sci_parts_banner) >= 3
         taxon_key_banner = selected_species.strip().lower() if selected_species else None
+        seen = first_last_seen_for(lifer_lookup_df)
         if is_subspecies_banner and taxon_key_banner:
-            subset = lifer_lookup_df[lifer_lookup_df["_taxon"] == taxon_key_banner]
+            seen_facts = seen.taxon.get(taxon_key_banner)
         else:
             base = base_species_fn(selected_species)
-            subset = lifer_lookup_df[lifer_lookup_df["_base"] == base] if base else pd.DataFrame()
-        if not subset.empty:
-            first_rec = subset.iloc[0]
-            last_rec = subset.iloc[-1]
-            first_seen_date = _banner_date(first_rec["Date"])
-            last_seen_date = _banner_date(last_rec["Date"])
-            fcid = first_rec.get("Submission ID", "")
-            lcid = last_rec.get("Submission ID", "")
-            if pd.notna(fcid) and str(fcid).strip():
-                first_seen_url = f"https://ebird.org/checklist/{str(fcid).strip()}"
-            if pd.notna(lcid) and str(lcid).strip():
-                last_seen_url = f"https://ebird.org/checklist/{str(lcid).strip()}"
-
-        high_count_rows = filtered[filtered["Count"].apply(safe_count) == high_count]
-        if not high_count_rows.empty:
-            high_count_row = high_count_rows.iloc[0]
-            high_count_date = _banner_date(high_count_row["Date"])
-            high_count_checklist_id = high_count_row.get("Submission ID", "")
-            if pd.notna(high_count_checklist_id) and str(high_count_checklist_id).strip():
-                high_count_url = (
-                    f"https://ebird.org/checklist/{str(high_count_checklist_id).strip()}"
-                )
+            seen_facts = seen.base.get(base) if base else None
+        if seen_facts is not None:
+            first_seen_date = _banner_date(seen_facts.first_date)
+            last_seen_date = _banner_date(seen_facts.last_date)
+            first_seen_url = _checklist_url(seen_facts.first_sid)
+            last_seen_url = _checklist_url(seen_facts.last_sid)
+
+        high_count_date = _banner_date(facts.high_count_date)
+        high_count_url = _checklist_url(facts.high_count_sid)
 
         display_name = selected_common_name or selected_species
         species_url = species_url_fn(display_name) if species_url_fn else None
@@ -681,7 +660,7 @@ def build_visit_overlay_map(
                 visit_info = build_visit_info_html(visit_records, format_visit_time)
                 n_visits = int(len(visit_records))
                 if row["has_species_match"]:
-                    species_sightings = filtered_by_loc.get(loc_id, pd.DataFrame()).sort_values(
+                    species_sightings = species_locs.rows_at(df, loc_id).sort_values(
                         "datetime", ascending=popup_ascending
                     )
                     popup_html_cache[popup_key] = build_species_map_location_popup_html(
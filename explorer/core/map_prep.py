@@ -8,13 +8,15 @@ in sync with checklist prep. When a date filter applies, pass the **filtered** w
 
 from __future__ import annotations
 
-from typing import Any, Dict, Hashable, Tuple
+from typing import Any, Dict, Tuple
 
 import pandas as pd
 
-from explorer.core.lifer_last_seen_prep import prepare_lifer_last_seen
-from explorer.core.species_logic import base_species_for_lifer, countable_species_vectorized
-from explorer.core.stats import safe_count
+from explorer.core.daily_totals import DailyTotals
+from explorer.core.lifer_last_seen_prep import lifer_last_seen_prep_for
+from explorer.core.derived_columns import count_series, countable_base_series
+from explorer.core.location_records import LocationRecords
+from explorer.core.species_logic import base_species_for_lifer
 
 
 def mean_center_from_location_data(location_data: pd.DataFrame | None) -> tuple[float, float] | None:
@@ -38,12 +40,18 @@ def prepare_all_locations_map_context(
     df: pd.DataFrame,
     *,
     full_df: pd.DataFrame | None = None,
+    daily_totals: DailyTotals | None = None,
+    date_range: Tuple[Any, Any] | None = None,
 ) -> Dict[str, Any]:
     """Return keyword arguments (except caches and UI hooks) for ``map_view_mode='all'``.
 
     *df* — rows shown on the map (checklists / observations).
-    *full_df* — if given, used only for :func:`prepare_lifer_last_seen` (e.g. unfiltered
-    export). Defaults to *df* when omitted.
+    *full_df* — if given, used only for lifer / last-seen prep (e.g. unfiltered export; memoised per
+    dataset by :func:`~explorer.core.lifer_last_seen_prep.lifer_last_seen_prep_for`). Defaults to *df*
+    when omitted.
+    *daily_totals* / *date_range* — when *daily_totals* (built over the checklist-location rows of
+    *full_df*) is given, banner totals are read from it for *date_range* (``None`` = all-time)
+    instead of being recomputed from rows; *df* must be that date slice.
     """
     if df.empty:
         raise ValueError("Cannot build map context from an empty DataFrame.")
@@ -60,14 +68,17 @@ def prepare_all_locations_map_context(
     cols = ["Location ID", "Location", "Latitude", "Longitude"]
     location_data = work[cols].drop_duplicates()
     full_location_data = full[cols].drop_duplicates()
-    records_by_loc: Dict[Hashable, pd.DataFrame] = {lid: grp for lid, grp in work.groupby("Location ID")}
-
-    total_checklists = int(work["Submission ID"].nunique())
-    total_individuals = int(work["Count"].apply(safe_count).sum())
-    total_species = int(countable_species_vectorized(work).dropna().nunique())
+    records_by_loc = LocationRecords(work)
+
+    if daily_totals is not None:
+        total_checklists, total_species, total_individuals = daily_totals.totals(*(date_range or (None, None)))
+    else:
+        total_checklists = int(work["Submission ID"].nunique())
+        total_individuals = int(count_series(work).sum())
+        total_species = int(countable_base_series(work).dropna().nunique())
     n_locations = int(location_data["Location ID"].nunique())
 
-    prep = prepare_lifer_last_seen(full, base_species_fn=base_species_for_lifer)
+    prep = lifer_last_seen_prep_for(full, base_species_fn=base_species_for_lifer)
 
     return {
         "df": work,
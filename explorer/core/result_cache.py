@@ -0,0 +1,218 @@
+"""
+On-disk cache of computed results (stats payload groups, family-map taxonomy, coverage tables …).
+
+``@st.cache_data`` / ``@st.cache_resource`` live in process memory, so every Streamlit restart or
+redeploy recomputes the same statistics for the same export. :class:`ResultCache` persists pickled
+results in a folder so a warm restart reads them back instead. Entries are keyed by:
+
+- a **kind** (``"stats-rankings"``, ``"family-map-taxonomy"`` …) and the caller's key parts — typically
+  :func:`frame_result_fingerprint` of the input frame plus every setting that changes the result
+  (Top N, sort options, taxonomy locale, reference day …), and
+- :func:`explorer_code_version` — a hash of the ``explorer`` package sources plus the pandas / numpy
+  versions, so any code change (or a library upgrade that changes pickles) starts a fresh key space.
+
+Writes go to a temp file that is ``os.replace``-d into place, so readers never see a partial entry.
+Reads bump the entry's mtime; after each write the oldest entries are evicted until the folder fits
+*max_bytes* (least recently used first).
+
+Like :mod:`explorer.core.dataset_cache` the cache is **best-effort**: a read-only folder, a corrupt
+or unpicklable entry, or ``max_bytes=0`` simply behaves as a miss. Only cache values that are pure
+functions of their key — callers skip ``put`` for fallback results (e.g. a failed taxonomy fetch).
+
+:class:`FrameMemo` is the in-process counterpart for per-dataset structures (indexes, lookup
+tables): a small LRU keyed by :func:`frame_result_fingerprint`, so the fresh frame copies made on
+every map prep still hit.
+"""
+
+from __future__ import annotations
+
+import functools
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Generic, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+import pandas as pd
+
+# Bump when the on-disk entry format changes (independent of explorer_code_version).
+RESULT_CACHE_SCHEMA_VERSION = 1
+
+DEFAULT_RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_ENTRY_PREFIX = "result-"
+_ENTRY_SUFFIX = ".pkl"
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=1)
+def explorer_code_version() -> str:
+    """Hash of every ``explorer/**/*.py`` source plus pandas / numpy versions (computed once per process)."""
+    h = hashlib.sha256(f"v{RESULT_CACHE_SCHEMA_VERSION}|{pd.__version__}|{np.__version__}".encode("utf-8"))
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        h.update(path.relative_to(_PACKAGE_DIR).as_posix().encode("utf-8"))
+        try:
+            h.update(path.read_bytes())
+        except OSError:
+            pass
+    return h.hexdigest()[:16]
+
+
+def frame_result_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Cache key fingerprint of *df* for derived results.
+
+    Frames stamped at load time (:data:`~explorer.core.dataset_cache.DATASET_FINGERPRINT_ATTR`) keep the
+    stamp through filtering and slicing, so the stamp alone does not identify a working set. It is
+    combined with the column names and the row index labels (a few ms), which identify the rows of
+    the export a filtered frame holds. Unstamped frames hash their full contents.
+    """
+    # Local import: dataset_cache → data_loader → checklist_stats_compute imports this module.
+    from explorer.core.dataset_cache import DATASET_FINGERPRINT_ATTR, dataset_frame_fingerprint
+
+    stamped = df.attrs.get(DATASET_FINGERPRINT_ATTR)
+    if not stamped:
+        return dataset_frame_fingerprint(df)
+    h = hashlib.sha256(str(stamped).encode("utf-8"))
+    h.update(",".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df.index, index=False).to_numpy().tobytes())
+    return "rows-" + h.hexdigest()
+
+
+class ResultCache:
+    """Pickled results under *cache_dir*, bounded to *max_bytes* (``0`` disables the cache)."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        *,
+        max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+        code_version: Optional[str] = None,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max(int(max_bytes), 0)
+        self.code_version = explorer_code_version() if code_version is None else code_version
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def entry_path(self, kind: str, key_parts: Sequence[Any]) -> str:
+        """Entry file for *kind* / *key_parts* (``repr`` of the parts, so use plain values)."""
+        raw = repr((self.code_version, kind, tuple(key_parts)))
+        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{_ENTRY_PREFIX}{kind}-{digest}{_ENTRY_SUFFIX}")
+
+    def get(self, kind: str, key_parts: Sequence[Any]) -> Any:
+        """Stored value, or ``None`` on miss / unreadable entry."""
+        if not self.enabled:
+            return None
+        path = self.entry_path(kind, key_parts)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            _remove_quietly(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, kind: str, key_parts: Sequence[Any], value: Any) -> bool:
+        """Store *value* atomically; return ``True`` on success. Evicts least recently used entries."""
+        if not self.enabled or value is None:
+            return False
+        path = self.entry_path(kind, key_parts)
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except Exception:
+            return False
+        finally:
+            if tmp_path is not None:
+                _remove_quietly(tmp_path)
+        self._evict(keep=path)
+        return True
+
+    def get_or_compute(self, kind: str, key_parts: Sequence[Any], compute: Callable[[], T]) -> T:
+        """Stored value for the key, else ``compute()`` (stored unless ``None``; exceptions propagate)."""
+        value = self.get(kind, key_parts)
+        if value is None:
+            value = compute()
+            self.put(kind, key_parts, value)
+        return value
+
+    def _evict(self, *, keep: str) -> None:
+        entries = []
+        for path in glob.glob(os.path.join(self.cache_dir, f"{_ENTRY_PREFIX}*{_ENTRY_SUFFIX}")):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if os.path.abspath(path) == os.path.abspath(keep):
+                continue
+            if _remove_quietly(path):
+                total -= size
+
+
+def _remove_quietly(path: str) -> bool:
+    try:
+        os.remove(path)
+    except OSError:
+        return False
+    return True
+
+
+class FrameMemo(Generic[T]):
+    """
+    Last *max_entries* values of ``build(df)`` keyed by :func:`frame_result_fingerprint` (plus *extra*).
+
+    Only frames stamped at load time are memoised; others are built directly, since hashing their
+    contents would cost about as much as most builds. Values are shared — treat them as read-only.
+    """
+
+    def __init__(self, build: Callable[[pd.DataFrame], T], *, max_entries: int = 4) -> None:
+        self._build = build
+        self._max_entries = max(1, int(max_entries))
+        self._values: "OrderedDict[Tuple[Any, ...], T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, df: pd.DataFrame, *extra: Any) -> T:
+        """Memoised ``build(df)``; *extra* (hashable) distinguishes variants of the same frame."""
+        from explorer.core.dataset_cache import DATASET_FINGERPRINT_ATTR
+
+        if not df.attrs.get(DATASET_FINGERPRINT_ATTR):
+            return self._build(df, *extra)
+        key = (frame_result_fingerprint(df),) + extra
+        with self._lock:
+            hit = self._values.get(key)
+            if hit is not None:
+                self._values.move_to_end(key)
+                return hit
+        value = self._build(df, *extra)
+        with self._lock:
+            self._values[key] = value
+            while len(self._values) > self._max_entries:
+                self._values.popitem(last=False)
+        return value
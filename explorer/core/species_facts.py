@@ -0,0 +1,161 @@
+"""
+Per-species facts for species-map banners, built once per dataset.
+
+Selecting a species used to filter the working frame, sum and max its counts twice, re-filter for
+the high-count row and rescan the lifer lookup for first / last seen. Two tables answer the banner
+with lookups instead:
+
+- :class:`SpeciesFacts` — per distinct lowercased ``Scientific Name`` of a frame (the unit of the
+  shared :func:`~explorer.core.species_row_index.species_row_index_for` index): distinct checklists,
+  individuals, high count and the first row holding it. A selection covers one or a few names
+  (base species, its subspecies, hybrids matching the prefix — the
+  :func:`~explorer.core.species_logic.filter_species` rules); one name is a plain lookup, several
+  are combined (sums, max, union of checklist codes).
+- :class:`FirstLastSeen` — first / last seen date and checklist per ``_base`` and per ``_taxon``
+  key, from the lifer lookup of :mod:`explorer.core.lifer_last_seen_prep`.
+
+Both are memoised per dataset fingerprint (:class:`~explorer.core.result_cache.FrameMemo`) through
+:func:`species_facts_for` / :func:`first_last_seen_for`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from explorer.core.derived_columns import count_series
+from explorer.core.result_cache import FrameMemo
+from explorer.core.species_row_index import species_row_index_for
+
+
+class SpeciesBannerFacts(NamedTuple):
+    """Banner numbers for one species selection."""
+
+    n_checklists: int
+    n_individuals: int
+    high_count: int
+    # ``Date`` / ``Submission ID`` of the first row (export order) with the high count.
+    high_count_date: Any
+    high_count_sid: Any
+
+
+class SeenFacts(NamedTuple):
+    """First and last record of a species key (dates and checklist IDs)."""
+
+    first_date: Any
+    first_sid: Any
+    last_date: Any
+    last_sid: Any
+
+
+class SpeciesFacts:
+    """Checklists, individuals and high count per distinct scientific name of *df*."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.index = species_row_index_for(df)
+        n_names = len(self.index.names)
+        rank = self.index.row_rank
+        known = rank >= 0
+        counts = count_series(df).to_numpy(dtype=np.int64)
+        self._counts = counts
+        self._dates = df["Date"].to_numpy()
+        self._sids = df["Submission ID"].to_numpy(dtype=object)
+
+        self._individuals = np.zeros(n_names, dtype=np.int64)
+        np.add.at(self._individuals, rank[known], counts[known])
+        self._high = np.full(n_names, np.iinfo(np.int64).min, dtype=np.int64)
+        np.maximum.at(self._high, rank[known], counts[known])
+        at_high = known & (counts == self._high[np.where(known, rank, 0)])
+        self._high_pos = np.full(n_names, len(df), dtype=np.int64)
+        np.minimum.at(self._high_pos, rank[at_high], np.flatnonzero(at_high))
+
+        sid_codes, sid_uniques = pd.factorize(df["Submission ID"])
+        self._sid_codes = sid_codes
+        n_sids = max(len(sid_uniques), 1)
+        has_sid = known & (sid_codes >= 0)
+        # Distinct (name, checklist) pairs, grouped by name: checklist codes per name for unions.
+        pairs = np.unique(rank[has_sid] * n_sids + sid_codes[has_sid])
+        self._pair_sid = pairs % n_sids
+        self._pair_offsets = np.searchsorted(pairs // n_sids, np.arange(n_names + 1), side="left")
+
+    def banner(self, selected_species: str) -> Optional[SpeciesBannerFacts]:
+        """Facts over the rows :func:`~explorer.core.species_logic.filter_species` selects; ``None`` if none."""
+        if not selected_species.strip():
+            return self._from_positions(self.index.positions(selected_species))
+        ranks = self.index.ranks(selected_species)
+        if not ranks:
+            return None
+        if len(ranks) == 1:
+            r = ranks[0]
+            n_checklists = int(self._pair_offsets[r + 1] - self._pair_offsets[r])
+        else:
+            sid_blocks = [self._pair_sid[self._pair_offsets[r]:self._pair_offsets[r + 1]] for r in ranks]
+            n_checklists = int(len(np.unique(np.concatenate(sid_blocks))))
+        high = int(self._high[ranks].max())
+        pos = int(min(self._high_pos[r] for r in ranks if self._high[r] == high))
+        return SpeciesBannerFacts(
+            n_checklists=n_checklists,
+            n_individuals=int(self._individuals[ranks].sum()),
+            high_count=high,
+            high_count_date=pd.Timestamp(self._dates[pos]),
+            high_count_sid=self._sids[pos],
+        )
+
+    def _from_positions(self, positions: np.ndarray) -> Optional[SpeciesBannerFacts]:
+        if not len(positions):
+            return None
+        counts = self._counts[positions]
+        sids = self._sid_codes[positions]
+        pos = int(positions[int(np.argmax(counts))])
+        return SpeciesBannerFacts(
+            n_checklists=int(len(np.unique(sids[sids >= 0]))),
+            n_individuals=int(counts.sum()),
+            high_count=int(counts.max()),
+            high_count_date=pd.Timestamp(self._dates[pos]),
+            high_count_sid=self._sids[pos],
+        )
+
+
+class FirstLastSeen:
+    """First / last record per ``_base`` and per ``_taxon`` of a chronologically sorted lifer lookup."""
+
+    def __init__(self, lifer_lookup_df: pd.DataFrame) -> None:
+        self.base: Dict[Any, SeenFacts] = _first_last_by(lifer_lookup_df, "_base")
+        self.taxon: Dict[Any, SeenFacts] = _first_last_by(lifer_lookup_df, "_taxon")
+
+
+def _first_last_by(lookup: pd.DataFrame, key: str) -> Dict[Any, SeenFacts]:
+    if key not in lookup.columns or lookup.empty:
+        return {}
+    cols = [key, "Date", "Submission ID"] if "Submission ID" in lookup.columns else [key, "Date"]
+    keyed = lookup.loc[lookup[key].notna(), cols]
+    if "Submission ID" not in keyed.columns:
+        keyed = keyed.assign(**{"Submission ID": ""})
+    first = keyed.drop_duplicates(subset=[key], keep="first").set_index(key)
+    last = keyed.drop_duplicates(subset=[key], keep="last").set_index(key).reindex(first.index)
+    return {
+        k: SeenFacts(fd, fs, ld, ls)
+        for k, fd, fs, ld, ls in zip(
+            first.index.tolist(),
+            first["Date"].tolist(),
+            first["Submission ID"].tolist(),
+            last["Date"].tolist(),
+            last["Submission ID"].tolist(),
+        )
+    }
+
+
+_SPECIES_FACTS: FrameMemo[SpeciesFacts] = FrameMemo(SpeciesFacts)
+_FIRST_LAST_SEEN: FrameMemo[FirstLastSeen] = FrameMemo(FirstLastSeen)
+
+
+def species_facts_for(df: pd.DataFrame) -> SpeciesFacts:
+    """Memoised :class:`SpeciesFacts` for *df* (per dataset fingerprint and rows)."""
+    return _SPECIES_FACTS.get(df)
+
+
+def first_last_seen_for(lifer_lookup_df: pd.DataFrame) -> FirstLastSeen:
+    """Memoised :class:`FirstLastSeen` for a lifer lookup frame."""
+    return _FIRST_LAST_SEEN.get(lifer_lookup_df)
@@ -0,0 +1,94 @@
+"""
+Inverted index from species to locations and rows, for species-map switching.
+
+Each species pick on the map used to filter the working frame, collect its ``Location ID`` set and
+group the filtered rows by location for popups (kept in a per-session LRU of 60 species).
+:class:`SpeciesLocationIndex` is built once per dataset in a vectorised pass: the row positions of
+every distinct lowercased ``Scientific Name`` (taxon key), ordered by location code and then export
+order. A selection follows :func:`~explorer.core.species_logic.filter_species` rules — a base
+species covers its subspecies and matching hybrids — so :meth:`SpeciesLocationIndex.select`
+combines the names it covers and returns :class:`SpeciesLocations`: the location IDs and, per
+location, the row positions. Popup rows come from ``df.iloc`` on demand; nothing is cached per
+species.
+
+:func:`species_location_index_for` memoises the index per dataset fingerprint
+(:class:`~explorer.core.result_cache.FrameMemo`).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Hashable
+
+import numpy as np
+import pandas as pd
+
+from explorer.core.result_cache import FrameMemo
+from explorer.core.species_row_index import species_row_index_for
+
+
+class SpeciesLocations:
+    """Locations and row positions of one species selection."""
+
+    def __init__(self, loc_codes: np.ndarray, positions: np.ndarray, loc_uniques: pd.Index) -> None:
+        # *positions* are grouped by location code (ascending), export order within a location.
+        self.positions = np.sort(positions)
+        starts = np.flatnonzero(np.r_[True, loc_codes[1:] != loc_codes[:-1]]) if len(loc_codes) else loc_codes
+        ends = np.r_[starts[1:], len(loc_codes)]
+        self._rows_by_location: Dict[Hashable, np.ndarray] = {
+            loc_uniques[code]: positions[s:e]
+            for code, s, e in zip(loc_codes[starts].tolist(), starts.tolist(), ends.tolist())
+            if code >= 0
+        }
+        self.location_ids: FrozenSet[Hashable] = frozenset(self._rows_by_location)
+
+    @property
+    def empty(self) -> bool:
+        return not len(self.positions)
+
+    def rows_at(self, df: pd.DataFrame, location_id: Hashable) -> pd.DataFrame:
+        """Rows of the selection at *location_id* (export order; empty frame if none)."""
+        pos = self._rows_by_location.get(location_id)
+        return pd.DataFrame() if pos is None else df.iloc[pos]
+
+
+class SpeciesLocationIndex:
+    """Row positions per distinct scientific name of *df*, grouped by ``Location ID``."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        # Shared with filter_species / SpeciesFacts (one name index per dataset).
+        self._rows = species_row_index_for(df)
+        loc_codes, self._loc_uniques = pd.factorize(df["Location ID"])
+        self._loc_codes = loc_codes
+        rank = self._rows.row_rank
+        known = np.flatnonzero(rank >= 0)
+        # Rows grouped by name rank, then location code, then export position.
+        self._order = known[np.lexsort((known, loc_codes[known], rank[known]))]
+        counts = np.bincount(rank[known], minlength=len(self._rows.names))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def select(self, selected_species: str) -> SpeciesLocations:
+        """Locations and rows :func:`~explorer.core.species_logic.filter_species` would select."""
+        if not selected_species.strip():
+            return self._grouped(self._rows.positions(selected_species))
+        ranks = self._rows.ranks(selected_species)
+        if len(ranks) == 1:
+            r = ranks[0]
+            block = self._order[self._offsets[r]:self._offsets[r + 1]]
+            return SpeciesLocations(self._loc_codes[block], block, self._loc_uniques)
+        blocks = [self._order[self._offsets[r]:self._offsets[r + 1]] for r in ranks]
+        return self._grouped(np.concatenate(blocks) if blocks else np.empty(0, dtype=np.intp))
+
+    def _grouped(self, positions: np.ndarray) -> SpeciesLocations:
+        positions = np.sort(positions)
+        codes = self._loc_codes[positions]
+        order = np.argsort(codes, kind="stable")
+        return SpeciesLocations(codes[order], positions[order], self._loc_uniques)
+
+
+_SPECIES_LOCATION_INDEX: FrameMemo[SpeciesLocationIndex] = FrameMemo(SpeciesLocationIndex)
+
+
+def species_location_index_for(df: pd.DataFrame) -> SpeciesLocationIndex:
+    """Memoised :class:`SpeciesLocationIndex` for *df* (per dataset fingerprint and rows)."""
+    return _SPECIES_LOCATION_INDEX.get(df)
+
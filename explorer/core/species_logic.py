@@ -4,38 +4,106 @@ Species-related pure logic for Personal eBird Explorer.
 Functions for species filtering, countable-species normalisation, and
 base-species extraction. All functions are pure (explicit inputs/outputs,
 no widget or UI state dependencies).
+
+Classification runs once per distinct ``(Scientific Name, Common Name)`` pair
+(:func:`classify_species`, memoised process-wide): a personal export has a few
+thousand pairs but hundreds of thousands of rows, so frame-level helpers
+factorize the pairs and broadcast results back through integer codes.
 """
 
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
 import pandas as pd
 
+from explorer.core.species_row_index import species_row_index_for
+
 
 # ---------------------------------------------------------------------------
 # Shared building blocks
 # ---------------------------------------------------------------------------
 
+class SpeciesClassification(NamedTuple):
+    """Per-name classification shared by the scalar and frame-level helpers."""
+
+    countable: bool
+    base: Optional[str]  # genus + species lowercased (no countability filter); None if < 2 words
+    taxon: Optional[str]  # full scientific name stripped + lowercased; None if empty
+    is_subspecies: bool  # three or more words (trinomial / group)
+
+
+def _name_text(value) -> str:
+    return (str(value) if not pd.isna(value) else "").strip()
+
+
+@lru_cache(maxsize=65536)
+def _classify_stripped(sci: str, common: str) -> SpeciesClassification:
+    if not sci:
+        return SpeciesClassification(False, None, None, False)
+    parts = sci.split()
+    base = f"{parts[0]} {parts[1]}".lower() if len(parts) >= 2 else None
+    sci_lower = sci.lower()
+    spuh = " sp." in sci_lower or sci_lower.endswith(" sp")
+    hybrid = " x " in sci or "(hybrid)" in common.lower()
+    domestic = "Domestic" in common or "(Domestic type)" in common
+    slash = base is not None and "/" in parts[1]
+    countable = base is not None and not (spuh or hybrid or domestic or slash)
+    return SpeciesClassification(countable, base, sci_lower, len(parts) >= 3)
+
+
+def classify_species(sci_name, common_name=None) -> SpeciesClassification:
+    """Classify one scientific / common name pair (memoised on the stripped strings).
+
+    Exclusion rules (``countable`` is False):
+    - spuh: scientific name contains " sp." (any case) or ends with " sp"
+    - hybrid: scientific name contains " x " or common name contains "(hybrid)"
+    - domestic: common name contains "Domestic" or "(Domestic type)"
+    - species-level slash: second word of scientific name contains "/"
+    - too short: scientific name has fewer than two words
+    """
+    return _classify_stripped(_name_text(sci_name), _name_text(common_name))
+
+
+def species_classification_frame(df) -> pd.DataFrame:
+    """Row-aligned :class:`SpeciesClassification` columns for *df*, classified per unique pair.
+
+    Columns: ``countable`` (bool), ``base``, ``taxon`` (str, missing where None), ``is_subspecies`` (bool).
+    *df* needs ``Scientific Name``; ``Common Name`` is optional.
+    """
+    sci_codes, sci_uniques = pd.factorize(df["Scientific Name"], use_na_sentinel=False)
+    if "Common Name" in df.columns:
+        com_codes, com_uniques = pd.factorize(df["Common Name"], use_na_sentinel=False)
+    else:
+        com_codes, com_uniques = np.zeros(len(df), dtype=np.intp), np.array([None], dtype=object)
+    n_common = max(len(com_uniques), 1)
+    pair_codes, pair_uniques = pd.factorize(sci_codes.astype(np.int64) * n_common + com_codes)
+    sci_uniques = np.asarray(sci_uniques, dtype=object)
+    com_uniques = np.asarray(com_uniques, dtype=object)
+    classes = [
+        classify_species(sci_uniques[p // n_common], com_uniques[p % n_common]) for p in pair_uniques
+    ]
+    table = pd.DataFrame(
+        classes, columns=list(SpeciesClassification._fields)
+    ).astype({"countable": bool, "base": "str", "taxon": "str", "is_subspecies": bool})
+    out = table.iloc[pair_codes].reset_index(drop=True)
+    out.index = df.index
+    return out
+
+
 def base_species_name(sci_name):
     """Extract base species (genus + species, lowercased) from a scientific name.
 
     Returns None for missing/empty names or names with fewer than two parts.
     Does not apply any countability filter — use ``is_countable`` for that.
     """
-    if pd.isna(sci_name) or not str(sci_name).strip():
-        return None
-    parts = str(sci_name).strip().split()
-    if len(parts) < 2:
-        return None
-    return f"{parts[0]} {parts[1]}".lower()
+    return classify_species(sci_name).base
 
 
 def is_countable(sci_name, common_name):
     """Return True if a species entry is countable (not a spuh, hybrid, domestic, or slash).
 
-    Mirrors the exclusion rules used by ``countable_species_vectorized``:
-    - spuh: scientific name contains " sp." or ends with " sp"
-    - hybrid: scientific name contains " x " or common name contains "(hybrid)"
-    - domestic: common name contains "Domestic" or "(Domestic type)"
-    - species-level slash: second word of scientific name contains "/"
-    - too short: scientific name has fewer than two words
+    Same rules as ``countable_species_vectorized`` (see :func:`classify_species`).
 
     Args:
         sci_name: Scientific name string (may be None/NaN/empty).
@@ -44,22 +112,7 @@ def is_countable(sci_name, common_name):
     Returns:
         True if the entry should be counted as a species, False otherwise.
     """
-    sci = (str(sci_name) if not pd.isna(sci_name) else "").strip()
-    common = (str(common_name) if not pd.isna(common_name) else "").strip()
-    if not sci:
-        return False
-    if " sp." in sci or sci.lower().endswith(" sp"):
-        return False
-    if " x " in sci or "(hybrid)" in common.lower():
-        return False
-    if "Domestic" in common or "(Domestic type)" in common:
-        return False
-    parts = sci.split()
-    if len(parts) < 2:
-        return False
-    if "/" in parts[1]:
-        return False
-    return True
+    return classify_species(sci_name, common_name).countable
 
 
 # ---------------------------------------------------------------------------
@@ -79,25 +132,13 @@ def countable_species_vectorized(df):
     """Vectorized species count: exclude spuhs, slashes, hybrids, domestic; roll up subspecies.
 
     Returns a Series of base species names (genus + species, lowercased) with NaN
-    for non-countable rows.  Exclusion rules match ``is_countable``.
+    for non-countable rows.  Exclusion rules match ``is_countable``; each distinct
+    name pair is classified once (:func:`species_classification_frame`).
     """
-    sci = df["Scientific Name"].fillna("").astype(str).str.strip()
-    common = df["Common Name"].fillna("").astype(str).str.strip()
-    if sci.empty:
+    if df.empty:
         return pd.Series(dtype="object")
-    spuh = sci.str.contains(r" sp\.", case=False, na=False) | sci.str.lower().str.endswith(" sp")
-    hybrid = sci.str.contains(" x ", na=False) | common.str.lower().str.contains(r"\(hybrid\)", na=False)
-    domestic = common.str.contains("Domestic", na=False) | common.str.contains(r"\(Domestic type\)", na=False)
-    parts = sci.str.split(expand=True)
-    has_two_parts = 1 in parts.columns
-    slash = parts[1].str.contains("/", na=False) if has_two_parts else pd.Series(False, index=df.index)
-    too_short = (parts[0].isna() | parts[1].isna()) if has_two_parts else pd.Series(True, index=df.index)
-    exclude = spuh | hybrid | domestic | slash | too_short
-    if has_two_parts:
-        base = parts[0].str.lower() + " " + parts[1].str.lower()
-    else:
-        base = pd.Series(pd.NA, index=df.index)
-    return base.where(~exclude)
+    cls = species_classification_frame(df)
+    return cls["base"].where(cls["countable"]).rename(None)
 
 
 def filter_species(df, base_species):
@@ -107,20 +148,8 @@ def filter_species(df, base_species):
     - Otherwise, matches rows whose Scientific Name starts with base_species,
       excluding species-level slash groups (e.g. Anas gracilis/castanea) but
       including subspecies with slash in later parts.
+
+    Resolved through a memoised per-frame sorted name index
+    (:func:`explorer.core.species_row_index.species_row_index_for`); row order is preserved.
     """
-    base_species = base_species.lower().strip()
-    if "/" in base_species:
-        return df[df["Scientific Name"].str.lower() == base_species]
-    filtered_df = df[df["Scientific Name"].fillna("").str.lower().str.startswith(base_species)]
-
-    def is_species_level_slash(sci_name):
-        sn = (sci_name or "").lower()
-        if "/" not in sn:
-            return False
-        rest = sn[len(base_species):].lstrip()
-        return rest.startswith("/")
-
-    mask = filtered_df["Scientific Name"].fillna("").apply(
-        lambda s: not is_species_level_slash(s)
-    )
-    return filtered_df[mask]
+    return df.iloc[species_row_index_for(df).positions(base_species)]
@@ -0,0 +1,97 @@
+"""
+Sorted prefix index over ``Scientific Name`` for fast species selection.
+
+:func:`explorer.core.species_logic.filter_species` used to lowercase and ``startswith``-scan the
+whole column (plus a per-row ``apply`` for the slash rule) on every species pick. The index keeps:
+
+- the distinct lowercased scientific names, **sorted** (binary search for a prefix range), and
+- one block of row positions per name (``order`` / ``offsets``), so a selection is a handful of
+  array slices instead of a full scan.
+
+The species-level slash rule is evaluated per **distinct name** in the prefix range, never per row.
+
+:func:`species_row_index_for` memoises the index per dataset fingerprint
+(:class:`~explorer.core.result_cache.FrameMemo`), so repeated picks against the same working set —
+including the fresh copies made on every map prep — reuse it.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from explorer.core.result_cache import FrameMemo
+
+
+class SpeciesRowIndex:
+    """Row positions of a frame grouped by lowercased ``Scientific Name``."""
+
+    def __init__(self, sci_names: pd.Series) -> None:
+        codes, uniques = pd.factorize(sci_names)
+        lowered = [str(u).lower() for u in uniques]
+        self.names: list[str] = sorted(set(lowered))
+        rank_of = {name: i for i, name in enumerate(self.names)}
+        unique_rank = np.array([rank_of[n] for n in lowered], dtype=np.int64)
+        row_rank = np.full(len(codes), -1, dtype=np.int64)
+        known = codes >= 0
+        row_rank[known] = unique_rank[codes[known]]
+        # Rank of each row's name in ``names`` (-1 where missing).
+        self.row_rank = row_rank
+        order = np.argsort(row_rank, kind="stable")
+        n_missing = int((~known).sum())
+        # Missing names sort first (rank -1); they only match the empty prefix.
+        self._missing_positions = order[:n_missing]
+        self._order = order[n_missing:]
+        counts = np.bincount(row_rank[known], minlength=len(self.names))
+        self._offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def _positions_for_ranks(self, ranks) -> np.ndarray:
+        blocks = [self._order[self._offsets[r]:self._offsets[r + 1]] for r in ranks]
+        if not blocks:
+            return np.empty(0, dtype=np.intp)
+        return np.concatenate(blocks)
+
+    def ranks(self, base_species: str) -> List[int]:
+        """Indices into :attr:`names` matching :func:`~explorer.core.species_logic.filter_species` rules.
+
+        Rows with a missing name are not covered (they only match the empty prefix; see :meth:`positions`).
+        """
+        base = base_species.lower().strip()
+        if "/" in base:
+            i = bisect_left(self.names, base)
+            return [i] if i < len(self.names) and self.names[i] == base else []
+        lo = bisect_left(self.names, base)
+        hi = lo
+        while hi < len(self.names) and self.names[hi].startswith(base):
+            hi += 1
+        n = len(base)
+        return [
+            r for r in range(lo, hi)
+            if not ("/" in self.names[r] and self.names[r][n:].lstrip().startswith("/"))
+        ]
+
+    def positions(self, base_species: str) -> np.ndarray:
+        """Ascending row positions matching :func:`~explorer.core.species_logic.filter_species` rules."""
+        pos = self._positions_for_ranks(self.ranks(base_species))
+        if not base_species.strip() and len(self._missing_positions):
+            pos = np.concatenate((pos, self._missing_positions))
+        return np.sort(pos)
+
+    def rank_positions(self, rank: int) -> np.ndarray:
+        """Ascending row positions of the name ``names[rank]``."""
+        return self._order[self._offsets[rank]:self._offsets[rank + 1]]
+
+
+def _build_species_row_index(df: pd.DataFrame) -> SpeciesRowIndex:
+    return SpeciesRowIndex(df["Scientific Name"])
+
+
+_SPECIES_ROW_INDEX: FrameMemo[SpeciesRowIndex] = FrameMemo(_build_species_row_index)
+
+
+def species_row_index_for(df: pd.DataFrame) -> SpeciesRowIndex:
+    """Memoised :class:`SpeciesRowIndex` for *df* (per dataset fingerprint and rows)."""
+    return _SPECIES_ROW_INDEX.get(df)
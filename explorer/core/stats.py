@@ -15,7 +15,13 @@ import pandas as pd
 
 from explorer.core.settings_schema_defaults import TAXONOMY_LOCALE_DEFAULT
 from explorer.core.species_family import build_base_species_to_family_map
-from explorer.core.species_logic import countable_species_vectorized
+from explorer.core.derived_columns import (
+    count_series,
+    countable_base_series,
+    country_key_series,
+    date_series,
+    year_series,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -115,6 +121,67 @@ def format_region_parts(value):
     return (None, s)
 
 
+# ---------------------------------------------------------------------------
+# Row formatting helpers (column-wise HTML / text for ranking tuples)
+# ---------------------------------------------------------------------------
+
+_DATETIME_FMT = "%d %b %Y %H:%M"
+
+
+def _column_values(frame, col, default=None) -> np.ndarray:
+    """Values of *col* as an object array; *default* everywhere when *col* is absent."""
+    if col and col in frame.columns:
+        return frame[col].to_numpy(dtype=object)
+    return np.full(len(frame), default, dtype=object)
+
+
+def _truthy(values) -> np.ndarray:
+    """``bool(v)`` per value (what ``if v:`` tested row by row)."""
+    return np.fromiter(map(bool, values), dtype=bool, count=len(values))
+
+
+def _as_text(values) -> np.ndarray:
+    """``str(v)`` per value, as an object array (what an f-string interpolates)."""
+    return np.fromiter(map(str, values), dtype=object, count=len(values))
+
+
+def _format_datetimes(values) -> np.ndarray:
+    """``dd Mon YYYY HH:MM`` per value, ``"—"`` where missing."""
+    s = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s.dt.strftime(_DATETIME_FMT).fillna("—").to_numpy(dtype=object)
+    return np.array(
+        [pd.Timestamp(v).strftime(_DATETIME_FMT) if pd.notna(v) else "—" for v in s],
+        dtype=object,
+    )
+
+
+def _anchors(url_prefix, keys, text, attrs=' target="_blank"') -> np.ndarray:
+    """``<a href="{url_prefix}{key}"{attrs}>{text}</a>`` where *key* is truthy; else *text* as is."""
+    keys = np.asarray(keys, dtype=object)
+    text = np.asarray(text, dtype=object)
+    if not len(keys):
+        return np.empty(0, dtype=object)
+    links = f'<a href="{url_prefix}' + _as_text(keys) + f'"{attrs}>' + _as_text(text) + "</a>"
+    return np.where(_truthy(keys), links, text)
+
+
+def _region_parts(values):
+    """Column-wise :func:`format_region_parts` → ``(country_strs, state_strs)``, ``""`` for missing parts."""
+    s = pd.Series(np.asarray(values, dtype=object), dtype=object)
+    if s.empty:
+        return np.empty(0, dtype=object), np.empty(0, dtype=object)
+    missing = s.isna().to_numpy()
+    text = pd.Series(_as_text(s.to_numpy()), dtype=object).str.strip()
+    split = text.str.split("-", n=1, expand=True).reindex(columns=[0, 1]).fillna("").astype(object)
+    has_dash = text.str.contains("-", regex=False).to_numpy()
+    country = np.where(has_dash, split[0].str.strip(), "")
+    state = np.where(has_dash, split[1].str.strip(), text)
+    country[missing] = ""
+    state[missing] = ""
+    return country.astype(object), state.astype(object)
+
+
 # ---------------------------------------------------------------------------
 # Longest streak
 # ---------------------------------------------------------------------------
@@ -255,69 +322,85 @@ def rankings_by_value(df_sub, value_col, date_col, loc_col, loc_id_col, sid_col,
         cols.append(reg_col)
     d = df_sub[cols].dropna(subset=[value_col]).drop_duplicates()
     d = d.sort_values(by=[value_col, use_col], ascending=[False, True]).head(limit)
-    rows = []
-    for _, r in d.iterrows():
-        dt = r[use_col]
-        dt_str = pd.Timestamp(dt).strftime("%d %b %Y %H:%M") if pd.notna(dt) else "—"
-        loc = r.get(loc_col, "")
-        sid = r.get(sid_col, "")
-        lid = r.get(loc_id_col, "")
-        val = fmt(r[value_col])
-        loc_link = f'<a href="https://ebird.org/lifelist/{lid}" target="_blank">{loc}</a>' if lid else loc
-        dt_link = f'<a href="https://ebird.org/checklist/{sid}" target="_blank">{dt_str}</a>' if sid else dt_str
-        state_str = ""
-        country_str = ""
-        if reg_col and reg_col in r.index:
-            country, state = format_region_parts(r.get(reg_col))
-            state_str = state if state else ""
-            country_str = country if country else ""
-        rows.append((loc_link, state_str, country_str, dt_link, val))
-    return rows
+    loc_links = _anchors("https://ebird.org/lifelist/", _column_values(d, loc_id_col, ""), _column_values(d, loc_col, ""))
+    dt_links = _anchors("https://ebird.org/checklist/", _column_values(d, sid_col, ""), _format_datetimes(d[use_col]))
+    vals = [fmt(v) for v in d[value_col].tolist()]
+    countries, states = _region_parts(_column_values(d, reg_col))
+    return list(zip(loc_links, states, countries, dt_links, vals))
+
+
+def _top_n(frame, value_col, limit, by, ascending):
+    """``frame.sort_values(by, ascending).head(limit)`` with *value_col* (first, descending) pre-selected.
+
+    ``nlargest`` keeps only rows whose *value_col* reaches the *limit*-th largest value before the
+    full multi-key sort, so ties and tie-break order match sorting the whole frame.
+    """
+    if limit is not None and 0 < limit < len(frame):
+        kth = frame[value_col].nlargest(limit).iloc[-1]
+        frame = frame[frame[value_col] >= kth]
+    return frame.sort_values(by=by, ascending=ascending).head(limit)
+
+
+def location_facts(df_obs, cl_sub):
+    """One row per ``Location ID`` in *cl_sub* for the location-level rankings.
+
+    Columns: ``Location`` (first non-missing name), the region column (see :func:`region_column`),
+    ``Checklists``, ``First`` / ``First_SID`` / ``First_Location`` and ``Last`` / ``Last_SID``
+    (earliest / latest visit by ``datetime`` or ``Date``; missing when the location has no dated
+    checklist), plus ``_species`` (distinct countable species) and ``_individuals`` from *df_obs*
+    (missing for locations without observation rows; both omitted when *df_obs* is ``None``).
+    """
+    dt_col = "datetime" if "datetime" in cl_sub.columns else "Date"
+    reg_col = region_column(cl_sub, prefer_country=True)
+    named = {"Location": ("Location", "first"), "Checklists": ("Submission ID", "nunique"),
+             "First": (dt_col, "min"), "Last": (dt_col, "max")}
+    if reg_col:
+        named[reg_col] = (reg_col, "first")
+    facts = cl_sub.groupby("Location ID").agg(**named)
+
+    dated = cl_sub[cl_sub[dt_col].notna()]
+    if not dated.empty:
+        g = dated.groupby("Location ID")[dt_col]
+        first_rows = cl_sub.loc[g.idxmin()]
+        last_rows = cl_sub.loc[g.idxmax()]
+        facts["First_SID"] = pd.Series(first_rows["Submission ID"].to_numpy(), index=first_rows["Location ID"])
+        facts["First_Location"] = pd.Series(first_rows["Location"].to_numpy(), index=first_rows["Location ID"])
+        facts["Last_SID"] = pd.Series(last_rows["Submission ID"].to_numpy(), index=last_rows["Location ID"])
+    else:
+        facts["First_SID"] = facts["First_Location"] = facts["Last_SID"] = None
+
+    if df_obs is not None:
+        per_loc = pd.DataFrame(
+            {
+                "Location ID": df_obs["Location ID"],
+                "_base": countable_base_series(df_obs),
+                "_count": count_series(df_obs),
+            }
+        ).groupby("Location ID").agg(_species=("_base", "nunique"), _individuals=("_count", "sum"))
+        facts = facts.join(per_loc, how="left")
+    return facts.reset_index()
 
 
-def rankings_by_location(df_obs, cl_sub, mode, fmt, limit):
+def rankings_by_location(df_obs, cl_sub, mode, fmt, limit, *, facts=None):
     """Top N locations by total species or individuals.
 
     *mode*: ``'species'`` or ``'individuals'``. Ties by first visit date.
+    *facts*: optional precomputed :func:`location_facts` for *df_obs* / *cl_sub*.
     """
     if df_obs.empty or cl_sub.empty:
         return []
-    if mode == "species":
-        agg = df_obs.groupby("Location ID", group_keys=False).apply(
-            lambda g: countable_species_vectorized(g).dropna().nunique(),
-            include_groups=False,
-        ).reset_index(name="_val")
-    else:
-        agg = df_obs.groupby("Location ID", group_keys=False).apply(
-            lambda g: g["Count"].apply(safe_count).sum(),
-            include_groups=False,
-        ).reset_index(name="_val")
-    dt_col = "datetime" if "datetime" in cl_sub.columns else "Date"
-    loc_info = cl_sub.groupby("Location ID").agg(
-        Location=("Location", "first"),
-        Checklists=("Submission ID", "nunique"),
-    ).reset_index()
+    if facts is None:
+        facts = location_facts(df_obs, cl_sub)
     reg_col = region_column(cl_sub, prefer_country=True)
-    if reg_col:
-        loc_info = loc_info.merge(
-            cl_sub.groupby("Location ID")[reg_col].first().reset_index(),
-            on="Location ID", how="left",
-        )
-    first_dates = cl_sub.groupby("Location ID")[dt_col].min().reset_index().rename(columns={dt_col: "_first"})
-    merged = agg.merge(loc_info, on="Location ID", how="inner").merge(first_dates, on="Location ID", how="left")
-    merged = merged.sort_values(by=["_val", "_first", "Location"], ascending=[False, True, True]).head(limit)
-    rows = []
-    for _, r in merged.iterrows():
-        lid = r["Location ID"]
-        loc_link = f'<a href="https://ebird.org/lifelist/{lid}" target="_blank">{r["Location"]}</a>' if lid else r["Location"]
-        state_str = ""
-        country_str = ""
-        if reg_col and reg_col in merged.columns:
-            country, state = format_region_parts(r.get(reg_col))
-            state_str = state if state else ""
-            country_str = country if country else ""
-        rows.append((loc_link, state_str, country_str, f"{int(r['Checklists']):,}", fmt(r["_val"])))
-    return rows
+    # _val / _first: ranking value and tie-break date (working columns on the facts slice).
+    val_col = "_species" if mode == "species" else "_individuals"
+    merged = facts[facts[val_col].notna()].rename(columns={val_col: "_val", "First": "_first"})
+    merged = _top_n(merged, "_val", limit, ["_val", "_first", "Location"], [False, True, True])
+    loc_links = _anchors("https://ebird.org/lifelist/", merged["Location ID"], merged["Location"])
+    countries, states = _region_parts(_column_values(merged, reg_col))
+    checklists = [f"{int(v):,}" for v in merged["Checklists"].tolist()]
+    vals = [fmt(v) for v in merged["_val"].tolist()]
+    return list(zip(loc_links, states, countries, checklists, vals))
 
 
 def rankings_by_individuals(df_obs, limit):
@@ -325,9 +408,9 @@ def rankings_by_individuals(df_obs, limit):
     if df_obs.empty:
         return []
     df_s = df_obs.copy()
-    df_s["_base"] = countable_species_vectorized(df_s)
+    df_s["_base"] = countable_base_series(df_s)
     df_s = df_s.dropna(subset=["_base"])
-    df_s["_count"] = df_s["Count"].apply(safe_count)
+    df_s["_count"] = count_series(df_s)
     by_base = df_s.groupby("_base").agg(
         total=("_count", "sum"),
         common_name=("Common Name", lambda s: s.value_counts().index[0] if len(s) > 0 else ""),
@@ -335,11 +418,8 @@ def rankings_by_individuals(df_obs, limit):
     by_base = by_base.sort_values(by=["total", "_base"], ascending=[False, True])
     if limit is not None:
         by_base = by_base.head(limit)
-    rows = []
-    for _, r in by_base.iterrows():
-        name = r["common_name"] if pd.notna(r["common_name"]) else r["_base"]
-        rows.append((str(name), "—", f"{int(r['total']):,}"))
-    return rows
+    names = _as_text(by_base["common_name"].where(by_base["common_name"].notna(), by_base["_base"]).to_numpy(dtype=object))
+    return [(name, "—", f"{int(v):,}") for name, v in zip(names, by_base["total"].tolist())]
 
 
 def rankings_by_checklists(df_obs, limit):
@@ -347,7 +427,7 @@ def rankings_by_checklists(df_obs, limit):
     if df_obs.empty:
         return []
     df_s = df_obs.copy()
-    df_s["_base"] = countable_species_vectorized(df_s)
+    df_s["_base"] = countable_base_series(df_s)
     df_s = df_s.dropna(subset=["_base"])
     by_base = df_s.groupby("_base").agg(
         n_checklists=("Submission ID", "nunique"),
@@ -356,11 +436,36 @@ def rankings_by_checklists(df_obs, limit):
     by_base = by_base.sort_values(by=["n_checklists", "_base"], ascending=[False, True])
     if limit is not None:
         by_base = by_base.head(limit)
-    rows = []
-    for _, r in by_base.iterrows():
-        name = r["common_name"] if pd.notna(r["common_name"]) else r["_base"]
-        rows.append((str(name), "—", f"{int(r['n_checklists']):,}"))
-    return rows
+    names = _as_text(by_base["common_name"].where(by_base["common_name"].notna(), by_base["_base"]).to_numpy(dtype=object))
+    return [(name, "—", f"{int(v):,}") for name, v in zip(names, by_base["n_checklists"].tolist())]
+
+
+def _species_common_from_common(name: str) -> str:
+    """Parent species common name: the part before `` (`` (``"Magpie (White-backed)"`` → ``"Magpie"``)."""
+    s = (name or "").strip()
+    if not s:
+        return ""
+    idx = s.find(" (")
+    return s[:idx] if idx != -1 else s
+
+
+def _subspecies_label_from_common(name: str) -> str:
+    """Subspecies label inside the trailing parentheses (``"White-backed"``), else the name itself."""
+    s = (name or "").strip()
+    if not s:
+        return ""
+    start = s.find(" (")
+    end = s.rfind(")")
+    if start != -1 and end != -1 and end > start + 2:
+        return s[start + 2 : end].strip()
+    return s
+
+
+def _grouped_mode(rows, group_col, value_col):
+    """Most frequent *value_col* per *group_col* (ties: value seen first, by ``pos``), as a Series."""
+    pairs = rows.groupby([group_col, value_col], sort=False).agg(n=("pos", "size"), first=("pos", "min")).reset_index()
+    pairs = pairs.sort_values([group_col, "n", "first"], ascending=[True, False, True], kind="stable")
+    return pairs.drop_duplicates(subset=[group_col], keep="first").set_index(group_col)[value_col]
 
 
 def rankings_subspecies_hierarchical(df_obs, limit=None):
@@ -392,113 +497,96 @@ def rankings_subspecies_hierarchical(df_obs, limit=None):
     if df_obs.empty:
         return []
 
-    df = df_obs.copy()
-    sci = df["Scientific Name"].fillna("").astype(str).str.strip()
-    common = df["Common Name"].fillna("").astype(str).str.strip()
-
+    # Per distinct Scientific Name: validity, subspecies flag, species-level name.
+    sci_codes, sci_uniques = pd.factorize(df_obs["Scientific Name"])
+    sci_strip = [str(v).strip() for v in sci_uniques]
+    sci_parts = [v.split() for v in sci_strip]
     # Exclude spuhs, hybrids, domestic types, and species-level slash taxa
-    spuh = sci.str.contains(r" sp\.", case=False, na=False) | sci.str.lower().str.endswith(" sp")
-    hybrid = sci.str.contains(" x ", na=False) | common.str.lower().str.contains(r"\(hybrid\)", na=False)
-    domestic = common.str.contains("Domestic", na=False) | common.str.contains(r"\(Domestic type\)", na=False)
-    parts = sci.str.split()
-    species_level_slash = parts.apply(lambda p: len(p) > 1 and "/" in str(p[1]) if isinstance(p, list) else False)
-
-    keep_valid = ~spuh & ~hybrid & ~domestic & ~species_level_slash
-    if not keep_valid.any():
-        return []
-
-    df = df.loc[keep_valid].copy()
-    sci = df["Scientific Name"].fillna("").astype(str).str.strip()
-    common = df["Common Name"].fillna("").astype(str).str.strip()
-    parts = sci.str.split()
-    is_sub = parts.apply(lambda p: len(p) >= 3 if isinstance(p, list) else False)
-
-    # Species-level scientific name (first two parts) used for grouping
-    def _base_sci(p):
-        if isinstance(p, list) and len(p) >= 2:
-            return f"{p[0]} {p[1]}"
-        if isinstance(p, list) and len(p) == 1:
-            return p[0]
-        return ""
-
-    df["_base_sci"] = parts.apply(_base_sci)
-    df["_is_subspecies"] = is_sub
-    df["_count"] = df["Count"].apply(safe_count)
-
-    # Common-name normalisation: parent species common name = before " ("
-    def _species_common_from_common(name: str) -> str:
-        s = (name or "").strip()
-        if not s:
-            return ""
-        idx = s.find(" (")
-        return s[:idx] if idx != -1 else s
+    sci_ok = np.array(
+        [
+            not (" sp." in v.lower() or v.lower().endswith(" sp") or " x " in v or (len(p) > 1 and "/" in p[1]))
+            for v, p in zip(sci_strip, sci_parts)
+        ]
+        + [True],  # missing name: "" (kept, never a subspecies)
+        dtype=bool,
+    )
+    sci_is_sub = np.array([len(p) >= 3 for p in sci_parts] + [False], dtype=bool)
+    sci_base = [" ".join(p[:2]) for p in sci_parts] + [""]
 
-    def _subspecies_label_from_common(name: str) -> str:
-        s = (name or "").strip()
-        if not s:
-            return ""
-        start = s.find(" (")
-        end = s.rfind(")")
-        if start != -1 and end != -1 and end > start + 2:
-            return s[start + 2 : end].strip()
-        return s
+    # Per distinct Common Name: hybrid / domestic flags and the parent-species common name.
+    com_codes, com_uniques = pd.factorize(df_obs["Common Name"])
+    com_strip = [str(v).strip() for v in com_uniques] + [""]
+    com_ok = np.array(
+        [
+            not ("(hybrid)" in c.lower() or "Domestic" in c or "(Domestic type)" in c)
+            for c in com_strip
+        ],
+        dtype=bool,
+    )
+    species_common_of = [_species_common_from_common(c) for c in com_strip]
 
-    df["_species_common_base"] = common.apply(_species_common_from_common)
-    df["_sub_label"] = common.apply(_subspecies_label_from_common)
+    keep = sci_ok[sci_codes] & com_ok[com_codes]
+    if not keep.any():
+        return []
+    # Missing names map to the extra trailing slot (code -1).
+    rows = pd.DataFrame(
+        {
+            "sci": sci_codes[keep],
+            "com": com_codes[keep],
+            "count": count_series(df_obs).to_numpy()[keep],
+        }
+    )
+    rows["pos"] = np.arange(len(rows))
+    # Sorted species-level names; codes follow that order (grouping order of the report).
+    base_names, base_of_sci = np.unique(np.array(sci_base, dtype=str), return_inverse=True)
+    rows["base"] = base_of_sci[rows["sci"]]
+    rows["is_sub"] = sci_is_sub[rows["sci"]]
+    sub_bases = np.unique(rows.loc[rows["is_sub"], "base"])
+    if len(sub_bases) == 0:
+        return []
+    rows = rows[rows["base"].isin(sub_bases)]
+
+    species_only = rows[~rows["is_sub"]].groupby("base")["count"].sum()
+
+    # Species common name: most frequent parent common name (ties: first seen).
+    scb_names, scb_of_com = np.unique(np.array(species_common_of, dtype=str), return_inverse=True)
+    rows["scb"] = scb_of_com[rows["com"]]
+    species_common = _grouped_mode(rows, "base", "scb").map(lambda c: scb_names[c])
+
+    # Subspecies: individuals and most frequent full common name per Scientific Name.
+    sub = rows[rows["is_sub"]]
+    sub_totals = sub.groupby("sci")["count"].sum()
+    sub_common = _grouped_mode(sub[sub["com"] >= 0], "sci", "com")
+    sub_base = sub.groupby("sci")["base"].first()
+    sub_frame = pd.DataFrame({"base": sub_base, "individuals": sub_totals})
+    sub_frame["sci_name"] = [str(sci_uniques[c]) for c in sub_frame.index]
+    sub_frame["common_full"] = [
+        str(com_uniques[sub_common[c]]) if c in sub_common.index else "" for c in sub_frame.index
+    ]
+    sub_frame = sub_frame.sort_values(["base", "sci_name"], kind="stable")
 
     species_blocks = []
-
-    # Group by species (base scientific name)
-    for base_sci, g in df.groupby("_base_sci"):
-        # Subspecies rows for this species
-        g_sub = g[g["_is_subspecies"]]
-        if g_sub.empty:
-            # Skip species that never appear as true subspecies
-            continue
-
-        # Species-level rows (recorded without subspecies)
-        g_species_only = g[~g["_is_subspecies"]]
-        species_only_count = int(g_species_only["_count"].sum()) if not g_species_only.empty else 0
-
-        # Subspecies aggregation by full scientific name
-        subspecies_rows = []
-        for subsci, sg in g_sub.groupby("Scientific Name"):
-            total_ind = int(sg["_count"].sum())
-            # Pick a representative common name for this subspecies
-            common_vals = sg["Common Name"].dropna().astype(str)
-            common_full = common_vals.value_counts().index[0] if not common_vals.empty else ""
-            label = _subspecies_label_from_common(common_full) or common_full
-            subspecies_rows.append(
-                {
-                    "subspecies_common": str(label),
-                    "subspecies_common_full": str(common_full),
-                    "subspecies_scientific": str(subsci),
-                    "individuals": total_ind,
-                }
-            )
-
-        if not subspecies_rows:
-            continue
-
+    for base, children in sub_frame.groupby("base", sort=True):
+        subspecies_rows = [
+            {
+                "subspecies_common": str(_subspecies_label_from_common(common_full) or common_full),
+                "subspecies_common_full": common_full,
+                "subspecies_scientific": sci_name,
+                "individuals": int(n),
+            }
+            for sci_name, common_full, n in zip(children["sci_name"], children["common_full"], children["individuals"])
+        ]
         # Sort subspecies alphabetically by label
         subspecies_rows.sort(key=lambda d: d["subspecies_common"].lower())
 
+        species_only_count = int(species_only.get(base, 0))
         subspecies_total = sum(d["individuals"] for d in subspecies_rows)
         total = species_only_count + subspecies_total
         frac = (subspecies_total / total) if total > 0 else None
-
-        # Species common name: most frequent base common name across all rows in this group
-        base_common_vals = g["_species_common_base"].dropna().astype(str)
-        if not base_common_vals.empty:
-            species_common = base_common_vals.value_counts().index[0]
-        else:
-            # Fallback to any common name in the group
-            species_common = g["Common Name"].dropna().astype(str).value_counts().index[0]
-
         species_blocks.append(
             {
-                "species_common": str(species_common),
-                "species_scientific": str(base_sci),
+                "species_common": str(species_common[base]),
+                "species_scientific": str(base_names[base]),
                 "total_individuals": int(total),
                 "species_only_individuals": int(species_only_count),
                 "subspecies_total_individuals": int(subspecies_total),
@@ -527,9 +615,9 @@ def rankings_seen_once(df_obs, limit=None):
     if df_obs.empty:
         return []
     df_s = df_obs.copy()
-    df_s["_base"] = countable_species_vectorized(df_s)
+    df_s["_base"] = countable_base_series(df_s)
     df_s = df_s.dropna(subset=["_base"])
-    df_s["_count"] = df_s["Count"].apply(safe_count)
+    df_s["_count"] = count_series(df_s)
     dt_col = "datetime" if "datetime" in df_s.columns else "Date"
     by_base = df_s.groupby("_base").agg(
         n_checklists=("Submission ID", "nunique"),
@@ -552,24 +640,12 @@ def rankings_seen_once(df_obs, limit=None):
     seen_once = by_base[by_base["n_checklists"] == 1].sort_values("common_name")
     if limit is not None:
         seen_once = seen_once.head(limit)
-    rows = []
-    for _, r in seen_once.iterrows():
-        name = r["common_name"] if pd.notna(r["common_name"]) else r["_base"]
-        lid = r.get("Location_ID")
-        loc = r.get("Location", "")
-        sid = r.get("Submission_ID")
-        dt = r.get("_dt")
-        dt_str = pd.Timestamp(dt).strftime("%d %b %Y %H:%M") if pd.notna(dt) else "—"
-        loc_link = f'<a href="https://ebird.org/lifelist/{lid}" target="_blank">{loc}</a>' if lid else loc
-        dt_link = f'<a href="https://ebird.org/checklist/{sid}" target="_blank">{dt_str}</a>' if sid else dt_str
-        state_str = ""
-        country_str = ""
-        if "_region" in r.index:
-            country, state = format_region_parts(r.get("_region"))
-            state_str = state if state else ""
-            country_str = country if country else ""
-        rows.append((str(name), loc_link, state_str, country_str, dt_link, f"{int(r['checklist_count']):,}"))
-    return rows
+    names = _as_text(seen_once["common_name"].where(seen_once["common_name"].notna(), seen_once["_base"]).to_numpy(dtype=object))
+    loc_links = _anchors("https://ebird.org/lifelist/", seen_once["Location_ID"], seen_once["Location"])
+    dt_links = _anchors("https://ebird.org/checklist/", seen_once["Submission_ID"], _format_datetimes(seen_once["_dt"]))
+    countries, states = _region_parts(_column_values(seen_once, "_region"))
+    counts = [f"{int(v):,}" for v in seen_once["checklist_count"].tolist()]
+    return list(zip(names, loc_links, states, countries, dt_links, counts))
 
 
 def rankings_high_counts(df_obs, tie_break="last", sort_mode="total_count"):
@@ -588,50 +664,43 @@ def rankings_high_counts(df_obs, tie_break="last", sort_mode="total_count"):
     if sort_key_mode not in ("total_count", "alphabetical"):
         sort_key_mode = "total_count"
 
-    df_s = df_obs.copy()
-    df_s["_base"] = countable_species_vectorized(df_s)
-    df_s = df_s.dropna(subset=["_base"])
-    if df_s.empty:
+    base = countable_base_series(df_obs)
+    keep = base.notna().to_numpy()
+    if not keep.any():
         return []
-
-    dt_col = "datetime" if "datetime" in df_s.columns else "Date"
-    if dt_col in df_s.columns:
-        df_s["_dt"] = pd.to_datetime(df_s[dt_col], errors="coerce")
+    reg_col = region_column(df_obs, prefer_country=True)
+    cols = [c for c in ("Common Name", "Location ID", "Location", "Submission ID", reg_col) if c and c in df_obs.columns]
+    # Working columns: _base = countable species key; _code = _base in first-appearance order;
+    # _count = numeric Count; _dt = parsed checklist date/time; _dt_sort = _dt with NaT ranked
+    # last for the tie-break; _pos = row position (final tie-break: first row wins).
+    df_s = df_obs.loc[keep, cols].copy()
+    df_s["_base"] = base[keep]
+    df_s["_code"] = pd.factorize(df_s["_base"])[0]
+    df_s["_count"] = count_series(df_obs)[keep]
+    dt_col = "datetime" if "datetime" in df_obs.columns else "Date"
+    if dt_col in df_obs.columns:
+        df_s["_dt"] = pd.to_datetime(df_obs.loc[keep, dt_col], errors="coerce")
     else:
         df_s["_dt"] = pd.NaT
-    df_s["_count"] = df_s["Count"].apply(safe_count)
-    reg_col = region_column(df_s, prefer_country=True)
-
-    rows = []
-    for _base, grp in df_s.groupby("_base", sort=False):
-        max_count = int(grp["_count"].max())
-        top = grp[grp["_count"] == max_count].copy()
-        if top.empty:
-            continue
-        top["_dt_sort"] = pd.to_datetime(top["_dt"], errors="coerce")
-        top["_dt_sort"] = top["_dt_sort"].fillna(
-            pd.Timestamp.max if tie_mode == "first" else pd.Timestamp.min
-        )
-        top = top.sort_values(
-            by=["_dt_sort", "Submission ID"],
-            ascending=[tie_mode == "first", True],
-        )
-        r = top.iloc[0]
-        name = r["Common Name"] if pd.notna(r.get("Common Name")) else _base
-        lid = r.get("Location ID")
-        loc = r.get("Location", "")
-        sid = r.get("Submission ID")
-        dt = r.get("_dt")
-        dt_str = pd.Timestamp(dt).strftime("%d %b %Y %H:%M") if pd.notna(dt) else "—"
-        loc_link = f'<a href="https://ebird.org/lifelist/{lid}" target="_blank">{loc}</a>' if lid else loc
-        dt_link = f'<a href="https://ebird.org/checklist/{sid}" target="_blank">{dt_str}</a>' if sid else dt_str
-        state_str = ""
-        country_str = ""
-        if reg_col and reg_col in r.index:
-            country, state = format_region_parts(r.get(reg_col))
-            state_str = state if state else ""
-            country_str = country if country else ""
-        rows.append((str(name), loc_link, state_str, country_str, dt_link, f"{max_count:,}"))
+    df_s["_dt_sort"] = df_s["_dt"].fillna(pd.Timestamp.max if tie_mode == "first" else pd.Timestamp.min)
+    df_s["_pos"] = np.arange(len(df_s))
+    if "Submission ID" not in df_s.columns:
+        df_s["Submission ID"] = None
+
+    # Rows at each species' maximum count, then one sort picks the tie-break winner per species.
+    top = df_s[df_s["_count"] == df_s.groupby("_code")["_count"].transform("max")]
+    top = top.sort_values(
+        by=["_code", "_dt_sort", "Submission ID", "_pos"],
+        ascending=[True, tie_mode == "first", True, True],
+    ).drop_duplicates(subset=["_code"], keep="first")
+
+    common = _column_values(top, "Common Name")
+    names = _as_text(np.where(pd.notna(common), common, top["_base"].to_numpy(dtype=object)))
+    loc_links = _anchors("https://ebird.org/lifelist/", _column_values(top, "Location ID"), _column_values(top, "Location", ""))
+    dt_links = _anchors("https://ebird.org/checklist/", top["Submission ID"], _format_datetimes(top["_dt"]))
+    countries, states = _region_parts(_column_values(top, reg_col))
+    counts = [f"{int(v):,}" for v in top["_count"].tolist()]
+    rows = list(zip(names, loc_links, states, countries, dt_links, counts))
 
     if sort_key_mode == "alphabetical":
         rows.sort(key=lambda x: str(x[0]).lower())
@@ -645,50 +714,89 @@ def rankings_high_counts(df_obs, tie_break="last", sort_mode="total_count"):
     return rows
 
 
-def rankings_by_visits(cl_sub, limit):
+def rankings_by_visits(cl_sub, limit, *, facts=None):
     """Top N most visited locations; ties by oldest first.
 
+    *facts*: optional precomputed :func:`location_facts` for *cl_sub*.
     Returns list of (loc_link, state, country, first_link, last_link, count).
     """
     if cl_sub.empty:
         return []
-    dt_col = "datetime" if "datetime" in cl_sub.columns else "Date"
-    first_idx = cl_sub.groupby("Location ID")[dt_col].idxmin().dropna()
-    last_idx = cl_sub.groupby("Location ID")[dt_col].idxmax().dropna()
-    first_rows = cl_sub.loc[first_idx, ["Location ID", "Location", dt_col, "Submission ID"]].rename(
-        columns={dt_col: "First", "Submission ID": "First_SID"}
+    if facts is None:
+        facts = location_facts(None, cl_sub)
+    reg_col = region_column(cl_sub, prefer_country=True)
+    # Location name as of the first visit; locations without a dated checklist are not ranked.
+    vc = facts[facts["First"].notna()].drop(columns=["Location"]).rename(
+        columns={"First_Location": "Location", "Checklists": "Count"}
     )
-    last_rows = cl_sub.loc[last_idx, ["Location ID", "Location", dt_col, "Submission ID"]].rename(
-        columns={dt_col: "Last", "Submission ID": "Last_SID"}
+    vc = _top_n(vc, "Count", limit, ["Count", "First"], [False, True])
+    # Link location names to the user’s mychecklists view for that hotspot.
+    loc_links = _anchors("https://ebird.org/mychecklists/", vc["Location ID"], vc["Location"])
+    countries, states = _region_parts(_column_values(vc, reg_col))
+    # Missing SIDs (no dated checklist) show the plain date text.
+    first_sids = vc["First_SID"].where(vc["First_SID"].notna(), "")
+    last_sids = vc["Last_SID"].where(vc["Last_SID"].notna(), "")
+    first_links = _anchors("https://ebird.org/checklist/", first_sids, _format_datetimes(vc["First"]))
+    last_links = _anchors("https://ebird.org/checklist/", last_sids, _format_datetimes(vc["Last"]))
+    counts = [f"{int(v):,}" for v in vc["Count"].tolist()]
+    return list(zip(loc_links, states, countries, first_links, last_links, counts))
+
+
+def _not_seen_recently_by_group(df_obs, group=None, reference_date=None):
+    """Shared engine for the "not seen recently" rankings.
+
+    Finds each countable base species' last observation per *group* value (one ``groupby`` over
+    ``(group, base species)``; rows whose group is missing are ignored) and returns a dict
+    group → rows for groups with at least one species last seen before the past 12 months.
+    *group* is a Series aligned with *df_obs*; ``None`` puts every row in group ``None``.
+    """
+    if df_obs.empty:
+        return {}
+    dt_col = "datetime" if "datetime" in df_obs.columns else "Date"
+    if dt_col not in df_obs.columns:
+        return {}
+    # Working frame (not eBird export): _group = ranking group; _base = countable species key;
+    # _dt = observation date/time.
+    work = pd.DataFrame(
+        {
+            "_group": 0 if group is None else group,
+            "_base": countable_base_series(df_obs),
+            "_dt": pd.to_datetime(df_obs[dt_col], errors="coerce"),
+        },
+        index=df_obs.index,
     )
-    vc = cl_sub.groupby("Location ID").agg(Count=("Submission ID", "nunique")).reset_index()
-    vc = vc.merge(first_rows, on="Location ID").merge(last_rows[["Location ID", "Last", "Last_SID"]], on="Location ID")
-    reg_col = region_column(cl_sub, prefer_country=True)
-    if reg_col:
-        vc = vc.merge(
-            cl_sub.groupby("Location ID")[reg_col].first().reset_index(),
-            on="Location ID", how="left",
+    for col in ("Common Name", "Submission ID"):
+        if col in df_obs.columns:
+            work[col] = df_obs[col]
+    work = work[work["_group"].notna() & work["_base"].notna() & work["_dt"].notna()]
+    if work.empty:
+        return {}
+    # First row wins a tie on the latest date/time, as with a per-species ``idxmax``.
+    idx = work.groupby(["_group", "_base"])["_dt"].idxmax()
+    last_rows = work.loc[idx.to_numpy()]
+    if reference_date is None:
+        ref = pd.Timestamp.now(tz=None).normalize()
+    else:
+        ref = pd.Timestamp(reference_date).normalize()
+    cutoff = ref - pd.DateOffset(months=12)
+    last_rows = last_rows[last_rows["_dt"] < cutoff]
+    if last_rows.empty:
+        return {}
+    last_rows = last_rows.assign(_days=(ref - last_rows["_dt"].dt.normalize()).dt.days)
+    out = {}
+    for key, g in last_rows.groupby("_group", sort=False):
+        g = g.sort_values("_days", ascending=False)
+        common = _column_values(g, "Common Name")
+        names = _as_text(np.where(pd.notna(common), common, g["_base"].to_numpy(dtype=object)))
+        last_links = _anchors(
+            "https://ebird.org/checklist/",
+            _column_values(g, "Submission ID"),
+            _format_datetimes(g["_dt"]),
+            attrs=' target="_blank" rel="noopener noreferrer"',
         )
-    vc = vc.sort_values(by=["Count", "First"], ascending=[False, True]).head(limit)
-    rows = []
-    for _, r in vc.iterrows():
-        lid = r["Location ID"]
-        # Link location names to the user’s mychecklists view for that hotspot.
-        loc_link = f'<a href="https://ebird.org/mychecklists/{lid}" target="_blank">{r["Location"]}</a>' if lid else r["Location"]
-        state_str = ""
-        country_str = ""
-        if reg_col and reg_col in vc.columns:
-            country, state = format_region_parts(r.get(reg_col))
-            state_str = state if state else ""
-            country_str = country if country else ""
-        first_str = pd.Timestamp(r["First"]).strftime("%d %b %Y %H:%M") if pd.notna(r["First"]) else "—"
-        last_str = pd.Timestamp(r["Last"]).strftime("%d %b %Y %H:%M") if pd.notna(r["Last"]) else "—"
-        first_sid = r.get("First_SID")
-        last_sid = r.get("Last_SID")
-        first_link = f'<a href="https://ebird.org/checklist/{first_sid}" target="_blank">{first_str}</a>' if pd.notna(first_sid) and first_sid else first_str
-        last_link = f'<a href="https://ebird.org/checklist/{last_sid}" target="_blank">{last_str}</a>' if pd.notna(last_sid) and last_sid else last_str
-        rows.append((loc_link, state_str, country_str, first_link, last_link, f"{int(r['Count']):,}"))
-    return rows
+        days = [f"{int(d):,} days" for d in g["_days"].tolist()]
+        out[None if group is None else key] = list(zip(names, last_links, days))
+    return out
 
 
 def rankings_not_seen_recently(df_obs, reference_date=None):
@@ -703,87 +811,87 @@ def rankings_not_seen_recently(df_obs, reference_date=None):
 
     *reference_date* defaults to local today (normalized); pass a fixed date in tests for determinism.
     """
-    if df_obs.empty:
-        return []
-    df_s = df_obs.copy()
-    df_s["_base"] = countable_species_vectorized(df_s)
-    df_s = df_s.dropna(subset=["_base"])
-    if df_s.empty:
-        return []
-    dt_col = "datetime" if "datetime" in df_s.columns else "Date"
-    if dt_col not in df_s.columns:
-        return []
-    dts = pd.to_datetime(df_s[dt_col], errors="coerce")
-    df_s = df_s.assign(_dt=dts).dropna(subset=["_dt"])
-    if df_s.empty:
-        return []
-    idx = df_s.groupby("_base")["_dt"].idxmax()
-    last_rows = df_s.loc[idx].copy()
-    if reference_date is None:
-        ref = pd.Timestamp.now(tz=None).normalize()
-    else:
-        ref = pd.Timestamp(reference_date).normalize()
-    cutoff = ref - pd.DateOffset(months=12)
-    last_rows = last_rows[last_rows["_dt"] < cutoff]
-    if last_rows.empty:
-        return []
-    last_rows["_days"] = (ref - last_rows["_dt"].dt.normalize()).dt.days
-    last_rows = last_rows.sort_values("_days", ascending=False)
-    rows = []
-    for _, r in last_rows.iterrows():
-        common = r.get("Common Name")
-        name = str(common) if pd.notna(common) else str(r["_base"])
-        sid = r.get("Submission ID")
-        dt_str = pd.Timestamp(r["_dt"]).strftime("%d %b %Y %H:%M") if pd.notna(r["_dt"]) else "—"
-        if sid:
-            last_link = (
-                f'<a href="https://ebird.org/checklist/{sid}" target="_blank" rel="noopener noreferrer">'
-                f"{dt_str}</a>"
-            )
-        else:
-            last_link = dt_str
-        d = int(r["_days"])
-        days_str = f"{d:,} days"
-        rows.append((name, last_link, days_str))
-    return rows
+    return _not_seen_recently_by_group(df_obs, reference_date=reference_date).get(None, [])
 
 
-def rankings_not_seen_recently_in_country(df_obs, cl, country_key, reference_date=None):
-    """Countable species whose last observation *in this country* was before the past 12 months.
+def rankings_not_seen_recently_by_country(df_obs, cl, country_keys=None, reference_date=None):
+    """Per-country :func:`rankings_not_seen_recently_in_country` rows in one pass.
 
-    Uses the same checklist → country key mapping as :func:`country_summary_stats` /
-    :func:`checklist_country_keys` (``Country`` column, else ``State/Province``). Only
-    observation rows whose checklist falls in *country_key* are considered when finding
-    each species’ last seen date.
-
-    Returns the same row shape as :func:`rankings_not_seen_recently`. Empty when
-    *country_key* is missing or ``_UNKNOWN``.
+    Maps each observation to its checklist's country once and finds the last-seen row per
+    ``(country, base species)`` in a single ``groupby``. Returns a dict country key → rows in
+    *country_keys* order (default: every dated checklist country, sorted); countries with nothing
+    to list map to ``[]``. ``_UNKNOWN`` and empty keys always map to ``[]``.
     """
     if (
         df_obs.empty
         or cl.empty
-        or not country_key
-        or country_key == "_UNKNOWN"
         or "Submission ID" not in df_obs.columns
         or "Submission ID" not in cl.columns
     ):
-        return []
-    cl2 = cl.dropna(subset=["Date"]).copy()
+        return {ck: [] for ck in (country_keys or [])}
+    cl2 = cl.dropna(subset=["Date"])
     if cl2.empty:
-        return []
-    ck_series = checklist_country_keys(cl2)
-    cl2 = cl2.copy()
-    cl2["_country_key"] = ck_series
-    sid_map = cl2.drop_duplicates(subset=["Submission ID"]).set_index("Submission ID")["_country_key"]
+        return {ck: [] for ck in (country_keys or [])}
+    sid_map = pd.Series(country_key_series(cl2).to_numpy(), index=cl2["Submission ID"])
+    sid_map = sid_map[~sid_map.index.duplicated()]
+    if country_keys is None:
+        country_keys = sorted(sid_map.unique(), key=lambda k: str(k))
+    wanted = [ck for ck in country_keys if ck and ck != "_UNKNOWN"]
     obs_key = df_obs["Submission ID"].map(sid_map)
-    sub = df_obs[obs_key == country_key].copy()
-    return rankings_not_seen_recently(sub, reference_date=reference_date)
+    obs_key = obs_key.where(obs_key.isin(wanted))
+    by_country = _not_seen_recently_by_group(df_obs, obs_key, reference_date=reference_date)
+    return {ck: by_country.get(ck, []) if ck in wanted else [] for ck in country_keys}
+
+
+def rankings_not_seen_recently_in_country(df_obs, cl, country_key, reference_date=None):
+    """Countable species whose last observation *in this country* was before the past 12 months.
+
+    Uses the same checklist → country key mapping as :func:`country_summary_stats` /
+    :func:`checklist_country_keys` (``Country`` column, else ``State/Province``). Only
+    observation rows whose checklist falls in *country_key* are considered when finding
+    each species’ last seen date.
+
+    Returns the same row shape as :func:`rankings_not_seen_recently`. Empty when
+    *country_key* is missing or ``_UNKNOWN``. Use :func:`rankings_not_seen_recently_by_country`
+    for several countries at once.
+    """
+    return rankings_not_seen_recently_by_country(
+        df_obs, cl, [country_key], reference_date=reference_date
+    )[country_key]
 
 
 # ---------------------------------------------------------------------------
 # Rankings orchestrator
 # ---------------------------------------------------------------------------
 
+def checklist_facts(df, cl, dur_col=None, dist_col=None):
+    """One row per checklist in *cl* with the values the checklist-level rankings sort on.
+
+    Species and individuals per checklist come from a single ``groupby().agg`` over the
+    ``_base`` / ``_count`` derived columns of *df* (no per-checklist Python calls).
+
+    Working columns (not eBird export), missing where the ranking does not apply:
+    ``_nsp`` = countable species on the checklist; ``_nind`` = individuals;
+    ``_dur`` = numeric *dur_col* (non-numeric → 0; missing when *dur_col* is blank);
+    ``_dist`` = numeric *dist_col* (same rules).
+    """
+    per_cl = pd.DataFrame(
+        {
+            "Submission ID": df["Submission ID"],
+            "_base": countable_base_series(df),
+            "_count": count_series(df),
+        }
+    ).groupby("Submission ID").agg(_nsp=("_base", "nunique"), _nind=("_count", "sum"))
+    facts = cl.copy()
+    sid = facts["Submission ID"]
+    facts["_nsp"] = sid.map(per_cl["_nsp"])
+    facts["_nind"] = sid.map(per_cl["_nind"])
+    for src, col in ((dur_col, "_dur"), (dist_col, "_dist")):
+        if src:
+            facts[col] = pd.to_numeric(facts[src], errors="coerce").fillna(0).where(facts[src].notna())
+    return facts
+
+
 def compute_rankings(
     df,
     cl,
@@ -797,36 +905,22 @@ def compute_rankings(
 
     Returns dict of section key → list of row tuples.
     """
-    cl_with_dur = cl.dropna(subset=[dur_col]).copy() if dur_col else pd.DataFrame()
-    if dur_col and not cl_with_dur.empty:
-        cl_with_dur["_dur"] = pd.to_numeric(cl_with_dur[dur_col], errors="coerce").fillna(0)
-    cl_with_dist = cl.dropna(subset=[dist_col]).copy() if dist_col else pd.DataFrame()
-    if dist_col and not cl_with_dist.empty:
-        cl_with_dist["_dist"] = pd.to_numeric(cl_with_dist[dist_col], errors="coerce").fillna(0)
     if df.empty:
         return {k: [] for k in ("time", "dist", "species", "individuals",
                                  "species_loc", "individuals_loc", "visited",
                                  "species_individuals", "species_checklists",
                                  "species_high_counts", "seen_once", "subspecies", "not_seen_recently")}
-    species_per_cl = df.groupby("Submission ID", group_keys=False).apply(
-        lambda g: countable_species_vectorized(g).dropna().nunique(),
-        include_groups=False,
-    ).reset_index(name="_nsp")
-    ind_per_cl = df.groupby("Submission ID", group_keys=False).apply(
-        lambda g: g["Count"].apply(safe_count).sum(),
-        include_groups=False,
-    ).reset_index(name="_nind")
-    cl_species = cl.merge(species_per_cl, on="Submission ID", how="inner")
-    cl_individuals = cl.merge(ind_per_cl, on="Submission ID", how="inner")
+    facts = checklist_facts(df, cl, dur_col, dist_col)
+    loc_facts = location_facts(df, cl)
 
     return {
-        "time": rankings_by_value(cl_with_dur, "_dur", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{int(round(x))} min", limit) if dur_col and not cl_with_dur.empty else [],
-        "dist": rankings_by_value(cl_with_dist, "_dist", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{x:,.2f} km", limit) if dist_col and not cl_with_dist.empty else [],
-        "species": rankings_by_value(cl_species, "_nsp", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{int(x):,}", limit) if not cl_species.empty else [],
-        "individuals": rankings_by_value(cl_individuals, "_nind", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{int(x):,}", limit) if not cl_individuals.empty else [],
-        "species_loc": rankings_by_location(df, cl, "species", lambda x: f"{int(x):,}", limit),
-        "individuals_loc": rankings_by_location(df, cl, "individuals", lambda x: f"{int(x):,}", limit),
-        "visited": rankings_by_visits(cl, limit),
+        "time": rankings_by_value(facts, "_dur", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{int(round(x))} min", limit) if dur_col else [],
+        "dist": rankings_by_value(facts, "_dist", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{x:,.2f} km", limit) if dist_col else [],
+        "species": rankings_by_value(facts, "_nsp", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{int(x):,}", limit),
+        "individuals": rankings_by_value(facts, "_nind", "Date", "Location", "Location ID", "Submission ID", lambda x: f"{int(x):,}", limit),
+        "species_loc": rankings_by_location(df, cl, "species", lambda x: f"{int(x):,}", limit, facts=loc_facts),
+        "individuals_loc": rankings_by_location(df, cl, "individuals", lambda x: f"{int(x):,}", limit, facts=loc_facts),
+        "visited": rankings_by_visits(cl, limit, facts=loc_facts),
         "species_individuals": rankings_by_individuals(df, limit=None),
         "species_checklists": rankings_by_checklists(df, limit=None),
         "species_high_counts": rankings_high_counts(
@@ -860,13 +954,10 @@ def yearly_summary_stats(df, cl, dur_col, dist_col, *, taxonomy_locale: str | No
     cl = cl.dropna(subset=["Date"])
     if cl.empty:
         return [], [], {}
-    cl["_year"] = cl["Date"].dt.year
+    cl["_year"] = year_series(cl)
     years_sorted = sorted(cl["_year"].dropna().astype(int).unique())
     if not years_sorted:
         return [], [], {}
-    df_with_yr = df.copy()
-    df_with_yr["_year"] = df_with_yr["Date"].dt.year
-
     has_protocol = "Protocol" in df.columns
     has_all_obs = "All Obs Reported" in df.columns
     proto_lower = cl["Protocol"].astype(str).str.strip().str.lower() if has_protocol else None
@@ -885,152 +976,175 @@ def yearly_summary_stats(df, cl, dur_col, dist_col, *, taxonomy_locale: str | No
     incomplete_not_incidental = ~completed_mask & ~incidental_mask if has_all_obs and has_protocol else pd.Series(False, index=cl.index)
     incomplete_hint = _html.escape("Incomplete checklists not counted.", quote=True)
     info_icon = f' <span class="stats-info-icon"><span class="stats-info-glyph">&#9432;</span><span class="stats-info-tooltip">{incomplete_hint}</span></span>' if has_all_obs else ""
+    n_years = len(years_sorted)
+
+    def _vals(series, cast=int):
+        return [cast(series.get(y, 0)) for y in years_sorted]
+
+    # --- Checklist-year facts: one row per checklist, aggregated once per year ---
+    # Working columns (not eBird export): flags are per-checklist booleans; *_dist / *_dur are
+    # numeric effort values, missing (NaN) where the row does not count toward that sum, so
+    # grouped sums match summing the filtered checklists.
+    dur = pd.to_numeric(cl[dur_col], errors="coerce").fillna(0) if dur_col else None
+    has_dur = cl[dur_col].notna() if dur_col else None
+    dist = pd.to_numeric(cl[dist_col], errors="coerce").fillna(0) if dist_col else None
+    has_shared_col = "Number of Observers" in cl.columns
+    shared_mask = (
+        cl["Number of Observers"].notna()
+        & (pd.to_numeric(cl["Number of Observers"], errors="coerce").fillna(0) > 1)
+        if has_shared_col else pd.Series(False, index=cl.index)
+    )
+    day = date_series(cl)
+    cf = pd.DataFrame(
+        {
+            "_year": cl["_year"],
+            "_date": day,
+            "_shared_date": day.where(shared_mask),
+            "Location ID": cl["Location ID"],
+            "_completed": completed_mask,
+            "_incomplete": incomplete_not_incidental,
+            "_traveling": traveling_complete,
+            "_stationary": stationary_complete,
+            "_incidental": incidental_mask,
+            "_shared": shared_mask,
+        },
+        index=cl.index,
+    )
+    named = {
+        "checklists": ("_year", "size"),
+        "completed": ("_completed", "sum"),
+        "incomplete": ("_incomplete", "sum"),
+        "traveling": ("_traveling", "sum"),
+        "stationary": ("_stationary", "sum"),
+        "incidental": ("_incidental", "sum"),
+        "shared": ("_shared", "sum"),
+        "days": ("_date", "nunique"),
+        "shared_days": ("_shared_date", "nunique"),
+        "locations": ("Location ID", "nunique"),
+    }
+    if dist_col:
+        cf["_dist"] = dist
+        cf["_trav_dist"] = dist.where(traveling_complete)
+        named.update(km=("_dist", "sum"), trav_km=("_trav_dist", "sum"))
+    if dur_col:
+        timed = has_dur
+        if has_protocol:
+            timed = timed & ~proto_lower.str.contains("incidental|historical|casual observation", na=False, regex=True)
+        cf["_timed_dur"] = dur.where(timed)
+        cf["_trav_dur"] = dur.where(traveling_complete & has_dur)
+        cf["_stat_dur"] = dur.where(stationary_complete & has_dur)
+        named.update(
+            minutes=("_timed_dur", "sum"),
+            trav_min=("_trav_dur", "sum"),
+            trav_timed=("_trav_dur", "count"),
+            stat_min=("_stat_dur", "sum"),
+            stat_timed=("_stat_dur", "count"),
+        )
+    by_cl = cf.groupby("_year").agg(**named)
+
+    # --- Observation-year facts: per-row year / species / individuals, aggregated once ---
+    # Working columns (not eBird export): _base = countable species key; _count = numeric Count.
+    obs = pd.DataFrame(
+        {
+            "_year": year_series(df),
+            "Submission ID": df["Submission ID"],
+            "_base": countable_base_series(df),
+            "_count": count_series(df),
+        }
+    )
+    by_obs = obs.groupby("_year").agg(species=("_base", "nunique"), individuals=("_count", "sum"))
+    # Per (year, checklist): species / individuals for the per-protocol averages.
+    per_cl = obs.groupby(["_year", "Submission ID"]).agg(
+        nsp=("_base", "nunique"), nbase=("_base", "count"), nind=("_count", "sum")
+    ).reset_index()
 
-    # Working columns (not eBird export): _base = countable species key; _count = numeric Count; _family only on temporary copies below for the families row.
-    sp_series = countable_species_vectorized(df_with_yr)
-    df_with_yr["_base"] = sp_series
-    df_with_yr["_count"] = df_with_yr["Count"].apply(safe_count)
+    def _protocol_means(sids):
+        sub = per_cl[per_cl["Submission ID"].isin(sids)]
+        by_y = sub.groupby("_year")
+        ind = by_y["nind"].mean()
+        sp = sub[sub["nbase"] > 0].groupby("_year")["nsp"].mean()
+        sp_means = [f"{sp[y]:.1f}" if y in sp.index else "—" for y in years_sorted]
+        ind_means = [f"{ind[y]:.1f}" if y in ind.index else "—" for y in years_sorted]
+        return sp_means, ind_means
 
     rows: list[tuple[str, list[str]]] = []
 
     # --- Computations (order here is arbitrary; the yearly table enforces display order below) ---
 
     # Total species
-    by_yr_sp = df_with_yr.dropna(subset=["_base"]).groupby("_year")["_base"].nunique()
-    vals_sp = [int(by_yr_sp.get(y, 0)) for y in years_sorted]
-    row_total_species = ("Total species", [f"{v:,}" for v in vals_sp])
+    row_total_species = ("Total species", [f"{v:,}" for v in _vals(by_obs["species"])])
 
     # Total bird families (eBird species groups; same mapping as Rankings → Families)
     loc = (taxonomy_locale or "").strip() or TAXONOMY_LOCALE_DEFAULT
     base_to_family = build_base_species_to_family_map(loc)
     if base_to_family:
-        dfb = df_with_yr.dropna(subset=["_base"]).copy()
+        with_base = obs.dropna(subset=["_base"])
         # _family: species-group name (same convention as explorer.core.family_map_compute work frames).
-        dfb["_family"] = dfb["_base"].astype(str).str.strip().map(base_to_family)
-        fam = dfb.dropna(subset=["_family"])
-        by_yr_fam = fam.groupby("_year")["_family"].nunique()
-        vals_f = [int(by_yr_fam.get(y, 0)) for y in years_sorted]
-        row_total_bird_families = ("Total bird families", [f"{v:,}" for v in vals_f])
+        family = with_base["_base"].astype(str).str.strip().map(base_to_family)
+        by_yr_fam = family.groupby(with_base["_year"]).nunique()
+        row_total_bird_families = ("Total bird families", [f"{v:,}" for v in _vals(by_yr_fam)])
     else:
-        row_total_bird_families = ("Total bird families", ["—"] * len(years_sorted))
+        row_total_bird_families = ("Total bird families", ["—"] * n_years)
 
     # Total individuals
-    by_yr_ind = df_with_yr.groupby("_year")["_count"].sum()
-    vals_ind = [int(by_yr_ind.get(y, 0)) for y in years_sorted]
-    row_total_individuals = ("Total individuals", [f"{v:,}" for v in vals_ind])
+    row_total_individuals = ("Total individuals", [f"{v:,}" for v in _vals(by_obs["individuals"])])
 
     # Lifers
-    first_seen = df_with_yr.dropna(subset=["_base"]).groupby("_base")["Date"].min()
-    first_seen_year = first_seen.dt.year
-    lifers_per_year = first_seen_year.value_counts()
-    vals_lifers = [int(lifers_per_year.get(y, 0)) for y in years_sorted]
-    row_lifers = ("Lifers", [f"{v:,}" for v in vals_lifers])
-
-    # Total checklists
-    by_yr_cl = cl.groupby("_year").size()
-    vals_tcl = [int(by_yr_cl.get(y, 0)) for y in years_sorted]
-    row_total_checklists = ("Total checklists", [f"{v:,}" for v in vals_tcl])
-
-    # Completed checklists
+    first_seen = df["Date"].groupby(obs["_base"]).min()
+    lifers_per_year = first_seen.dt.year.value_counts()
+    row_lifers = ("Lifers", [f"{v:,}" for v in _vals(lifers_per_year)])
+
+    # Checklist counts by type
+    row_total_checklists = ("Total checklists", [f"{v:,}" for v in _vals(by_cl["checklists"])])
     if has_all_obs:
-        completed = cl[completed_mask]
-        by_yr = completed.groupby("_year").size()
-        vals_comp = [int(by_yr.get(y, 0)) for y in years_sorted]
-        row_completed_checklists = ("Completed checklists", [f"{v:,}" for v in vals_comp])
+        row_completed_checklists = ("Completed checklists", [f"{v:,}" for v in _vals(by_cl["completed"])])
     else:
-        row_completed_checklists = ("Completed checklists", ["—"] * len(years_sorted))
-
-    # Incomplete checklists (not incidental)
+        row_completed_checklists = ("Completed checklists", ["—"] * n_years)
     if has_all_obs and has_protocol:
-        inc_count = cl[incomplete_not_incidental].groupby("_year").size()
-        vals_inc = [int(inc_count.get(y, 0)) for y in years_sorted]
-        row_incomplete_checklists = ("Incomplete checklists", [f"{v:,}" for v in vals_inc])
-    else:
-        row_incomplete_checklists = ("Incomplete checklists", ["—"] * len(years_sorted))
-
-    # Traveling checklists (complete only)
-    if has_protocol:
-        trav_count = cl[traveling_complete].groupby("_year").size()
-        vals_trav = [int(trav_count.get(y, 0)) for y in years_sorted]
-        row_traveling_checklists = (f"Traveling checklists{info_icon}", [f"{v:,}" for v in vals_trav])
-    else:
-        row_traveling_checklists = ("Traveling checklists", ["—"] * len(years_sorted))
-
-    # Stationary checklists (complete only)
-    if has_protocol:
-        stat_count = cl[stationary_complete].groupby("_year").size()
-        vals_stat = [int(stat_count.get(y, 0)) for y in years_sorted]
-        row_stationary_checklists = (f"Stationary checklists{info_icon}", [f"{v:,}" for v in vals_stat])
+        row_incomplete_checklists = ("Incomplete checklists", [f"{v:,}" for v in _vals(by_cl["incomplete"])])
     else:
-        row_stationary_checklists = ("Stationary checklists", ["—"] * len(years_sorted))
-
-    # Incidental checklists
+        row_incomplete_checklists = ("Incomplete checklists", ["—"] * n_years)
     if has_protocol:
-        inc_count = cl[incidental_mask].groupby("_year").size()
-        vals_inc2 = [int(inc_count.get(y, 0)) for y in years_sorted]
-        row_incidental_checklists = ("Incidental checklists", [f"{v:,}" for v in vals_inc2])
+        row_traveling_checklists = (f"Traveling checklists{info_icon}", [f"{v:,}" for v in _vals(by_cl["traveling"])])
+        row_stationary_checklists = (f"Stationary checklists{info_icon}", [f"{v:,}" for v in _vals(by_cl["stationary"])])
+        row_incidental_checklists = ("Incidental checklists", [f"{v:,}" for v in _vals(by_cl["incidental"])])
     else:
-        row_incidental_checklists = ("Incidental checklists", ["—"] * len(years_sorted))
+        row_traveling_checklists = ("Traveling checklists", ["—"] * n_years)
+        row_stationary_checklists = ("Stationary checklists", ["—"] * n_years)
+        row_incidental_checklists = ("Incidental checklists", ["—"] * n_years)
 
     # Shared checklists / Days birding with others
-    if "Number of Observers" in cl.columns:
-        shared_cl = cl.dropna(subset=["Number of Observers"]).copy()
-        shared_cl["_nobs"] = pd.to_numeric(shared_cl["Number of Observers"], errors="coerce").fillna(0)
-        shared_mask = shared_cl["_nobs"] > 1
-        shared_sub = shared_cl[shared_mask]
-        if not shared_sub.empty:
-            by_yr_shared = shared_sub.groupby("_year").size()
-            vals_shared = [int(by_yr_shared.get(y, 0)) for y in years_sorted]
-            row_shared_checklists = ("Shared checklists", [f"{v:,}" for v in vals_shared])
-            shared_sub = shared_sub.copy()
-            shared_sub["_date"] = shared_sub["Date"].dt.normalize()
-            by_yr_days = shared_sub.groupby("_year")["_date"].nunique()
-            vals_days_bo = [int(by_yr_days.get(y, 0)) for y in years_sorted]
-            row_days_birding_with_others = ("Days birding with others", [f"{v:,}" for v in vals_days_bo])
-        else:
-            row_shared_checklists = ("Shared checklists", ["—"] * len(years_sorted))
-            row_days_birding_with_others = ("Days birding with others", ["—"] * len(years_sorted))
+    if has_shared_col and shared_mask.any():
+        row_shared_checklists = ("Shared checklists", [f"{v:,}" for v in _vals(by_cl["shared"])])
+        row_days_birding_with_others = ("Days birding with others", [f"{v:,}" for v in _vals(by_cl["shared_days"])])
     else:
-        row_shared_checklists = ("Shared checklists", ["—"] * len(years_sorted))
-        row_days_birding_with_others = ("Days birding with others", ["—"] * len(years_sorted))
+        row_shared_checklists = ("Shared checklists", ["—"] * n_years)
+        row_days_birding_with_others = ("Days birding with others", ["—"] * n_years)
 
     # Days with checklist
-    by_yr_dates = cl.groupby("_year")["Date"].apply(lambda s: s.dt.normalize().nunique())
-    vals_dwc = [int(by_yr_dates.get(y, 0)) for y in years_sorted]
-    row_days_with_checklist = ("Days with checklist", [f"{v:,}" for v in vals_dwc])
+    row_days_with_checklist = ("Days with checklist", [f"{v:,}" for v in _vals(by_cl["days"])])
 
-    # Cumulative days eBird on
-    all_dates = cl["Date"].dt.normalize()
-    cum = [int(all_dates[all_dates.dt.year <= y].nunique()) for y in years_sorted]
+    # Cumulative days eBird on: each distinct day counted once, in the year it falls in
+    new_days_per_year = pd.Series(pd.unique(day.dropna())).dt.year.value_counts()
+    cum = np.cumsum(_vals(new_days_per_year)).tolist()
     row_cumulative_days_ebird_on = ("Cumulative days eBird on", [f"{v:,}" for v in cum])
 
     # Total birding hours
     if dur_col:
-        timed = cl.dropna(subset=[dur_col]).copy()
-        timed["_dur"] = pd.to_numeric(timed[dur_col], errors="coerce").fillna(0)
-        timed["_year"] = timed["Date"].dt.year
-        if has_protocol:
-            excl = timed["Protocol"].astype(str).str.strip().str.lower().str.contains("incidental|historical|casual observation", na=False, regex=True)
-            timed = timed[~excl]
-        by_yr_min = timed.groupby("_year")["_dur"].sum()
-        vals_hours = [by_yr_min.get(y, 0) / 60 for y in years_sorted]
+        vals_hours = [v / 60 for v in _vals(by_cl["minutes"], float)]
         row_total_birding_hours = ("Total birding hours", [f"{v:.1f}" if v else "—" for v in vals_hours])
     else:
-        row_total_birding_hours = ("Total birding hours", ["—"] * len(years_sorted))
+        row_total_birding_hours = ("Total birding hours", ["—"] * n_years)
 
-    # Total distance (km) — sets ``cl["_dist"]`` for any downstream use
+    # Total distance (km)
     if dist_col:
-        cl["_dist"] = pd.to_numeric(cl[dist_col], errors="coerce").fillna(0)
-        by_yr_km = cl.groupby("_year")["_dist"].sum()
-        vals_km_tot = [by_yr_km.get(y, 0) for y in years_sorted]
+        vals_km_tot = _vals(by_cl["km"], float)
         row_total_distance_km = ("Total distance (km)", [f"{v:,.1f}" if v else "—" for v in vals_km_tot])
     else:
-        row_total_distance_km = ("Total distance (km)", ["—"] * len(years_sorted))
+        row_total_distance_km = ("Total distance (km)", ["—"] * n_years)
 
     # Unique locations
-    by_yr_loc = cl.groupby("_year")["Location ID"].nunique()
-    vals_loc = [int(by_yr_loc.get(y, 0)) for y in years_sorted]
-    row_unique_locations = ("Unique locations", [f"{v:,}" for v in vals_loc])
+    row_unique_locations = ("Unique locations", [f"{v:,}" for v in _vals(by_cl["locations"])])
 
     rows.extend(
         [
@@ -1056,93 +1170,50 @@ def yearly_summary_stats(df, cl, dur_col, dist_col, *, taxonomy_locale: str | No
 
     # 17–18. Traveling checklist: Total distance, Average distance
     if dist_col and has_protocol:
-        trav = cl[traveling_complete].copy()
-        trav["_year"] = trav["Date"].dt.year
-        trav["_dist"] = pd.to_numeric(trav[dist_col], errors="coerce").fillna(0)
-        by_yr = trav.groupby("_year")["_dist"].sum()
-        n_trav = trav.groupby("_year").size()
-        vals_km = [by_yr.get(y, 0) for y in years_sorted]
-        vals_n = [int(n_trav.get(y, 0)) for y in years_sorted]
+        vals_km = _vals(by_cl["trav_km"], float)
+        vals_n = _vals(by_cl["traveling"])
         rows.append((f"Traveling checklist: Total distance (km){info_icon}", [f"{v:,.1f}" if v else "—" for v in vals_km]))
         avg_dist = ["—" if n == 0 else f"{(vals_km[i] / n):.1f}" for i, n in enumerate(vals_n)]
         rows.append((f"Traveling checklist: Average distance (km){info_icon}", avg_dist))
     else:
-        rows.append(("Traveling checklist: Total distance (km)", ["—"] * len(years_sorted)))
-        rows.append(("Traveling checklist: Average distance (km)", ["—"] * len(years_sorted)))
+        rows.append(("Traveling checklist: Total distance (km)", ["—"] * n_years))
+        rows.append(("Traveling checklist: Average distance (km)", ["—"] * n_years))
 
     # 19–20. Traveling checklist: Total hours, Average minutes
     if dur_col and has_protocol:
-        trav = cl[traveling_complete].dropna(subset=[dur_col]).copy()
-        trav["_year"] = trav["Date"].dt.year
-        trav["_min"] = pd.to_numeric(trav[dur_col], errors="coerce").fillna(0)
-        by_yr_min = trav.groupby("_year")["_min"].sum()
-        n_trav = trav.groupby("_year").size()
-        vals_min = [by_yr_min.get(y, 0) for y in years_sorted]
-        vals_n = [int(n_trav.get(y, 0)) for y in years_sorted]
+        vals_min = _vals(by_cl["trav_min"], float)
+        vals_n = _vals(by_cl["trav_timed"])
         rows.append((f"Traveling checklist: Total hours{info_icon}", [f"{v / 60:.1f}" if v else "—" for v in vals_min]))
         avg_min = ["—" if n == 0 else f"{vals_min[i] / n:.1f}" for i, n in enumerate(vals_n)]
         rows.append((f"Traveling checklist: Average minutes{info_icon}", avg_min))
     else:
-        rows.append(("Traveling checklist: Total hours", ["—"] * len(years_sorted)))
-        rows.append(("Traveling checklist: Average minutes", ["—"] * len(years_sorted)))
+        rows.append(("Traveling checklist: Total hours", ["—"] * n_years))
+        rows.append(("Traveling checklist: Average minutes", ["—"] * n_years))
 
     # 20b–20c. Traveling checklist: Average species, Average individuals
     if has_protocol:
-        trav_cl = cl[traveling_complete]
-        trav_sids = set(trav_cl["Submission ID"])
-        trav_obs = df_with_yr[df_with_yr["Submission ID"].isin(trav_sids)].copy()
-        trav_obs["_year"] = trav_obs["Date"].dt.year
-        sp_means, ind_means = [], []
-        for y in years_sorted:
-            o = trav_obs[trav_obs["_year"] == y]
-            if o.empty:
-                sp_means.append("—")
-                ind_means.append("—")
-            else:
-                sp_per_cl = o.dropna(subset=["_base"]).groupby("Submission ID")["_base"].nunique()
-                ind_per_cl = o.groupby("Submission ID")["_count"].sum()
-                sp_means.append(f"{sp_per_cl.mean():.1f}" if len(sp_per_cl) else "—")
-                ind_means.append(f"{ind_per_cl.mean():.1f}" if len(ind_per_cl) else "—")
+        sp_means, ind_means = _protocol_means(set(cl.loc[traveling_complete, "Submission ID"]))
         rows.append((f"Traveling checklist: Average species{info_icon}", sp_means))
         rows.append((f"Traveling checklist: Average individuals{info_icon}", ind_means))
     else:
-        rows.append(("Traveling checklist: Average species", ["—"] * len(years_sorted)))
-        rows.append(("Traveling checklist: Average individuals", ["—"] * len(years_sorted)))
+        rows.append(("Traveling checklist: Average species", ["—"] * n_years))
+        rows.append(("Traveling checklist: Average individuals", ["—"] * n_years))
 
     # 21–24. Stationary checklist stats
     if has_protocol and dur_col:
-        stat_cl = cl[stationary_complete]
-        stat_sids = set(stat_cl["Submission ID"])
-        stat_obs = df_with_yr[df_with_yr["Submission ID"].isin(stat_sids)].copy()
-        stat_obs["_year"] = stat_obs["Date"].dt.year
-        sp_means, ind_means = [], []
-        for y in years_sorted:
-            o = stat_obs[stat_obs["_year"] == y]
-            if o.empty:
-                sp_means.append("—")
-                ind_means.append("—")
-            else:
-                sp_per_cl = o.dropna(subset=["_base"]).groupby("Submission ID")["_base"].nunique()
-                ind_per_cl = o.groupby("Submission ID")["_count"].sum()
-                sp_means.append(f"{sp_per_cl.mean():.1f}" if len(sp_per_cl) else "—")
-                ind_means.append(f"{ind_per_cl.mean():.1f}" if len(ind_per_cl) else "—")
+        sp_means, ind_means = _protocol_means(set(cl.loc[stationary_complete, "Submission ID"]))
         rows.append((f"Stationary checklist: Average species{info_icon}", sp_means))
         rows.append((f"Stationary checklist: Average individuals{info_icon}", ind_means))
-        stat_cl = stat_cl.dropna(subset=[dur_col]).copy()
-        stat_cl["_year"] = stat_cl["Date"].dt.year
-        stat_cl["_min"] = pd.to_numeric(stat_cl[dur_col], errors="coerce").fillna(0)
-        by_yr_min = stat_cl.groupby("_year")["_min"].sum()
-        n_stat = stat_cl.groupby("_year").size()
-        vals_min = [by_yr_min.get(y, 0) for y in years_sorted]
-        vals_n = [int(n_stat.get(y, 0)) for y in years_sorted]
+        vals_min = _vals(by_cl["stat_min"], float)
+        vals_n = _vals(by_cl["stat_timed"])
         rows.append((f"Stationary checklist: Total hours{info_icon}", [f"{v / 60:.1f}" if v else "—" for v in vals_min]))
         avg_min = ["—" if n == 0 else f"{vals_min[i] / n:.1f}" for i, n in enumerate(vals_n)]
         rows.append((f"Stationary checklist: Average minutes{info_icon}", avg_min))
     else:
-        rows.append(("Stationary checklist: Average species", ["—"] * len(years_sorted)))
-        rows.append(("Stationary checklist: Average individuals", ["—"] * len(years_sorted)))
-        rows.append(("Stationary checklist: Total hours", ["—"] * len(years_sorted)))
-        rows.append(("Stationary checklist: Average minutes", ["—"] * len(years_sorted)))
+        rows.append(("Stationary checklist: Average species", ["—"] * n_years))
+        rows.append(("Stationary checklist: Average individuals", ["—"] * n_years))
+        rows.append(("Stationary checklist: Total hours", ["—"] * n_years))
+        rows.append(("Stationary checklist: Average minutes", ["—"] * n_years))
 
     # Incomplete checklists by year
     incomplete_by_year = {}
@@ -1150,15 +1221,10 @@ def yearly_summary_stats(df, cl, dur_col, dist_col, *, taxonomy_locale: str | No
         use_dt_col = "datetime" if "datetime" in cl.columns else "Date"
         cols = ["_year", "Submission ID", use_dt_col, "Location"]
         inc_sub = cl[incomplete_not_incidental][cols].drop_duplicates()
-        for y in years_sorted:
-            sub = inc_sub[inc_sub["_year"] == y].sort_values(use_dt_col)
-            list_y = []
-            for _, r in sub.iterrows():
-                sid = r.get("Submission ID")
-                dt = r.get(use_dt_col)
-                loc = r.get("Location") or ""
-                date_str = pd.Timestamp(dt).strftime("%d %b %Y %H:%M") if pd.notna(dt) else "—"
-                list_y.append((sid, date_str, str(loc)))
+        for y, sub in inc_sub.groupby("_year"):
+            sub = sub.sort_values(use_dt_col)
+            locs = _as_text([loc or "" for loc in sub["Location"].tolist()])
+            list_y = list(zip(sub["Submission ID"].tolist(), _format_datetimes(sub[use_dt_col]), locs))
             if list_y:
                 incomplete_by_year[int(y)] = list_y
 
@@ -1237,102 +1303,88 @@ def country_summary_stats(df, cl):
     if cl.empty or df.empty:
         return []
 
-    cl = cl.copy()
-    cl["_country_key"] = checklist_country_keys(cl)
-    cl["_year"] = cl["Date"].dt.year
+    # --- Checklist facts: one row per checklist with its country / year / day ---
+    # Working columns (not eBird export): _day = Date at midnight; _date_year = calendar year of Date
+    # (cumulative days compare on it, like the former per-year ``Date.dt.year <= y`` mask).
+    cl_f = pd.DataFrame(
+        {
+            "_country_key": country_key_series(cl),
+            "_year": year_series(cl),
+            "_day": cl["Date"].dt.normalize(),
+        },
+        index=cl.index,
+    )
+    cl_f["_date_year"] = cl_f["_day"].dt.year
+
+    # --- Observation facts: narrow per-row frame keyed by the checklist's country ---
+    key_map = pd.Series(cl_f["_country_key"].to_numpy(), index=cl["Submission ID"])
+    df_m = pd.DataFrame(
+        {
+            "_country_key": df["Submission ID"].map(key_map).fillna("_UNKNOWN"),
+            "_year": year_series(df),
+            "_base": countable_base_series(df),
+            "_count": count_series(df),
+            "Date": df["Date"],
+        }
+    )
 
-    df_m = df.copy()
-    df_m["_base"] = countable_species_vectorized(df_m)
-    df_m["_count"] = df_m["Count"].apply(safe_count)
-    key_map = cl.set_index("Submission ID")["_country_key"]
-    df_m["_country_key"] = df_m["Submission ID"].map(key_map).fillna("_UNKNOWN")
-    df_m["_year"] = df_m["Date"].dt.year
+    # --- One grouped pass per metric over (country, year) ---
+    by_cl = cl_f.groupby(["_country_key", "_year"]).agg(
+        checklists=("_day", "size"), days=("_day", "nunique")
+    )
+    by_obs = df_m.groupby(["_country_key", "_year"]).agg(
+        species=("_base", "nunique"), individuals=("_count", "sum")
+    )
+    species_total = df_m.groupby("_country_key")["_base"].nunique().to_dict()
+    checklists = by_cl["checklists"].to_dict()
+    days = by_cl["days"].to_dict()
+    species = by_obs["species"].to_dict()
+    individuals = by_obs["individuals"].to_dict()
+
+    # Lifers (world): country / year of each species' first-ever dated row (first row on ties).
+    # Lifers (country): year of each species' first dated row within each country.
+    dated = df_m[df_m["_base"].notna() & df_m["Date"].notna()]
+    first_world = dated.loc[dated.groupby("_base")["Date"].idxmin()]
+    lifers_world = first_world.groupby(["_country_key", first_world["Date"].dt.year]).size().to_dict()
+    first_country = dated.groupby(["_country_key", "_base"])["Date"].min().reset_index()
+    lifers_country = first_country.groupby(["_country_key", first_country["Date"].dt.year]).size().to_dict()
+
+    # Cumulative days: each distinct (country, day) counted in its year, then summed through year y.
+    new_days = cl_f.drop_duplicates(["_country_key", "_day"]).groupby(["_country_key", "_date_year"]).size()
+    cum_days = {
+        ck: (s.index.get_level_values("_date_year").to_numpy(), np.cumsum(s.to_numpy()))
+        for ck, s in new_days.groupby(level="_country_key")
+    }
+    years_by_country = cl_f.dropna(subset=["_year"]).groupby("_country_key")["_year"].unique()
 
-    country_keys = sorted(cl["_country_key"].dropna().unique(), key=lambda k: str(k))
+    country_keys = sorted(cl_f["_country_key"].dropna().unique(), key=lambda k: str(k))
     blocks = []  # order finalized alphabetically by display name in checklist_stats_display
 
-    obs = df_m.dropna(subset=["_base"])
-    if not obs.empty:
-        idx_world = obs.groupby("_base")["Date"].idxmin()
-        first_world = obs.loc[idx_world].copy()
-        first_world["_yr"] = first_world["Date"].dt.year
-    else:
-        first_world = pd.DataFrame()
+    def _row(label, counts, ck, years_sorted, total=None):
+        vals = [int(counts.get((ck, y), 0)) for y in years_sorted]
+        fmt = [f"{v:,}" for v in vals]
+        if len(years_sorted) > 1:
+            fmt.append(f"{sum(vals) if total is None else total:,}")
+        return label, fmt
 
     for ck in country_keys:
-        cl_c = cl[cl["_country_key"] == ck]
-        years_sorted = sorted(cl_c["_year"].dropna().astype(int).unique())
+        years_sorted = sorted(years_by_country[ck].astype(int)) if ck in years_by_country.index else []
         if not years_sorted:
             continue
+        rows = [
+            _row("Lifers (world)", lifers_world, ck, years_sorted),
+            _row("Lifers (country)", lifers_country, ck, years_sorted),
+            _row("Total species", species, ck, years_sorted, total=int(species_total.get(ck, 0))),
+            _row("Total individuals", individuals, ck, years_sorted),
+            _row("Total checklists", checklists, ck, years_sorted),
+            _row("Days with a checklist", days, ck, years_sorted),
+        ]
 
-        if not first_world.empty:
-            fw = first_world[(first_world["_country_key"] == ck)]
-            lifers_world = fw.groupby("_yr").size()
-        else:
-            lifers_world = pd.Series(dtype=int)
-
-        obs_c = obs[obs["_country_key"] == ck]
-        if not obs_c.empty:
-            idx_c = obs_c.groupby(["_base", "_country_key"])["Date"].idxmin()
-            first_c = obs_c.loc[idx_c].copy()
-            first_c["_yr"] = first_c["Date"].dt.year
-            lifers_country = first_c.groupby("_yr").size()
-        else:
-            lifers_country = pd.Series(dtype=int)
-
-        rows = []
-        multi_year = len(years_sorted) > 1
-
-        obs_ck = obs[(obs["_country_key"] == ck)]
-
-        vals_w_i = [int(lifers_world.get(y, 0)) for y in years_sorted]
-        vals_w = [f"{v:,}" for v in vals_w_i]
-        if multi_year:
-            vals_w.append(f"{sum(vals_w_i):,}")
-        rows.append(("Lifers (world)", vals_w))
-
-        vals_c_i = [int(lifers_country.get(y, 0)) for y in years_sorted]
-        vals_c = [f"{v:,}" for v in vals_c_i]
-        if multi_year:
-            vals_c.append(f"{sum(vals_c_i):,}")
-        rows.append(("Lifers (country)", vals_c))
-
-        by_yr_sp = obs_ck.groupby("_year")["_base"].nunique()
-        vals_sp = [int(by_yr_sp.get(y, 0)) for y in years_sorted]
-        vals_sp_fmt = [f"{v:,}" for v in vals_sp]
-        if multi_year:
-            total_sp = int(obs_ck["_base"].nunique()) if not obs_ck.empty else 0
-            vals_sp_fmt.append(f"{total_sp:,}")
-        rows.append(("Total species", vals_sp_fmt))
-
-        by_yr_ind = df_m[df_m["_country_key"] == ck].groupby("_year")["_count"].sum()
-        vals_ind_i = [int(by_yr_ind.get(y, 0)) for y in years_sorted]
-        vals_ind = [f"{v:,}" for v in vals_ind_i]
-        if multi_year:
-            vals_ind.append(f"{sum(vals_ind_i):,}")
-        rows.append(("Total individuals", vals_ind))
-
-        by_yr_cl = cl_c.groupby("_year").size()
-        vals_cl_i = [int(by_yr_cl.get(y, 0)) for y in years_sorted]
-        vals_cl = [f"{v:,}" for v in vals_cl_i]
-        if multi_year:
-            vals_cl.append(f"{sum(vals_cl_i):,}")
-        rows.append(("Total checklists", vals_cl))
-
-        by_yr_dates = cl_c.groupby("_year")["Date"].apply(lambda s: s.dt.normalize().nunique())
-        vals_days_i = [int(by_yr_dates.get(y, 0)) for y in years_sorted]
-        vals_days = [f"{v:,}" for v in vals_days_i]
-        if multi_year:
-            vals_days.append(f"{sum(vals_days_i):,}")
-        rows.append(("Days with a checklist", vals_days))
-
-        dates_c = cl_c["Date"].dt.normalize()
-        cum = []
-        for y in years_sorted:
-            mask = cl_c["Date"].dt.year <= y
-            cum.append(int(dates_c[mask].nunique()))
+        day_years, day_cum = cum_days[ck]
+        upto = np.searchsorted(day_years, years_sorted, side="right")
+        cum = [int(day_cum[i - 1]) if i else 0 for i in upto]
         vals_cum = [f"{v:,}" for v in cum]
-        if multi_year:
+        if len(years_sorted) > 1:
             vals_cum.append(f"{cum[-1]:,}" if cum else "0")
         rows.append(("Cumulative days eBird on", vals_cum))
 
@@ -1391,20 +1443,19 @@ def get_sex_notation_by_year(df):
     sub = df.loc[mask, cols].copy()
     if sub.empty:
         return {}
-    sub["_year"] = sub["Date"].dt.year
+    sub["_year"] = year_series(sub)
     by_year = {}
     for y in sub["_year"].dropna().astype(int).unique():
         rows = sub[sub["_year"] == y].sort_values(use_dt)
-        list_y = []
-        for _, r in rows.iterrows():
-            sid = r.get("Submission ID")
-            dt = r.get(use_dt)
-            date_str = pd.Timestamp(dt).strftime("%d %b %Y %H:%M") if pd.notna(dt) else "—"
-            loc = str(r.get("Location") or "")
-            species = str(r.get("Common Name") or "")
-            protocol = str(r.get("Protocol") or "")
-            notation = str(r.get("Observation Details") or "").strip()
-            list_y.append((sid, date_str, loc, species, protocol, notation))
+        text = {c: _as_text([v or "" for v in rows[c].tolist()]) for c in ("Location", "Common Name", "Protocol", "Observation Details")}
+        list_y = list(zip(
+            rows["Submission ID"].tolist(),
+            _format_datetimes(rows[use_dt]),
+            text["Location"],
+            text["Common Name"],
+            text["Protocol"],
+            [n.strip() for n in text["Observation Details"]],
+        ))
         if list_y:
             by_year[int(y)] = list_y
     return by_year
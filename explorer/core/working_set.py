@@ -7,14 +7,19 @@ without importing UI widgets.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import AbstractSet, Any, Dict, List, MutableMapping, Optional, Tuple
+from typing import AbstractSet, Any, Dict, List, Mapping, MutableMapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from explorer.core.species_logic import countable_species_vectorized
-from explorer.core.stats import safe_count
+from explorer.core.daily_totals import DailyTotals
+from explorer.core.derived_columns import count_series, countable_base_series
+from explorer.core.life_list_index import LifeListIndex
+from explorer.core.location_records import LocationRecords
 
 
 @dataclass
@@ -23,27 +28,186 @@ class WorkingSet:
 
     df: pd.DataFrame
     location_data: pd.DataFrame
-    records_by_loc: Dict[Any, pd.DataFrame]
+    records_by_loc: Mapping[Any, pd.DataFrame]
     species_list: List[str]
     total_checklists: int
     total_individuals: int
     total_species: int
     name_map: Dict[str, str]
-    records_by_loc_full: Dict[Any, pd.DataFrame]
+    records_by_loc_full: Mapping[Any, pd.DataFrame]
     total_checklists_full: int
     total_species_full: int
     total_individuals_full: int
+    # Applied ``(start, end)`` when date-filtered; ``None`` for all-time.
+    date_range: Optional[Tuple[datetime, datetime]] = None
+
+
+class WorkingSetEngine:
+    """
+    Per-dataset working-set builder: prefilter and sort once, slice date ranges by binary search.
+
+    The checklist-location prefilter (``isin`` + copy) and the all-time aggregates run once per
+    engine. The ``Date`` sort order is computed on the first date-filtered request; each range is
+    then a ``searchsorted`` slice whose row positions are re-sorted so the working frame keeps
+    export row order (same rows, same order as the former boolean mask). The most recent
+    :class:`WorkingSet` objects are memoised per ``(filter_by_date, start, end)`` so a rerun with
+    an unchanged range returns the same object (and the same ``df`` identity). Date-filtered totals
+    come from :attr:`daily_totals` (built on first use) rather than from the sliced rows;
+    :attr:`life_list_index` answers life / year / country list "as of" queries the same way.
+
+    Build one per loaded export (the Streamlit app caches it per dataset fingerprint and shares it
+    across sessions, so the memo and the lazily built indexes are guarded by locks); the source
+    frame must not be mutated afterwards.
+    """
+
+    def __init__(
+        self,
+        df_full: pd.DataFrame,
+        location_ids_with_checklists: AbstractSet[Any],
+        *,
+        max_cached: int = 8,
+    ) -> None:
+        # Keep "full" groupings consistent: only locations that
+        # have checklists are eligible for both working + full views.
+        self.df_full_filtered = df_full[df_full["Location ID"].isin(location_ids_with_checklists)].copy()
+        self._max_cached = max(1, int(max_cached))
+        self._cache: OrderedDict[Tuple[bool, Any, Any], WorkingSet] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Lazy per-dataset structures; each is assigned once, as a whole, under ``_build_lock``.
+        self._build_lock = threading.Lock()
+        self._date_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._full: Optional[Tuple[LocationRecords, Tuple[int, int, int]]] = None
+        self._daily_totals: Optional[DailyTotals] = None
+        self._life_list_index: Optional[LifeListIndex] = None
+
+    @property
+    def daily_totals(self) -> DailyTotals:
+        """Per-day totals cube over the prefiltered frame (built on first use)."""
+        if self._daily_totals is None:
+            with self._build_lock:
+                if self._daily_totals is None:
+                    self._daily_totals = DailyTotals(self.df_full_filtered)
+        return self._daily_totals
+
+    @property
+    def life_list_index(self) -> LifeListIndex:
+        """First-seen index for as-of life / year / country lists over the prefiltered frame (built on first use)."""
+        if self._life_list_index is None:
+            with self._build_lock:
+                if self._life_list_index is None:
+                    self._life_list_index = LifeListIndex(self.df_full_filtered)
+        return self._life_list_index
+
+    def _date_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._date_arrays is None:
+            with self._build_lock:
+                if self._date_arrays is None:
+                    dates = self.df_full_filtered["Date"].to_numpy()
+                    # Stable sort; NaT sorts last so range slices never include it.
+                    order = np.argsort(dates, kind="stable")
+                    self._date_arrays = (order, dates[order])
+        return self._date_arrays
+
+    def slice_dates(self, start: datetime, end: datetime) -> pd.DataFrame:
+        """Rows with ``start <= Date <= end``, in export order."""
+        order, sorted_dates = self._date_index()
+        lo = np.searchsorted(sorted_dates, np.datetime64(start), side="left")
+        hi = np.searchsorted(sorted_dates, np.datetime64(end), side="right")
+        return self.df_full_filtered.iloc[np.sort(order[lo:hi])]
+
+    def _full_aggregates(self) -> Tuple[LocationRecords, Tuple[int, int, int]]:
+        if self._full is None:
+            with self._build_lock:
+                if self._full is None:
+                    full = self.df_full_filtered
+                    totals = (
+                        full["Submission ID"].nunique(),
+                        int(countable_base_series(full).dropna().nunique()),
+                        int(count_series(full).sum()),
+                    )
+                    self._full = (LocationRecords(full), totals)
+        return self._full
+
+    def working_set(
+        self,
+        *,
+        filter_by_date: bool,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> WorkingSet:
+        """Return the (memoised) :class:`WorkingSet` for a validated range (or all-time)."""
+        use_filter = bool(filter_by_date and start is not None and end is not None)
+        key = (bool(filter_by_date), start if use_filter else None, end if use_filter else None)
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                return hit
+        ws = self._build(filter_by_date=bool(filter_by_date), start=start, end=end, use_filter=use_filter)
+        with self._cache_lock:
+            # Another session may have built the same range meanwhile; keep the first (same df identity).
+            ws = self._cache.setdefault(key, ws)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
+        return ws
+
+    def _build(self, *, filter_by_date, start, end, use_filter) -> WorkingSet:
+        df = self.slice_dates(start, end) if use_filter else self.df_full_filtered
+        location_data = df[["Location ID", "Location", "Latitude", "Longitude"]].drop_duplicates()
+        records_by_loc = LocationRecords(df)
+        species_list = sorted(df["Common Name"].dropna().unique().tolist())
+        if use_filter:
+            total_checklists, total_species, total_individuals = self.daily_totals.totals(start, end)
+        else:
+            total_checklists = df["Submission ID"].nunique()
+            total_individuals = int(count_series(df).sum())
+            total_species = int(countable_base_series(df).dropna().nunique())
+        name_map = (
+            df[["Common Name", "Scientific Name"]]
+            .dropna()
+            .drop_duplicates()
+            .set_index("Common Name")["Scientific Name"]
+            .to_dict()
+        )
+
+        if filter_by_date:
+            records_by_loc_full, (total_checklists_full, total_species_full, total_individuals_full) = (
+                self._full_aggregates()
+            )
+        else:
+            records_by_loc_full = {}
+            total_checklists_full = total_checklists
+            total_species_full = total_species
+            total_individuals_full = total_individuals
+
+        return WorkingSet(
+            df=df,
+            location_data=location_data,
+            records_by_loc=records_by_loc,
+            species_list=species_list,
+            total_checklists=total_checklists,
+            total_individuals=total_individuals,
+            total_species=total_species,
+            name_map=name_map,
+            records_by_loc_full=records_by_loc_full,
+            total_checklists_full=total_checklists_full,
+            total_species_full=total_species_full,
+            total_individuals_full=total_individuals_full,
+            date_range=(start, end) if use_filter else None,
+        )
 
 
 def rebuild_working_set_from_date_filter(
     df_full: pd.DataFrame,
-    location_ids_with_checklists: AbstractSet[Any],
+    location_ids_with_checklists: Optional[AbstractSet[Any]] = None,
     *,
     filter_by_date: bool,
     filter_start_date: str,
     filter_end_date: str,
     whoosh_index: Any = None,
-    map_caches: Optional[Tuple[dict, MutableMapping[Any, Any]]] = None,
+    map_caches: Optional[Tuple[MutableMapping[Any, Any], ...]] = None,
+    engine: Optional[WorkingSetEngine] = None,
 ) -> Optional[WorkingSet]:
     """
     Recompute the working ``df`` and derived structures from ``df_full``.
@@ -58,19 +222,26 @@ def rebuild_working_set_from_date_filter(
     df_full
         Full export dataframe (not the working slice).
     location_ids_with_checklists
-        Location IDs that have at least one checklist.
+        Location IDs that have at least one checklist. Required when *engine* is omitted; ignored
+        otherwise (the engine was built with its own set).
     filter_by_date, filter_start_date, filter_end_date
         Same semantics as ``FILTER_*`` variables.
     whoosh_index
         If set, the Whoosh index is cleared and repopulated with ``species_list``.
     map_caches
-        If set, ``(popup_html_cache, filtered_by_loc_cache)``; both are ``.clear()`` on success.
+        If set, session map caches (e.g. ``(popup_html_cache,)``); each is ``.clear()`` on success.
+    engine
+        Optional :class:`WorkingSetEngine` already built for this ``df_full`` /
+        ``location_ids_with_checklists`` (reused across calls). When omitted, a one-off engine is built.
 
     Returns
     -------
     WorkingSet or None
         ``None`` if date filter is on but start/end are invalid; otherwise a populated ``WorkingSet``.
     """
+    if engine is None and location_ids_with_checklists is None:
+        raise ValueError("location_ids_with_checklists is required when no engine is given.")
+
     start, end = None, None
     if filter_by_date:
         try:
@@ -80,66 +251,22 @@ def rebuild_working_set_from_date_filter(
         except Exception:
             return None
 
-    # Keep "full" groupings consistent: only locations that
-    # have checklists are eligible for both working + full views.
-    df_full_filtered = df_full[df_full["Location ID"].isin(location_ids_with_checklists)].copy()
-
-    df_new = df_full_filtered
-    if filter_by_date and start is not None and end is not None:
-        df_new = df_new[(df_new["Date"] >= start) & (df_new["Date"] <= end)]
-
-    df = df_new
-    location_data = df[["Location ID", "Location", "Latitude", "Longitude"]].drop_duplicates()
-    records_by_loc = {lid: grp for lid, grp in df.groupby("Location ID")}
-    species_list = sorted(df["Common Name"].dropna().unique().tolist())
-    total_checklists = df["Submission ID"].nunique()
-    total_individuals = int(df["Count"].apply(safe_count).sum())
-    total_species = int(countable_species_vectorized(df).dropna().nunique())
-    name_map = (
-        df[["Common Name", "Scientific Name"]]
-        .dropna()
-        .drop_duplicates()
-        .set_index("Common Name")["Scientific Name"]
-        .to_dict()
-    )
-
-    if filter_by_date:
-        records_by_loc_full = {lid: grp for lid, grp in df_full_filtered.groupby("Location ID")}
-        total_checklists_full = df_full_filtered["Submission ID"].nunique()
-        total_species_full = int(countable_species_vectorized(df_full_filtered).dropna().nunique())
-        total_individuals_full = int(df_full_filtered["Count"].apply(safe_count).sum())
-    else:
-        records_by_loc_full = {}
-        total_checklists_full = total_checklists
-        total_species_full = total_species
-        total_individuals_full = total_individuals
+    if engine is None:
+        engine = WorkingSetEngine(df_full, location_ids_with_checklists, max_cached=1)
+    ws = engine.working_set(filter_by_date=filter_by_date, start=start, end=end)
 
     if map_caches is not None:
-        popup_cache, filtered_cache = map_caches
-        popup_cache.clear()
-        filtered_cache.clear()
+        for cache in map_caches:
+            cache.clear()
 
     if whoosh_index is not None:
         from whoosh.query import Every
 
         w = whoosh_index.writer()
         w.delete_by_query(Every())
-        for common in species_list:
-            sci = str(name_map.get(common, "") or "")
+        for common in ws.species_list:
+            sci = str(ws.name_map.get(common, "") or "")
             w.add_document(common_name=common, scientific_name=sci, taxonomy_group="")
         w.commit()
 
-    return WorkingSet(
-        df=df,
-        location_data=location_data,
-        records_by_loc=records_by_loc,
-        species_list=species_list,
-        total_checklists=total_checklists,
-        total_individuals=total_individuals,
-        total_species=total_species,
-        name_map=name_map,
-        records_by_loc_full=records_by_loc_full,
-        total_checklists_full=total_checklists_full,
-        total_species_full=total_species_full,
-        total_individuals_full=total_individuals_full,
-    )
+    return ws
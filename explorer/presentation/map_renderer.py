@@ -993,7 +993,8 @@ def resolve_lifer_last_seen(
 
     Args:
         selected_species: Scientific name of the selected species.
-        seen_location_ids: Set of Location IDs where the species was observed.
+        seen_location_ids: Location IDs where the species was observed (any set-like;
+            the species map passes :class:`~explorer.core.species_location_index.SpeciesLocations` IDs).
         lifer_lookup: Dict mapping base species -> lifer Location ID.
         last_seen_lookup: Dict mapping base species -> last-seen Location ID.
         lifer_lookup_taxon: Dict mapping taxon key -> lifer Location ID.
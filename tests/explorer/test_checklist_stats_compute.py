@@ -1,9 +1,13 @@
 """Tests for checklist stats compute + display bundle (refs #68)."""
 
+from pathlib import Path
+
 import pandas as pd
+import pytest
 
 from explorer.core.checklist_stats_compute import (
     compute_checklist_stats_payload,
+    lazy_checklist_stats_payload,
     protocol_display_name,
 )
 from explorer.presentation.checklist_stats_display import (
@@ -15,11 +19,65 @@ from explorer.presentation.checklist_stats_display import (
     yearly_streamlit_year_window_slice,
 )
 
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
 
 def test_compute_payload_empty():
     assert compute_checklist_stats_payload(pd.DataFrame(), top_n_limit=10) is None
 
 
+@pytest.mark.parametrize("mode", ["threads", "processes", "unknown-falls-back"])
+def test_sections_modes_return_serial_payload(mode):
+    from explorer.core.data_loader import load_dataset
+
+    df = load_dataset(str(FIXTURE_CSV))
+    serial = compute_checklist_stats_payload(df, top_n_limit=10)
+    assert compute_checklist_stats_payload(df, top_n_limit=10, sections_mode=mode, max_workers=2) == serial
+
+
+def test_serial_sections_rank_not_seen_recently_for_section_countries_only(monkeypatch):
+    from explorer.core import checklist_stats_compute as csc
+    from explorer.core.data_loader import load_dataset
+
+    df = load_dataset(str(FIXTURE_CSV))
+    requested = []
+    real = csc.rankings_not_seen_recently_by_country
+
+    def _spy(df_obs, cl, country_keys=None, reference_date=None):
+        requested.append(country_keys)
+        return real(df_obs, cl, country_keys, reference_date)
+
+    monkeypatch.setattr(csc, "rankings_not_seen_recently_by_country", _spy)
+    payload = compute_checklist_stats_payload(df, top_n_limit=10)
+    assert requested == [list(payload.country_not_seen_recently)]
+
+
+def test_lazy_payload_computes_only_the_groups_read(monkeypatch):
+    from explorer.core import checklist_stats_compute as csc
+    from explorer.core.data_loader import load_dataset
+
+    df = load_dataset(str(FIXTURE_CSV))
+    assert lazy_checklist_stats_payload(df.iloc[0:0], top_n_limit=10) is None
+    eager = compute_checklist_stats_payload(df, top_n_limit=10)
+
+    payload = lazy_checklist_stats_payload(df, top_n_limit=10)
+    assert payload.computed_fields() == ()
+    assert payload.years_list == eager.years_list
+    assert set(payload.computed_fields()) == {"years_list", "yearly_rows", "incomplete_by_year"}
+
+    def _no_rankings(*args, **kwargs):
+        raise AssertionError("rankings computed")
+
+    monkeypatch.setattr(csc, "compute_rankings", _no_rankings)
+    assert payload.country_not_seen_recently == eager.country_not_seen_recently
+    assert payload.n_checklists == eager.n_checklists
+    monkeypatch.undo()
+    assert payload._inputs
+    assert payload.materialize() == eager
+    # Every group is memoised: the frames the payload was built from are released.
+    assert payload._inputs == {}
+
+
 def test_protocol_display_name_ebird_export_strings():
     assert protocol_display_name("eBird - Traveling Count") == "Traveling"
     assert protocol_display_name("eBird - Stationary Count") == "Stationary"
@@ -0,0 +1,57 @@
+"""Tests for explorer.core.daily_totals (per-day prefix-sum totals cube)."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from explorer.core.daily_totals import DailyTotals, RangeTotals
+from explorer.core.data_loader import load_dataset
+from explorer.core.derived_columns import count_series, countable_base_series
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+def _row_totals(df, start, end):
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= df["Date"] >= start
+    if end is not None:
+        mask &= df["Date"] <= end
+    sub = df[mask]
+    return RangeTotals(
+        int(sub["Submission ID"].nunique()),
+        int(countable_base_series(sub).dropna().nunique()),
+        int(count_series(sub).sum()),
+    )
+
+
+def test_matches_row_totals_on_fixture_ranges():
+    df = load_dataset(str(FIXTURE_CSV))
+    cube = DailyTotals(df)
+    days = sorted(df["Date"].dropna().unique())
+    rng = np.random.default_rng(0)
+    bounds = [(None, None), (days[0], days[-1]), (None, days[len(days) // 2]), (days[len(days) // 2], None)]
+    for _ in range(25):
+        a, b = sorted(rng.choice(len(days), 2))
+        bounds.append((days[a], days[b]))
+    bounds.append((days[-1] + pd.Timedelta(days=1), None))
+    for start, end in bounds:
+        assert cube.totals(start, end) == _row_totals(df, start, end), (start, end)
+
+
+@pytest.mark.parametrize("start,end", [("2024-01-02", "2024-01-03"), ("2024-01-01", "2024-01-02"), (None, "2024-01-01")])
+def test_multi_day_checklists_and_undated_rows(start, end):
+    df = pd.DataFrame(
+        {
+            "Submission ID": ["S1", "S1", "S2", "S3", "S4"],
+            "Date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-02", "2024-01-03", None]),
+            "Count": ["2", "X", "5", "1", "7"],
+            "Scientific Name": ["Anas gracilis", "Anas gracilis", "Anas sp.", "Anas superciliosa", "Anas gracilis"],
+            "Common Name": ["Grey Teal", "Grey Teal", "duck sp.", "Pacific Black Duck", "Grey Teal"],
+        }
+    )
+    cube = DailyTotals(df)
+    assert cube.totals(start, end) == _row_totals(df, start, end)
+    assert cube.totals() == RangeTotals(4, 2, 15)
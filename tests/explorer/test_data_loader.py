@@ -76,3 +76,30 @@ def test_load_dataset_normalizes_protocol_column():
     df = load_dataset(StringIO(csv))
     assert df.loc[0, "Protocol"] == "Traveling"
     assert df.loc[1, "Protocol"] == "Incidental"
+
+
+def test_load_dataset_typed_mode_categories_and_numeric_effort():
+    """typed=True categorises repeated names/ids, keeps Count text, and matches the default values."""
+    csv = """Date,Time,Location ID,Location,Latitude,Longitude,Common Name,Scientific Name,Submission ID,Count,Protocol,Duration (Min)
+2025-01-15,08:30,L123,My Patch,-33.8,151.2,House Sparrow,Passer domesticus,S1,X,eBird - Traveling Count,30
+2025-01-15,08:30,L123,My Patch,-33.8,151.2,Robin,Turdus,S1,2,eBird - Traveling Count,oops"""
+    plain = load_dataset(StringIO(csv))
+    typed = load_dataset(StringIO(csv), typed=True)
+
+    for col in ("Location ID", "Common Name", "Submission ID", "Protocol"):
+        assert isinstance(typed[col].dtype, pd.CategoricalDtype), col
+        assert typed[col].astype(str).tolist() == plain[col].astype(str).tolist()
+    assert typed["Count"].tolist() == ["X", "2"]
+    assert typed["Duration (Min)"].iloc[0] == 30
+    assert pd.isna(typed["Duration (Min)"].iloc[1])
+
+
+def test_load_dataset_usecols_keeps_required_columns():
+    """usecols prunes extra columns but never drops required ones; unknown names are ignored."""
+    csv = """Date,Time,Location ID,Location,Latitude,Longitude,Common Name,Scientific Name,Submission ID,Count,Protocol,ML Catalog Numbers
+2025-01-15,08:30,L123,My Patch,-33.8,151.2,House Sparrow,Passer domesticus,S1,2,eBird - Traveling Count,12345"""
+    df = load_dataset(StringIO(csv), usecols=["Protocol", "Not In Export"])
+
+    assert "ML Catalog Numbers" not in df.columns
+    assert set(REQUIRED_COLUMNS) <= set(df.columns)
+    assert df.loc[0, "Protocol"] == "Traveling"
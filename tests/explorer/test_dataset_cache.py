@@ -0,0 +1,84 @@
+"""Tests for explorer.core.dataset_cache (Parquet sidecar of the parsed export)."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from explorer.core.data_loader import load_dataset
+from explorer.core.dataset_cache import (
+    DATASET_FINGERPRINT_ATTR,
+    dataset_cache_path,
+    dataset_file_fingerprint,
+    dataset_frame_fingerprint,
+    load_dataset_with_cache,
+)
+
+pytest.importorskip("pyarrow")
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+@pytest.fixture
+def csv_copy(tmp_path):
+    dst = tmp_path / "MyEBirdData.csv"
+    shutil.copyfile(FIXTURE_CSV, dst)
+    return str(dst)
+
+
+def test_cached_frame_matches_fresh_load(csv_copy, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = load_dataset_with_cache(csv_copy, cache_dir)
+    assert os.path.isfile(dataset_cache_path(cache_dir, dataset_file_fingerprint(csv_copy)))
+
+    def _must_not_parse(_path):
+        raise AssertionError("CSV should not be parsed on a cache hit")
+
+    second = load_dataset_with_cache(csv_copy, cache_dir, loader=_must_not_parse)
+    pd.testing.assert_frame_equal(second, load_dataset(csv_copy))
+    pd.testing.assert_frame_equal(second, first)
+
+
+def test_content_change_invalidates_and_prunes_old_sidecar(csv_copy, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    load_dataset_with_cache(csv_copy, cache_dir)
+    old_path = dataset_cache_path(cache_dir, dataset_file_fingerprint(csv_copy))
+
+    df_src = pd.read_csv(csv_copy)
+    df_src.iloc[:-1].to_csv(csv_copy, index=False)
+    out = load_dataset_with_cache(csv_copy, cache_dir)
+
+    assert len(out) == len(df_src) - 1
+    assert not os.path.exists(old_path)
+    assert os.listdir(cache_dir) == [os.path.basename(dataset_cache_path(cache_dir, dataset_file_fingerprint(csv_copy)))]
+
+
+def test_unwritable_cache_dir_falls_back_to_csv(csv_copy, tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("x")
+    out = load_dataset_with_cache(csv_copy, str(blocker / "cache"))
+    pd.testing.assert_frame_equal(out, load_dataset(csv_copy))
+
+
+def test_corrupt_sidecar_is_ignored(csv_copy, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    Path(dataset_cache_path(str(cache_dir), dataset_file_fingerprint(csv_copy))).write_bytes(b"nope")
+    out = load_dataset_with_cache(csv_copy, str(cache_dir))
+    pd.testing.assert_frame_equal(out, load_dataset(csv_copy))
+
+
+def test_loaded_frame_is_stamped_with_fingerprint(csv_copy, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    fp = dataset_file_fingerprint(csv_copy)
+    assert load_dataset_with_cache(csv_copy, cache_dir).attrs[DATASET_FINGERPRINT_ATTR] == fp
+    cached = load_dataset_with_cache(csv_copy, cache_dir)
+    assert dataset_frame_fingerprint(cached) == fp
+
+
+def test_unstamped_frame_fingerprint_tracks_content():
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    assert dataset_frame_fingerprint(df) == dataset_frame_fingerprint(df.copy())
+    assert dataset_frame_fingerprint(df) != dataset_frame_fingerprint(df.iloc[:1])
@@ -122,3 +122,25 @@ def test_mixed_12h_and_24h_times():
     assert out.loc[1, "datetime"].strftime("%H:%M") == "14:00"
     assert out.loc[2, "datetime"].strftime("%H:%M") == "23:59"
 
+
+def test_edge_times_match_mixed_parse():
+    """Vectorised per-style parse agrees with format='mixed' on edge and fallback values."""
+    cases = [
+        ("12:00 AM", "2025-05-05 00:00:00"),
+        ("12:30 PM", "2025-05-05 12:30:00"),
+        ("9:05 pm", "2025-05-05 21:05:00"),
+        ("0:00", "2025-05-05 00:00:00"),
+        ("08:30:15", "2025-05-05 08:30:15"),
+        ("8 AM", "2025-05-05 08:00:00"),  # neither eBird style → mixed fallback
+        ("13:30 PM", None),
+        ("07:60", None),
+    ]
+    df = pd.DataFrame({"Date": ["2025-05-05"] * len(cases), "Time": [t for t, _ in cases]})
+    out = add_datetime_column(df.copy())
+    for i, (t, expected) in enumerate(cases):
+        got = out.loc[i, "datetime"]
+        if expected is None:
+            assert pd.isna(got), t
+        else:
+            assert got == pd.Timestamp(expected), t
+    assert out["datetime"].dtype == out["Date"].dtype
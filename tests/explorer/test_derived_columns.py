@@ -0,0 +1,67 @@
+"""Tests for explorer.core.derived_columns (load-time underscore columns)."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from explorer.core.data_loader import load_dataset
+from explorer.core.derived_columns import (
+    DERIVED_COLUMNS,
+    count_series,
+    countable_base_series,
+    country_key_series,
+    safe_count_vectorized,
+)
+from explorer.core.species_logic import countable_species_vectorized
+from explorer.core.stats import checklist_country_keys, safe_count
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series(["1", " 2 ", "X", "x", "", "+3", "-4", "1_000", "3.5", "abc", None, "007"]),
+        pd.Series([1.9, -1.9, np.nan, 0.0]),
+        pd.Series([1, 2, 3]),
+        pd.Series([1, "X", 2.5, None], dtype=object),
+    ],
+)
+def test_safe_count_vectorized_matches_safe_count(values):
+    assert safe_count_vectorized(values).tolist() == [safe_count(v) for v in values]
+
+
+def test_load_dataset_adds_derived_columns_matching_recomputation():
+    df = load_dataset(str(FIXTURE_CSV))
+    assert set(DERIVED_COLUMNS) <= set(df.columns)
+
+    raw = df.drop(columns=list(DERIVED_COLUMNS))
+    assert df["_count"].tolist() == raw["Count"].map(safe_count).tolist()
+    pd.testing.assert_series_equal(
+        df["_base"], countable_species_vectorized(raw), check_names=False
+    )
+    assert df["_country_key"].tolist() == checklist_country_keys(raw).tolist()
+    assert df["_year"].tolist() == raw["Date"].dt.year.tolist()
+
+
+def test_accessors_compute_when_columns_absent():
+    df = pd.DataFrame(
+        {
+            "Scientific Name": ["Passer domesticus", "Anas sp.", "Turdus merula merula"],
+            "Common Name": ["House Sparrow", "duck sp.", "Eurasian Blackbird"],
+            "Count": ["2", "X", "3"],
+            "State/Province": ["AU-NSW", None, "GB-ENG"],
+        }
+    )
+    assert count_series(df).tolist() == [2, 0, 3]
+    assert countable_base_series(df).tolist()[::2] == ["passer domesticus", "turdus merula"]
+    assert pd.isna(countable_base_series(df).iloc[1])
+    assert country_key_series(df).tolist() == ["AU", "_UNKNOWN", "GB"]
+
+
+def test_accessors_reuse_existing_columns():
+    df = pd.DataFrame({"Count": ["5"], "_count": [99], "_base": ["x y"]})
+    assert count_series(df).tolist() == [99]
+    assert countable_base_series(df).tolist() == ["x y"]
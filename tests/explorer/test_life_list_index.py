@@ -0,0 +1,64 @@
+"""Tests for explorer.core.life_list_index (as-of life / year / country lists)."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from explorer.core.data_loader import load_dataset
+from explorer.core.derived_columns import countable_base_series, country_key_series
+from explorer.core.life_list_index import LifeListIndex
+from explorer.core.working_set import WorkingSetEngine
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+def _row_species(df, as_of, country=None, year=None):
+    mask = df["Date"].notna()
+    if as_of is not None:
+        mask &= df["Date"] <= as_of
+    if country is not None:
+        mask &= country_key_series(df) == country
+    if year is not None:
+        mask &= df["Date"].dt.year == year
+    return set(countable_base_series(df[mask]).dropna())
+
+
+def test_as_of_lists_match_row_scans_on_fixture():
+    df = load_dataset(str(FIXTURE_CSV))
+    index = LifeListIndex(df)
+    days = sorted(df["Date"].dropna().unique())
+    rng = np.random.default_rng(0)
+    as_of_days = [None, days[0], days[-1], days[0] - pd.Timedelta(days=1)] + [
+        days[i] for i in rng.choice(len(days), 15)
+    ]
+    for as_of in as_of_days:
+        expected = _row_species(df, as_of)
+        assert index.count(as_of) == len(expected)
+        assert set(index.species(as_of)) == expected
+        for country in index.countries:
+            assert set(index.species(as_of, country=country)) == _row_species(df, as_of, country=country)
+        for year in index.years:
+            assert index.count(as_of, year=year) == len(_row_species(df, as_of, year=year))
+
+
+def test_species_are_in_first_seen_order_and_as_of_includes_the_whole_day():
+    df = load_dataset(str(FIXTURE_CSV))
+    index = LifeListIndex(df)
+    first_days = [index.first_seen(b) for b in index.species()]
+    assert first_days == sorted(first_days)
+    last_lifer_day = first_days[-1]
+    assert index.count(last_lifer_day + pd.Timedelta(hours=23)) == index.count()
+    assert index.count(last_lifer_day - pd.Timedelta(days=1)) < index.count()
+    assert index.first_seen("no such species") is None
+    assert index.count(country="ZZ") == 0
+    with pytest.raises(ValueError):
+        index.count(country="AU", year=2024)
+
+
+def test_working_set_engine_builds_the_index_once():
+    df = load_dataset(str(FIXTURE_CSV))
+    engine = WorkingSetEngine(df, set(df["Location ID"]))
+    assert engine.life_list_index is engine.life_list_index
+    assert engine.life_list_index.count() == LifeListIndex(df).count()
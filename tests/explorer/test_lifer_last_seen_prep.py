@@ -2,7 +2,13 @@
 
 import pandas as pd
 
-from explorer.core.lifer_last_seen_prep import aggregate_lifer_sites, prepare_lifer_last_seen
+from explorer.core.lifer_last_seen_prep import (
+    aggregate_lifer_sites,
+    count_subspecies_lifer_taxa,
+    lifer_last_seen_prep_for,
+    prepare_lifer_last_seen,
+)
+from explorer.core.dataset_cache import DATASET_FINGERPRINT_ATTR
 from explorer.core.species_logic import base_species_for_lifer
 
 
@@ -77,3 +83,77 @@ def test_aggregate_lifer_sites_invariants_dedupes_and_count_matches():
         global_sci.update(sci_names)
 
     assert n_distinct == len(global_sci)
+
+
+def test_aggregate_lifer_sites_flags_subspecies_lifers_once_per_location():
+    df = pd.DataFrame(
+        {
+            "datetime": pd.to_datetime(["2020-01-01", "2020-02-01", "2020-03-01", "2020-04-01"]),
+            "Date": pd.to_datetime(["2020-01-01", "2020-02-01", "2020-03-01", "2020-04-01"]),
+            "Scientific Name": [
+                "Turdus merula merula",
+                "Turdus merula",
+                "Turdus merula azorensis",
+                "Anas superciliosa",
+            ],
+            "Common Name": ["Eurasian Blackbird (merula)", "Eurasian Blackbird", None, "Pacific Black Duck"],
+            "Location ID": ["A", "A", "B", "B"],
+        }
+    )
+    prep = prepare_lifer_last_seen(df, base_species_fn=base_species_for_lifer)
+    by_loc, n = aggregate_lifer_sites(
+        prep.lifer_lookup_df,
+        prep.true_lifer_locations,
+        prep.true_lifer_locations_taxon,
+    )
+    assert by_loc["A"] == [
+        {
+            "scientific_name": "Turdus merula merula",
+            "common_name": "Eurasian Blackbird (merula)",
+            "is_base_lifer": True,
+            "is_taxon_lifer": True,
+        }
+    ]
+    assert [(e["scientific_name"], e["common_name"], e["is_taxon_lifer"]) for e in by_loc["B"]] == [
+        ("Anas superciliosa", "Pacific Black Duck", False),
+        ("Turdus merula azorensis", "", True),
+    ]
+    assert n == 3
+    assert count_subspecies_lifer_taxa(prep.lifer_lookup_df, prep.true_lifer_locations_taxon) == 2
+
+
+def test_lookup_keeps_first_and_last_rows_per_key_with_export_order_ties():
+    df = pd.DataFrame(
+        {
+            "datetime": pd.to_datetime(
+                ["2021-05-01", "2020-01-01", "2020-01-01", "2020-03-01", "2021-05-01", "2020-02-01"]
+            ),
+            "Scientific Name": [
+                "Turdus merula",
+                "Turdus merula",
+                "Turdus merula merula",
+                "Turdus merula",
+                "Turdus merula merula",
+                "Anas superciliosa",
+            ],
+            "Location ID": ["L5", "L1", "L2", "L3", "L6", "L4"],
+            "Submission ID": ["S5", "S1", "S2", "S3", "S6", "S4"],
+        }
+    )
+    df["Date"] = df["datetime"].dt.normalize()
+    prep = prepare_lifer_last_seen(df, base_species_fn=base_species_for_lifer)
+    assert prep.true_lifer_locations == {"anas superciliosa": "L4", "turdus merula": "L1"}
+    assert prep.true_last_seen_locations == {"anas superciliosa": "L4", "turdus merula": "L6"}
+    assert prep.true_lifer_locations_taxon["turdus merula merula"] == "L2"
+    assert prep.true_last_seen_locations_taxon["turdus merula"] == "L5"
+    # Only first/last rows per base and taxon, chronological (the 2020-03-01 row is dropped).
+    assert prep.lifer_lookup_df["Submission ID"].tolist() == ["S1", "S2", "S4", "S5", "S6"]
+
+
+def test_lifer_last_seen_prep_for_memoises_per_dataset_fingerprint():
+    df = _tiny_df()
+    df.attrs[DATASET_FINGERPRINT_ATTR] = "tiny"
+    prep = lifer_last_seen_prep_for(df, base_species_for_lifer)
+    assert lifer_last_seen_prep_for(df.copy(), base_species_for_lifer) is prep
+    assert lifer_last_seen_prep_for(df.iloc[:2], base_species_for_lifer) is not prep
+    assert lifer_last_seen_prep_for(_tiny_df(), base_species_for_lifer) is not prep
@@ -0,0 +1,32 @@
+"""Tests for explorer.core.location_records (lazy Location ID → rows mapping)."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from explorer.core.data_loader import load_dataset
+from explorer.core.location_records import LocationRecords
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+def test_matches_groupby_dict_on_fixture():
+    df = load_dataset(str(FIXTURE_CSV))
+    sub = df.iloc[::3]
+    expected = {lid: grp for lid, grp in sub.groupby("Location ID")}
+    lazy = LocationRecords(sub)
+    assert list(lazy) == list(expected)
+    assert len(lazy) == len(expected)
+    for lid, grp in expected.items():
+        pd.testing.assert_frame_equal(lazy[lid], grp)
+
+
+def test_mapping_semantics_and_missing_keys():
+    df = pd.DataFrame({"Location ID": ["L2", None, "L1", "L2"], "n": [1, 2, 3, 4]})
+    recs = LocationRecords(df)
+    assert list(recs.keys()) == ["L1", "L2"]
+    assert "L2" in recs and "L9" not in recs
+    assert recs["L2"]["n"].tolist() == [1, 4]
+    assert recs.positions("L2").tolist() == [0, 3]
+    assert recs.get("L9", pd.DataFrame()).empty
+    assert len(LocationRecords(df.iloc[:0])) == 0
@@ -1,6 +1,5 @@
 """Tests for :mod:`explorer.core.map_controller` / overlay map build."""
 
-from collections import OrderedDict
 from dataclasses import replace
 
 import pandas as pd
@@ -72,7 +71,6 @@ def _common_kwargs(df, *, visit_marker_scheme=None):
         true_lifer_locations_taxon=prep.true_lifer_locations_taxon,
         true_last_seen_locations_taxon=prep.true_last_seen_locations_taxon,
         popup_html_cache={},
-        filtered_by_loc_cache=OrderedDict(),
         visit_marker_scheme=visit_marker_scheme,
     )
 
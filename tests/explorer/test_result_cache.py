@@ -0,0 +1,77 @@
+"""Tests for explorer.core.result_cache (pickled results that survive restarts)."""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from explorer.core import checklist_stats_compute as csc
+from explorer.core.data_loader import load_dataset
+from explorer.core.dataset_cache import DATASET_FINGERPRINT_ATTR
+from explorer.core.result_cache import ResultCache, frame_result_fingerprint
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+def test_round_trip_is_keyed_by_kind_parts_and_code_version(tmp_path):
+    cache = ResultCache(str(tmp_path), code_version="a")
+    assert cache.get("stats", ("fp", 10)) is None
+    assert cache.put("stats", ("fp", 10), {"rows": [1, 2]})
+    assert cache.get("stats", ("fp", 10)) == {"rows": [1, 2]}
+    assert cache.get("stats", ("fp", 20)) is None
+    assert cache.get("other", ("fp", 10)) is None
+    assert ResultCache(str(tmp_path), code_version="b").get("stats", ("fp", 10)) is None
+    assert [p for p in os.listdir(tmp_path) if p.endswith(".tmp")] == []
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=2500, code_version="a")
+    blob = b"x" * 1000
+    cache.put("k", (1,), blob)
+    cache.put("k", (2,), blob)
+    for key, when in (((1,), 300), ((2,), 100)):
+        os.utime(cache.entry_path("k", key), (when, when))
+    assert cache.get("k", (1,)) == blob  # read bumps (1,) to most recently used
+    cache.put("k", (3,), blob)
+    assert cache.get("k", (2,)) is None
+    assert cache.get("k", (1,)) == blob
+    assert cache.get("k", (3,)) == blob
+
+
+def test_corrupt_entry_is_a_miss_and_disabled_cache_stores_nothing(tmp_path):
+    cache = ResultCache(str(tmp_path), code_version="a")
+    Path(cache.entry_path("k", (1,))).write_bytes(b"not a pickle")
+    assert cache.get_or_compute("k", (1,), lambda: "fresh") == "fresh"
+    assert cache.get("k", (1,)) == "fresh"
+
+    off = ResultCache(str(tmp_path / "off"), max_bytes=0, code_version="a")
+    assert not off.put("k", (1,), "value")
+    assert not (tmp_path / "off").exists()
+
+
+def test_stamped_frame_fingerprint_tells_working_sets_apart():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    df.attrs[DATASET_FINGERPRINT_ATTR] = "export"
+    subset = df[df["a"] > 1]
+    assert subset.attrs[DATASET_FINGERPRINT_ATTR] == "export"
+    assert frame_result_fingerprint(subset) != frame_result_fingerprint(df)
+    assert frame_result_fingerprint(df[df["a"] > 1]) == frame_result_fingerprint(subset)
+
+
+def test_lazy_payload_reads_groups_back_from_the_result_cache(tmp_path, monkeypatch):
+    df = load_dataset(str(FIXTURE_CSV))
+    df.attrs[DATASET_FINGERPRINT_ATTR] = "fixture"
+    cache = ResultCache(str(tmp_path), code_version="a")
+    first = csc.lazy_checklist_stats_payload(df, 10, result_cache=cache)
+    first.prefetch("threads")
+    expected = first.materialize()
+
+    def _must_not_compute(*args, **kwargs):
+        raise AssertionError("group recomputed")
+
+    for name in ("_section_rankings", "_section_yearly", "_section_countries", "_summary_fields", "_streak_fields"):
+        monkeypatch.setattr(csc, name, _must_not_compute)
+    monkeypatch.setattr(csc, "rankings_not_seen_recently_by_country", _must_not_compute)
+    second = csc.lazy_checklist_stats_payload(df, 10, result_cache=cache)
+    second.prefetch("serial")
+    assert second.materialize() == expected
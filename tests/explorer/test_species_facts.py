@@ -0,0 +1,75 @@
+"""Tests for explorer.core.species_facts (species banner lookups)."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from explorer.core.data_loader import load_dataset
+from explorer.core.derived_columns import count_series
+from explorer.core.lifer_last_seen_prep import prepare_lifer_last_seen
+from explorer.core.species_facts import SpeciesFacts, first_last_seen_for, species_facts_for
+from explorer.core.species_logic import base_species_for_lifer, filter_species
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+def _row_banner(df, selected):
+    filtered = filter_species(df, selected)
+    counts = count_series(filtered)
+    high_row = filtered[counts == counts.max()].iloc[0]
+    return (
+        filtered["Submission ID"].nunique(),
+        int(counts.sum()),
+        int(counts.max()),
+        high_row["Date"],
+        high_row["Submission ID"],
+    )
+
+
+def test_banner_matches_filtered_rows_on_fixture():
+    df = load_dataset(str(FIXTURE_CSV))
+    facts = SpeciesFacts(df)
+    names = df["Scientific Name"].dropna().unique().tolist()
+    # Base species prefixes cover their subspecies and hybrids (several names per selection).
+    selections = names + sorted({" ".join(n.split()[:2]) for n in names}) + [names[0].split()[0]]
+    for selected in selections:
+        got = facts.banner(selected)
+        assert got is not None, selected
+        want = _row_banner(df, selected)
+        assert tuple(got[:3]) == want[:3], selected
+        assert got.high_count_date == want[3] and got.high_count_sid == want[4], selected
+    assert facts.banner("Nonexistent birdus") is None
+
+
+def test_banner_combines_names_and_keeps_first_high_count_row():
+    df = pd.DataFrame(
+        {
+            "Scientific Name": ["Anas a", "Anas a b", "Anas a", "Anas a x Anas c", "Anas c"],
+            "Count": ["2", "5", "X", "5", "9"],
+            "Submission ID": ["S1", "S1", "S2", "S3", "S3"],
+            "Date": pd.to_datetime(["2020-01-01", "2020-01-01", "2020-02-01", "2020-03-01", "2020-03-01"]),
+        }
+    )
+    facts = species_facts_for(df)
+    got = facts.banner("Anas a")
+    assert got[:3] == (3, 12, 5)
+    assert got.high_count_sid == "S1"
+    assert facts.banner("anas a b")[:3] == (1, 5, 5)
+
+
+def test_first_last_seen_by_base_and_taxon():
+    df = pd.DataFrame(
+        {
+            "datetime": pd.to_datetime(["2020-01-01", "2020-06-01", "2021-01-01"]),
+            "Date": pd.to_datetime(["2020-01-01", "2020-06-01", "2021-01-01"]),
+            "Scientific Name": ["Turdus migratorius", "Turdus migratorius a", "Anas superciliosa"],
+            "Location ID": ["A", "B", "C"],
+            "Submission ID": ["S1", "S2", "S3"],
+        }
+    )
+    prep = prepare_lifer_last_seen(df, base_species_fn=base_species_for_lifer)
+    seen = first_last_seen_for(prep.lifer_lookup_df)
+    robin = seen.base[base_species_for_lifer("Turdus migratorius")]
+    assert (robin.first_sid, robin.last_sid) == ("S1", "S2")
+    assert robin.last_date == pd.Timestamp("2020-06-01")
+    assert seen.taxon["turdus migratorius a"].first_sid == "S2"
@@ -2,7 +2,9 @@
 
 import pandas as pd
 
+from explorer.core.dataset_cache import DATASET_FINGERPRINT_ATTR
 from explorer.core.species_logic import filter_species
+from explorer.core.species_row_index import species_row_index_for
 
 
 def test_filter_species_prefix_and_subspecies_but_not_species_level_slash():
@@ -81,3 +83,40 @@ def test_filter_species_case_insensitive():
     out = filter_species(df, "Anas Gracilis")
 
     assert len(out) == 2
+
+
+def test_filter_species_preserves_row_order_index_and_columns():
+    """Index-backed lookup returns rows in frame order, keeping the original index."""
+    df = pd.DataFrame(
+        {
+            "Scientific Name": ["Anas gracilis rogersi", "Anas castanea", "Anas gracilis", None],
+            "Count": ["1", "2", "3", "4"],
+        },
+        index=[40, 30, 20, 10],
+    )
+
+    out = filter_species(df, "anas gracilis")
+    assert list(out.index) == [40, 20]
+    assert list(out.columns) == ["Scientific Name", "Count"]
+
+    empty = filter_species(df, "turdus merula")
+    assert empty.empty and list(empty.columns) == ["Scientific Name", "Count"]
+
+
+def test_filter_species_prefix_only_matches_whole_range_between_neighbours():
+    """Sorted-prefix range: names sharing the prefix match, neighbours either side do not."""
+    df = pd.DataFrame(
+        {"Scientific Name": ["Anas gracili", "Anas gracilisx", "Anas gracilis / castanea", "Anas graciliz"]}
+    )
+
+    out = filter_species(df, "anas gracilis")
+    assert out["Scientific Name"].tolist() == ["Anas gracilisx"]
+
+
+def test_species_row_index_shared_by_copies_of_a_stamped_frame():
+    df = pd.DataFrame({"Scientific Name": ["Anas gracilis", "Turdus merula", "Anas gracilis"]})
+    df.attrs[DATASET_FINGERPRINT_ATTR] = "fp-rows"
+    index = species_row_index_for(df)
+    assert species_row_index_for(df.copy()) is index
+    assert species_row_index_for(df.iloc[:2]) is not index
+    assert filter_species(df.iloc[:2], "anas gracilis").index.tolist() == [0]
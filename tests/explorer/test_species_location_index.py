@@ -0,0 +1,52 @@
+"""Tests for explorer.core.species_location_index (species → locations / rows)."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from explorer.core.data_loader import load_dataset
+from explorer.core.dataset_cache import DATASET_FINGERPRINT_ATTR
+from explorer.core.species_facts import species_facts_for
+from explorer.core.species_location_index import SpeciesLocationIndex, species_location_index_for
+from explorer.core.species_logic import filter_species
+from explorer.core.species_row_index import species_row_index_for
+
+FIXTURE_CSV = Path(__file__).resolve().parent.parent / "fixtures" / "ebird_integration_fixture.csv"
+
+
+def test_select_matches_filter_species_grouped_by_location():
+    df = load_dataset(str(FIXTURE_CSV))
+    index = SpeciesLocationIndex(df)
+    names = df["Scientific Name"].dropna().unique().tolist()
+    selections = names + sorted({" ".join(n.split()[:2]) for n in names}) + [names[0].split()[0]]
+    for selected in selections:
+        filtered = filter_species(df, selected)
+        got = index.select(selected)
+        assert got.location_ids == set(filtered["Location ID"]), selected
+        assert df.index[got.positions].equals(filtered.index), selected
+        for lid, grp in filtered.groupby("Location ID"):
+            pd.testing.assert_frame_equal(got.rows_at(df, lid), grp)
+    assert index.select("Nonexistent birdus").empty
+
+
+def test_select_combines_subspecies_and_hybrids_per_location():
+    df = pd.DataFrame(
+        {
+            "Scientific Name": ["Anas a", "Anas a b", "Anas c", "Anas a x Anas c", "Anas a"],
+            "Location ID": ["L2", "L1", "L1", "L3", "L1"],
+        }
+    )
+    index = SpeciesLocationIndex(df)
+    got = index.select("Anas a")
+    assert got.location_ids == {"L1", "L2", "L3"}
+    assert got.rows_at(df, "L1").index.tolist() == [1, 4]
+    assert got.rows_at(df, "L9").empty
+    assert index.select("anas a b").location_ids == {"L1"}
+
+
+def test_location_index_and_facts_share_the_species_row_index():
+    df = load_dataset(str(FIXTURE_CSV))
+    df.attrs[DATASET_FINGERPRINT_ATTR] = "fp-shared-rows"
+    rows = species_row_index_for(df)
+    assert species_location_index_for(df)._rows is rows
+    assert species_facts_for(df.copy()).index is rows
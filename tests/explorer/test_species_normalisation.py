@@ -7,6 +7,8 @@ from explorer.core.species_logic import (
     is_countable,
     countable_species_vectorized,
     base_species_for_lifer,
+    classify_species,
+    species_classification_frame,
 )
 
 
@@ -123,6 +125,7 @@ def test_is_countable_agrees_with_vectorized():
         ("Columba livia", "Rock Pigeon (Domestic type)"),
         ("Anas gracilis castanea", "Some duck (hybrid)"),
         ("Anas", "Something"),
+        ("Anas SP.", "Duck sp."),
     ]
     df = pd.DataFrame(rows, columns=["Scientific Name", "Common Name"])
     vec = countable_species_vectorized(df)
@@ -135,6 +138,32 @@ def test_is_countable_agrees_with_vectorized():
         )
 
 
+def test_classify_species_fields():
+    c = classify_species("  Anas gracilis rogersi ", "Grey Teal (rogersi)")
+    assert (c.countable, c.base, c.taxon, c.is_subspecies) == (
+        True, "anas gracilis", "anas gracilis rogersi", True,
+    )
+    c = classify_species("Anas sp.", None)
+    assert (c.countable, c.base, c.is_subspecies) == (False, "anas sp.", False)
+    assert classify_species(float("nan"), "x") == (False, None, None, False)
+
+
+def test_species_classification_frame_broadcasts_per_pair():
+    """Same scientific name with different common names is classified per pair."""
+    df = pd.DataFrame(
+        {
+            "Scientific Name": ["Columba livia", "Columba livia", None, "Columba livia"],
+            "Common Name": ["Rock Pigeon", "Rock Pigeon (Domestic type)", "x", "Rock Pigeon"],
+        },
+        index=[10, 11, 12, 13],
+    )
+    out = species_classification_frame(df)
+    assert list(out.index) == [10, 11, 12, 13]
+    assert out["countable"].tolist() == [True, False, False, True]
+    assert out["base"].iloc[0] == out["base"].iloc[3] == "columba livia"
+    assert pd.isna(out["base"].iloc[2])
+
+
 # ---------------------------------------------------------------------------
 # base_species_for_lifer (delegates to base_species_name)
 # ---------------------------------------------------------------------------
@@ -4,8 +4,11 @@ import pandas as pd
 
 from explorer.core.stats import (
     checklist_country_keys,
+    checklist_facts,
     country_summary_stats,
     format_observed_count_for_map_popup,
+    location_facts,
+    rankings_by_location,
     safe_count,
     longest_streak,
     region_column,
@@ -18,6 +21,7 @@ from explorer.core.stats import (
     rankings_seen_once,
     rankings_by_visits,
     rankings_not_seen_recently,
+    rankings_not_seen_recently_by_country,
     rankings_not_seen_recently_in_country,
     rankings_high_counts,
 )
@@ -86,6 +90,14 @@ class TestFormatRegionParts:
     def test_nan_float(self):
         assert format_region_parts(float("nan")) == (None, None)
 
+    def test_column_wise_parts_match_scalar_helper(self):
+        from explorer.core.stats import _region_parts
+
+        values = ["AU-NSW", " US - CA ", "GB", "", None, float("nan"), "-X", "Y-", "a-b-c"]
+        countries, states = _region_parts(values)
+        expected = [tuple(p or "" for p in format_region_parts(v)) for v in values]
+        assert list(zip(countries, states)) == expected
+
 
 # ---------------------------------------------------------------------------
 # region_column
@@ -255,6 +267,26 @@ class TestRankingsSubspecies:
     def test_hierarchical_empty_df(self):
         assert rankings_subspecies_hierarchical(pd.DataFrame()) == []
 
+    def test_most_frequent_common_names_and_exclusions(self):
+        df = _obs_df(
+            [
+                {"Scientific Name": "Gymnorhina tibicen tibicen", "Common Name": "Australian Magpie (Black-backed)", "Count": 2},
+                {"Scientific Name": "Gymnorhina tibicen tibicen", "Common Name": "Magpie (Black-backed)", "Count": 1},
+                {"Scientific Name": "Gymnorhina tibicen tibicen", "Common Name": "Australian Magpie (Black-backed)", "Count": "X"},
+                {"Scientific Name": "Gymnorhina tibicen hypoleuca", "Common Name": "Australian Magpie (White-backed)", "Count": 4},
+                {"Scientific Name": "Anas gracilis x superciliosa", "Common Name": "Grey Teal x Pacific Black Duck (hybrid)"},
+                {"Scientific Name": "Motacilla alba alba", "Common Name": "White Wagtail (White)", "Count": 3},
+            ]
+        )
+        blocks = rankings_subspecies_hierarchical(df, limit=1)
+        assert [b["species_common"] for b in blocks] == ["Australian Magpie"]
+        subs = blocks[0]["subspecies"]
+        assert [d["subspecies_common"] for d in subs] == ["Black-backed", "White-backed"]
+        assert subs[0]["subspecies_common_full"] == "Australian Magpie (Black-backed)"
+        assert [d["individuals"] for d in subs] == [3, 4]
+        assert blocks[0]["species_only_individuals"] == 0
+        assert len(rankings_subspecies_hierarchical(df)) == 2
+
 
 class TestRankingsSeenOnce:
     def test_species_seen_twice_excluded(self):
@@ -282,6 +314,41 @@ class TestRankingsByVisits:
         assert "ebird.org/mychecklists/L1" in rows[0][0]
         assert rows[0][5] == "2"
 
+    def test_limit_cuts_ties_by_oldest_first_visit_and_skips_undated(self):
+        cl = pd.DataFrame({
+            "Submission ID": ["S1", "S2", "S3", "S4", "S5", "S6"],
+            "Location ID": ["L1", "L1", "L2", "L2", "L3", "L4"],
+            "Location": ["Park A", "Park A", "Park B", "Park B", "Park C", "Park D"],
+            "Date": pd.to_datetime(["2025-03-01", "2025-03-02", "2025-01-01", "2025-05-01", "2024-01-01", None]),
+        })
+        rows = rankings_by_visits(cl, limit=1)
+        assert len(rows) == 1 and "Park B" in rows[0][0]
+        assert [r[5] for r in rankings_by_visits(cl, limit=10)] == ["2", "2", "1"]
+
+
+class TestLocationFacts:
+    def test_facts_and_location_rankings(self):
+        df = _obs_df([
+            {"Submission ID": "S1", "Location ID": "L1", "Location": "Park A", "Count": 3},
+            {"Submission ID": "S1", "Location ID": "L1", "Location": "Park A", "Count": 2,
+             "Scientific Name": "Anas superciliosa", "Common Name": "Pacific Black Duck"},
+            {"Submission ID": "S2", "Location ID": "L2", "Location": "Park B", "Count": 9,
+             "Date": pd.Timestamp("2024-06-01")},
+            {"Submission ID": "S3", "Location ID": "L1", "Location": "Park A", "Count": "X",
+             "Date": pd.Timestamp("2025-02-01")},
+        ])
+        cl = df.drop_duplicates(subset=["Submission ID"]).copy()
+        facts = location_facts(df, cl).set_index("Location ID")
+        assert facts.loc["L1", "Checklists"] == 2
+        assert facts.loc["L1", "_species"] == 2
+        assert facts.loc["L1", "_individuals"] == 5
+        assert facts.loc["L1", "First_SID"] == "S1" and facts.loc["L1", "Last_SID"] == "S3"
+
+        by_species = rankings_by_location(df, cl, "species", str, 1)
+        assert len(by_species) == 1 and "Park A" in by_species[0][0]
+        by_ind = rankings_by_location(df, cl, "individuals", str, 5)
+        assert [r[-1] for r in by_ind] == ["9", "5"]
+
 
 class TestRankingsHighCounts:
     def test_picks_last_by_default_when_tied(self):
@@ -356,6 +423,21 @@ class TestRankingsHighCounts:
         rows = rankings_high_counts(df, sort_mode="alphabetical")
         assert [r[0] for r in rows] == ["Grey Teal", "Mallard"]
 
+    def test_undated_ties_rank_last_and_submission_id_breaks_same_time(self):
+        df = _obs_df(
+            [
+                {"Submission ID": "S9", "Date": pd.NaT, "Count": 8},
+                {"Submission ID": "S3", "Date": pd.Timestamp("2024-05-01"), "Count": 8},
+                {"Submission ID": "S2", "Date": pd.Timestamp("2024-05-01"), "Count": 8},
+                {"Submission ID": "S1", "Date": pd.Timestamp("2023-01-01"), "Count": 3},
+                {"Scientific Name": "Anas castanea", "Common Name": "Chestnut Teal", "Count": 8},
+            ]
+        )
+        for tie_break in ("first", "last"):
+            rows = rankings_high_counts(df, tie_break=tie_break)
+            assert [r[0] for r in rows] == ["Chestnut Teal", "Grey Teal"]
+            assert "checklist/S2" in rows[1][4]
+
 
 # ---------------------------------------------------------------------------
 # rankings_not_seen_recently
@@ -442,6 +524,25 @@ class TestRankingsNotSeenRecentlyInCountry:
         assert au_rows[0][0] == "Grey Teal"
         assert "S_AU" in au_rows[0][1]
 
+    def test_by_country_matches_single_country_calls(self):
+        ref = pd.Timestamp("2025-06-01")
+        df = _obs_df([
+            {"Submission ID": "S_US", "Date": pd.Timestamp("2025-01-01"), "Country": "US"},
+            {"Submission ID": "S_AU1", "Date": pd.Timestamp("2019-01-01"), "Country": "AU"},
+            {"Submission ID": "S_AU2", "Date": pd.Timestamp("2021-01-01"), "Country": "AU",
+             "Common Name": "Chestnut Teal", "Scientific Name": "Anas castanea"},
+            {"Submission ID": "S_NZ", "Date": pd.Timestamp("2018-01-01"), "Country": "NZ"},
+        ])
+        cl = df.drop_duplicates(subset=["Submission ID"])
+        keys = ["US", "AU", "_UNKNOWN", "NZ", "FJ"]
+        batched = rankings_not_seen_recently_by_country(df, cl, keys, reference_date=ref)
+        assert list(batched) == keys
+        for ck in keys:
+            assert batched[ck] == rankings_not_seen_recently_in_country(df, cl, ck, reference_date=ref)
+        assert [r[0] for r in batched["AU"]] == ["Grey Teal", "Chestnut Teal"]
+        assert batched["US"] == batched["_UNKNOWN"] == batched["FJ"] == []
+        assert list(rankings_not_seen_recently_by_country(df, cl, reference_date=ref)) == ["AU", "NZ", "US"]
+
 
 # ---------------------------------------------------------------------------
 # compute_rankings (integration)
@@ -468,6 +569,29 @@ class TestComputeRankings:
         for key in result:
             assert result[key] == []
 
+    def test_checklist_facts_per_checklist_values(self):
+        df = _obs_df([
+            {"Submission ID": "S1", "Count": 2, "Duration (Min)": "30"},
+            {"Submission ID": "S1", "Count": "X", "Scientific Name": "Anas sp.", "Common Name": "duck sp.",
+             "Duration (Min)": "30"},
+            {"Submission ID": "S1", "Count": 4, "Scientific Name": "Anas superciliosa",
+             "Common Name": "Pacific Black Duck", "Duration (Min)": "30"},
+            {"Submission ID": "S2", "Count": 7, "Duration (Min)": None},
+            {"Submission ID": "S3", "Count": 1, "Duration (Min)": "n/a"},
+        ])
+        cl = df.drop_duplicates(subset=["Submission ID"]).copy()
+        facts = checklist_facts(df, cl, dur_col="Duration (Min)")
+        assert facts["Submission ID"].tolist() == ["S1", "S2", "S3"]
+        assert facts["_nsp"].tolist() == [2, 1, 1]
+        assert facts["_nind"].tolist() == [6, 7, 1]
+        assert facts["_dur"].tolist()[::2] == [30.0, 0.0]
+        assert pd.isna(facts["_dur"].iloc[1])
+        assert "_dist" not in facts.columns
+
+        rankings = compute_rankings(df, cl, limit=10, dur_col="Duration (Min)", dist_col=None)
+        assert [r[-1] for r in rankings["individuals"]] == ["7", "6", "1"]
+        assert [r[-1] for r in rankings["time"]] == ["30 min", "0 min"]
+
 
 # ---------------------------------------------------------------------------
 # yearly_summary_stats
@@ -538,6 +662,45 @@ class TestYearlySummaryStats:
             static.append(ls.split(" <span")[0].strip())
         assert static == expected_static
 
+    def test_effort_days_and_protocol_averages_per_year(self):
+        """Grouped per-year facts: effort sums, shared / cumulative days and per-protocol averages."""
+        rows_in = [
+            ("S1", "2025-01-01", "L1", "A a", 3, "Traveling", 30, 1.5, 1),
+            ("S1", "2025-01-01", "L1", "B b", 2, "Traveling", 30, 1.5, 1),
+            ("S2", "2025-01-01", "L2", "A a", 1, "Traveling", 60, 2.5, 2),
+            ("S3", "2026-06-15", "L1", "C c", 5, "Stationary", 20, 0.0, 1),
+            ("S4", "2026-06-16", "L3", "A a", "X", "Incidental", None, None, 1),
+        ]
+        df = pd.DataFrame(
+            rows_in,
+            columns=[
+                "Submission ID", "Date", "Location ID", "Scientific Name", "Count", "Protocol",
+                "Duration (Min)", "Distance Traveled (km)", "Number of Observers",
+            ],
+        )
+        df["Date"] = pd.to_datetime(df["Date"])
+        df["Location"] = df["Location ID"]
+        df["Common Name"] = df["Scientific Name"]
+        df["All Obs Reported"] = 1
+        cl = df.drop_duplicates(subset=["Submission ID"]).copy()
+        years, rows, _ = yearly_summary_stats(df, cl, "Duration (Min)", "Distance Traveled (km)")
+        assert years == [2025, 2026]
+        by_label = {label.split(" <span")[0]: vals for label, vals in rows}
+        assert by_label["Total individuals"] == ["6", "5"]
+        assert by_label["Days with checklist"] == ["1", "2"]
+        assert by_label["Cumulative days eBird on"] == ["1", "3"]
+        assert by_label["Shared checklists"] == ["1", "0"]
+        assert by_label["Days birding with others"] == ["1", "0"]
+        assert by_label["Total birding hours"] == ["1.5", "0.3"]
+        assert by_label["Total distance (km)"] == ["4.0", "—"]
+        assert by_label["Unique locations"] == ["2", "2"]
+        assert by_label["Traveling checklist: Average distance (km)"] == ["2.0", "—"]
+        assert by_label["Traveling checklist: Average minutes"] == ["45.0", "—"]
+        assert by_label["Traveling checklist: Average species"] == ["1.5", "—"]
+        assert by_label["Traveling checklist: Average individuals"] == ["3.0", "—"]
+        assert by_label["Stationary checklist: Average minutes"] == ["—", "20.0"]
+        assert by_label["Stationary checklist: Average individuals"] == ["—", "5.0"]
+
     def test_total_bird_families_uses_taxonomy_map(self, monkeypatch):
         """Per-year distinct family names match a stub base_species → family map (no network)."""
         df, cl = self._minimal_data()
@@ -720,3 +883,35 @@ class TestCountrySummaryStats:
         assert au["Total checklists"] == ["1", "1", "2"]
         assert au["Days with a checklist"] == ["1", "1", "2"]
         assert au["Cumulative days eBird on"] == ["1", "2", "2"]
+
+    def test_repeat_days_undated_rows_and_same_day_world_lifer(self):
+        """Same-day checklists count one day; undated rows never raise; first row wins a world-lifer tie."""
+        df = pd.DataFrame(
+            {
+                "Submission ID": ["S1", "S2", "S3", "S4", "S5"],
+                "Date": [
+                    pd.Timestamp("2024-05-01"),
+                    pd.Timestamp("2024-05-01"),
+                    pd.Timestamp("2024-05-01"),
+                    pd.Timestamp("2026-01-01"),
+                    pd.NaT,
+                ],
+                "Count": [2, 3, "X", 1, 4],
+                "Scientific Name": ["Foo barbatus", "Foo barbatus", "Foo barbatus", "Baz qux", "Qux quux"],
+                "Common Name": ["a", "a", "a", "b", "c"],
+                "State/Province": ["NZ-AUK", "AU-NSW", "NZ-AUK", "NZ-AUK", "NZ-AUK"],
+            }
+        )
+        blocks = country_summary_stats(df, df.copy())
+        by_key = {k: (years, {label: vals for label, vals in rows}) for k, years, rows in blocks}
+        assert set(by_key) == {"AU", "NZ"}
+        assert by_key["AU"][1]["Lifers (world)"] == ["0"]
+        assert by_key["AU"][1]["Lifers (country)"] == ["1"]
+
+        years, nz = by_key["NZ"]
+        assert years == [2024, 2026]
+        assert nz["Lifers (world)"] == ["1", "1", "2"]
+        assert nz["Total checklists"] == ["2", "1", "3"]
+        assert nz["Total individuals"] == ["2", "1", "3"]
+        assert nz["Days with a checklist"] == ["1", "1", "2"]
+        assert nz["Cumulative days eBird on"] == ["1", "2", "2"]
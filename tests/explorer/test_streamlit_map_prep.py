@@ -1,12 +1,11 @@
 """Tests for Streamlit map context prep (refs #70)."""
 
-from collections import OrderedDict
-
 import pandas as pd
 import pytest
 
 from explorer.app.streamlit.defaults import active_map_marker_colour_scheme
 from explorer.core.settings_schema_defaults import MAP_MARKER_COLOUR_SCHEME_DEFAULT
+from explorer.core.daily_totals import DailyTotals
 from explorer.core.map_controller import build_species_overlay_map
 from explorer.core.species_logic import base_species_for_lifer
 from explorer.core.map_prep import (
@@ -46,7 +45,6 @@ def test_prepare_all_locations_map_context_matches_controller_contract():
         **ctx,
         selected_species="",
         popup_html_cache={},
-        filtered_by_loc_cache=OrderedDict(),
         species_url_fn=None,
         base_species_fn=base_species_for_lifer,
         map_view_mode="all",
@@ -58,6 +56,19 @@ def test_prepare_all_locations_map_context_matches_controller_contract():
     assert "Test Location" in html or "L1" in html
 
 
+def test_prepare_context_reads_totals_from_daily_cube():
+    day2 = _tiny_df().assign(
+        **{"Submission ID": ["S2"], "Date": [pd.Timestamp("2025-02-01")], "Count": [5]}
+    )
+    full = pd.concat([_tiny_df(), day2], ignore_index=True)
+    cube = DailyTotals(full)
+    ctx = prepare_all_locations_map_context(
+        day2, full_df=full, daily_totals=cube, date_range=(pd.Timestamp("2025-01-15"), pd.Timestamp("2025-03-01"))
+    )
+    assert ctx["effective_totals"] == prepare_all_locations_map_context(day2, full_df=full)["effective_totals"]
+    assert ctx["effective_totals"] == (1, 1, 1, 5)
+
+
 def test_prepare_empty_raises():
     with pytest.raises(ValueError, match="empty"):
         prepare_all_locations_map_context(pd.DataFrame())
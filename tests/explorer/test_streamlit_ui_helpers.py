@@ -233,6 +233,25 @@ def test_sync_rankings_tab_session_inputs_sets_bundle(streamlit_stub) -> None:
     assert st.session_state[RANKINGS_TAB_BUNDLE_KEY] is sentinel
 
 
+def test_session_rankings_bundle_builds_deferred_bundle_once(streamlit_stub) -> None:
+    rankings = importlib.import_module("explorer.app.streamlit.rankings_streamlit_html")
+    from explorer.app.streamlit.app_constants import RANKINGS_TAB_BUNDLE_KEY
+
+    calls: list[int] = []
+    built = {"rankings_sections_top_n": [], "rankings_sections_other": []}
+
+    def build() -> dict:
+        calls.append(1)
+        return built
+
+    rankings.sync_rankings_tab_session_inputs(build)
+    assert not calls
+    assert rankings._session_rankings_bundle() is built
+    assert rankings._session_rankings_bundle() is built
+    assert len(calls) == 1
+    assert streamlit_stub.session_state[RANKINGS_TAB_BUNDLE_KEY] is built
+
+
 def test_sync_maintenance_tab_session_inputs_sets_sync_dict(streamlit_stub) -> None:
     maint = importlib.import_module("explorer.app.streamlit.maintenance_streamlit_html")
     from explorer.app.streamlit.app_constants import MAINTENANCE_TAB_SYNC_KEY
@@ -695,3 +714,30 @@ def test_sidebar_footer_links_shows_update_notice_when_remote_newer(
     combined = " ".join(str(c[0][0]) for c in streamlit_stub.sidebar.markdown_calls)
     assert "New version available" in combined
     assert "2099-12-31" in combined
+
+
+def test_maintenance_year_rows_builder_runs_once(streamlit_stub) -> None:
+    maint = importlib.import_module("explorer.app.streamlit.maintenance_streamlit_html")
+
+    calls: list[int] = []
+
+    def build() -> dict:
+        calls.append(1)
+        return {2024: [("L1",)]}
+
+    data = {"incomplete_by_year": build, "sex_notation_by_year": lambda: None}
+    assert maint._resolved_year_rows(data, "incomplete_by_year") == {2024: [("L1",)]}
+    assert maint._resolved_year_rows(data, "incomplete_by_year") == {2024: [("L1",)]}
+    assert len(calls) == 1
+    assert maint._resolved_year_rows(data, "sex_notation_by_year") == {}
+
+
+@pytest.mark.parametrize(("value", "expected"), ((None, 0), ("0", 0), ("junk", 0), ("1.5", 1536 * 1024)))
+def test_result_cache_is_opt_in(streamlit_stub, monkeypatch, value, expected: int) -> None:
+    caches = importlib.import_module("explorer.app.streamlit.app_caches")
+    streamlit_stub.secrets = {}
+    if value is None:
+        monkeypatch.delenv(caches.RESULT_CACHE_MB_ENV_KEY, raising=False)
+    else:
+        monkeypatch.setenv(caches.RESULT_CACHE_MB_ENV_KEY, value)
+    assert caches.result_cache_max_bytes() == expected
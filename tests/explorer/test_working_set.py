@@ -1,12 +1,15 @@
 """Tests for explorer.core.working_set (refs #66)."""
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
 import pandas as pd
+import pytest
 from whoosh.index import create_in
 
 from explorer.core.species_search import species_whoosh_schema
-from explorer.core.working_set import WorkingSet, rebuild_working_set_from_date_filter
+from explorer.core.working_set import WorkingSet, WorkingSetEngine, rebuild_working_set_from_date_filter
 
 
 def _minimal_df():
@@ -172,3 +175,69 @@ def test_records_by_loc_full_respects_location_ids_with_checklists():
     assert ws.total_checklists_full == 4
     assert ws.total_individuals_full == 7
     assert ws.total_species_full == 2
+
+
+def test_engine_date_slices_match_boolean_mask():
+    df_full = _minimal_df()
+    df_full.loc[1, "Date"] = pd.NaT
+    lids = set(df_full["Location ID"].unique())
+    engine = WorkingSetEngine(df_full, lids)
+    for start, end in [
+        ("2024-01-10", "2024-03-01"),
+        ("2024-03-02", "2024-07-31"),
+        ("2024-08-01", "2024-08-01"),
+        ("2023-01-01", "2023-12-31"),
+        ("2000-01-01", "2030-01-01"),
+    ]:
+        ws = rebuild_working_set_from_date_filter(
+            df_full, lids, filter_by_date=True, filter_start_date=start, filter_end_date=end, engine=engine
+        )
+        mask = (df_full["Date"] >= start) & (df_full["Date"] <= end)
+        pd.testing.assert_frame_equal(ws.df, df_full[mask])
+        assert sorted(ws.records_by_loc) == sorted(df_full[mask]["Location ID"].unique())
+        assert ws.total_checklists == df_full[mask]["Submission ID"].nunique()
+        assert ws.total_checklists_full == 4
+        assert set(ws.records_by_loc_full) == {"L1", "L2"}
+
+
+def test_engine_memoises_working_set_per_range():
+    df_full = _minimal_df()
+    engine = WorkingSetEngine(df_full, {"L1", "L2"}, max_cached=2)
+    a = engine.working_set(filter_by_date=False)
+    assert engine.working_set(filter_by_date=False) is a
+    b = rebuild_working_set_from_date_filter(
+        df_full, filter_by_date=True, filter_start_date="2024-01-01", filter_end_date="2024-06-30",
+        engine=engine,
+    )
+    assert len(b.df) == 3
+    rebuild_working_set_from_date_filter(
+        df_full, filter_by_date=True, filter_start_date="2024-07-01", filter_end_date="2024-12-31",
+        engine=engine,
+    )
+    # Oldest entry (all-time) evicted; the most recent two are kept.
+    assert engine.working_set(filter_by_date=False) is not a
+
+
+def test_rebuild_requires_location_ids_without_engine():
+    with pytest.raises(ValueError):
+        rebuild_working_set_from_date_filter(
+            _minimal_df(), filter_by_date=False, filter_start_date="", filter_end_date=""
+        )
+
+
+def test_engine_shared_across_threads():
+    """Concurrent sessions share one engine: memo eviction and lazy indexes must not race."""
+    engine = WorkingSetEngine(_minimal_df(), {"L1", "L2"}, max_cached=1)
+    ranges = [(datetime(2024, m, 1), datetime(2024, m + 4, 28)) for m in range(1, 9)]
+
+    def pick(i):
+        start, end = ranges[i % len(ranges)]
+        ws = engine.working_set(filter_by_date=True, start=start, end=end)
+        return len(ws.df), ws.total_checklists
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(pick, range(400)))
+    for i, (n_rows, n_checklists) in enumerate(results):
+        start, end = ranges[i % len(ranges)]
+        dates = _minimal_df()["Date"]
+        assert n_rows == n_checklists == int(((dates >= start) & (dates <= end)).sum())